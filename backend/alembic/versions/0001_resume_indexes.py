@@ -0,0 +1,26 @@
+"""Index the resume columns used by the hot queries
+
+Resumes are looked up by job (matching, candidate lists) and by uploader;
+without these indexes both are full table scans. Tables created fresh by
+create_all already carry them, hence if_not_exists.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_resume_job_id", "resume", ["job_id"], if_not_exists=True)
+    op.create_index("ix_resume_uploaded_by", "resume", ["uploaded_by"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resume_uploaded_by", table_name="resume", if_exists=True)
+    op.drop_index("ix_resume_job_id", table_name="resume", if_exists=True)
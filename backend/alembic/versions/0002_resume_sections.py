@@ -0,0 +1,30 @@
+"""Store the sectioned resume text on the resume row
+
+Uploads now split the extracted text into sections once
+(app/services/sections.py) and keep the result for the improved resume and
+later re-analysis. Rows from before this revision get it on first use.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    columns = {c["name"] for c in sa.inspect(op.get_bind()).get_columns("resume")}
+    # Tables created fresh by create_all already have it
+    if "sections" not in columns:
+        with op.batch_alter_table("resume") as batch:
+            batch.add_column(sa.Column("sections", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("resume") as batch:
+        batch.drop_column("sections")
@@ -0,0 +1,74 @@
+"""Move extracted resume text into a compressed, deduplicated blob table
+
+Resume rows keep only ``text_digest``; the text is stored once per distinct
+digest in ``text_blob`` (app/services/text_store.py). Existing text is
+moved over in batches. SQLite only returns the freed pages to the OS after
+a ``VACUUM``, which cannot run inside the migration transaction.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+BATCH = 500
+
+
+def upgrade() -> None:
+    from app.services.text_store import TextBlob, put_text
+    from sqlmodel import Session
+
+    bind = op.get_bind()
+    TextBlob.__table__.create(bind, checkfirst=True)
+    columns = {c["name"] for c in sa.inspect(bind).get_columns("resume")}
+    if "text" not in columns:
+        return  # the deployed schema never stored text on the row
+
+    if "text_digest" not in columns:
+        with op.batch_alter_table("resume") as batch:
+            batch.add_column(sa.Column("text_digest", sa.String(), nullable=True))
+
+    resume = sa.table("resume", sa.column("id", sa.Integer), sa.column("text", sa.Text),
+                      sa.column("text_digest", sa.String))
+    session = Session(bind=bind)
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(resume.c.id, resume.c.text).where(resume.c.id > last_id).order_by(resume.c.id).limit(BATCH)
+        ).all()
+        if not rows:
+            break
+        for resume_id, text in rows:
+            digest = put_text(session, text or "")
+            bind.execute(resume.update().where(resume.c.id == resume_id).values(text_digest=digest))
+        session.flush()
+        last_id = rows[-1][0]
+
+    with op.batch_alter_table("resume") as batch:
+        batch.drop_column("text")
+    op.create_index("ix_resume_text_digest", "resume", ["text_digest"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    columns = {c["name"] for c in sa.inspect(bind).get_columns("resume")}
+    if "text_digest" in columns:
+        from app.services.text_store import decode
+
+        with op.batch_alter_table("resume") as batch:
+            batch.add_column(sa.Column("text", sa.Text(), nullable=False, server_default=""))
+        blobs = sa.table("text_blob", sa.column("digest", sa.String), sa.column("codec", sa.String),
+                         sa.column("data", sa.LargeBinary))
+        resume = sa.table("resume", sa.column("text", sa.Text), sa.column("text_digest", sa.String))
+        for digest, codec, data in bind.execute(sa.select(blobs.c.digest, blobs.c.codec, blobs.c.data)):
+            bind.execute(resume.update().where(resume.c.text_digest == digest).values(text=decode(codec, data)))
+        op.drop_index("ix_resume_text_digest", table_name="resume", if_exists=True)
+        with op.batch_alter_table("resume") as batch:
+            batch.drop_column("text_digest")
+    op.drop_table("text_blob")
@@ -0,0 +1,81 @@
+"""Point parse cache entries at the text blob table
+
+``parsed_resume`` rows kept a full copy of the parsed text next to the one
+in ``text_blob``. They now store ``text_digest`` only. Existing entries are
+moved over in batches, like the resume rows in 0003.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+BATCH = 500
+
+
+def upgrade() -> None:
+    from app.services.text_store import put_text
+    from sqlmodel import Session
+
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    # The cache table is created by create_all; databases that never ran the app have none
+    if not inspector.has_table("parsed_resume"):
+        return
+    columns = {c["name"] for c in inspector.get_columns("parsed_resume")}
+    if "text" not in columns:
+        return
+
+    if "text_digest" not in columns:
+        with op.batch_alter_table("parsed_resume") as batch:
+            batch.add_column(sa.Column("text_digest", sa.String(), nullable=True))
+
+    parsed = sa.table("parsed_resume", sa.column("key", sa.String), sa.column("text", sa.Text),
+                      sa.column("text_digest", sa.String))
+    session = Session(bind=bind)
+    last_key = ""
+    while True:
+        rows = bind.execute(
+            sa.select(parsed.c.key, parsed.c.text).where(parsed.c.key > last_key).order_by(parsed.c.key).limit(BATCH)
+        ).all()
+        if not rows:
+            break
+        for key, text in rows:
+            digest = put_text(session, text or "")
+            bind.execute(parsed.update().where(parsed.c.key == key).values(text_digest=digest))
+        session.flush()
+        last_key = rows[-1][0]
+
+    with op.batch_alter_table("parsed_resume") as batch:
+        batch.alter_column("text_digest", existing_type=sa.String(), nullable=False)
+        batch.drop_column("text")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if not inspector.has_table("parsed_resume"):
+        return
+    if "text_digest" not in {c["name"] for c in inspector.get_columns("parsed_resume")}:
+        return
+    from app.services.text_store import decode
+
+    with op.batch_alter_table("parsed_resume") as batch:
+        batch.add_column(sa.Column("text", sa.Text(), nullable=False, server_default=""))
+    blobs = sa.table("text_blob", sa.column("digest", sa.String), sa.column("codec", sa.String),
+                     sa.column("data", sa.LargeBinary))
+    parsed = sa.table("parsed_resume", sa.column("text", sa.Text), sa.column("text_digest", sa.String))
+    rows = bind.execute(
+        sa.select(blobs.c.digest, blobs.c.codec, blobs.c.data)
+        .where(blobs.c.digest.in_(sa.select(parsed.c.text_digest)))
+    )
+    for digest, codec, data in rows:
+        bind.execute(parsed.update().where(parsed.c.text_digest == digest).values(text=decode(codec, data)))
+    with op.batch_alter_table("parsed_resume") as batch:
+        batch.drop_column("text_digest")
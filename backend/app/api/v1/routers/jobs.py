@@ -1,11 +1,14 @@
 # app/api/v1/routers/jobs.py
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from typing import List, Optional
 from sqlmodel import Session, select
-import json
-from app.db.models import Job
+from app.core.config import settings
+from app.db.models import Job, Resume
 from app.db.session import get_session, engine
+from app.services.skill_index import job_skill_index
+from app.services.candidates import top_candidates, with_resumes
+from app.services.catalog_cache import CatalogCache, cached_json
 
 router = APIRouter()
 
@@ -19,8 +22,8 @@ class JobRead(BaseModel):
     title: str
     skills: List[str]
     requirements: List[str]
-    demand: str
-    avg_salary: str
+    demand: Optional[str] = None
+    avg_salary: Optional[str] = None
     description: str
 
     class Config:
@@ -29,31 +32,55 @@ class JobRead(BaseModel):
 # -------------------------
 # GET jobs with optional filtering
 # -------------------------
+def load_catalog(session: Session) -> List[dict]:
+    # A new catalog version may come from another worker: refresh the skill index too
+    job_skill_index.load(session)
+    jobs = []
+    for job in session.exec(select(Job).order_by(Job.id)).all():
+        # Serialize once per catalog version; skills and requirements are JSON columns
+        jobs.append(JobRead(
+            id=job.id,
+            title=job.title,
+            skills=job.required_skills or [],
+            requirements=job.requirements or [],
+            demand=job.demand,
+            avg_salary=job.avg_salary,
+            description=job.description,
+        ).model_dump())
+    return jobs
+
+catalog = CatalogCache(engine, load_catalog)
+
 @router.get("/", response_model=List[JobRead])
 def get_jobs(
+    request: Request,
     skip: int = 0,
     limit: int = 50,
-    skill: Optional[str] = Query(None, description="Filter jobs by skill")
+    skill: Optional[List[str]] = Query(None, description="Filter jobs by skill (repeatable)"),
+    mode: str = Query("all", pattern="^(all|any)$", description="Match all or any of the skills"),
 ):
     try:
-        with Session(engine) as session:
-            jobs_query = select(Job).offset(skip).limit(limit)
-            jobs = session.exec(jobs_query).all()
-
-            # Convert JSON strings to Python lists
-            for job in jobs:
-                job.skills = json.loads(job.skills)
-                job.requirements = json.loads(job.requirements)
-
-            # Filter by skill if provided
-            if skill:
-                filtered = [
-                    job for job in jobs
-                    if skill.lower() in [s.lower() for s in job.skills]
-                ]
-                return filtered
-
-            return jobs
+        snapshot = catalog.get()
+        if skill:
+            # Paginate over the skill index so skip/limit apply to matches
+            _, page_ids = job_skill_index.query(skill, mode, skip, limit)
+        else:
+            page_ids = snapshot.ids[skip:skip + limit]
+        return cached_json(request, snapshot, lambda: snapshot.body(page_ids))
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch jobs: {str(e)}")
+
+# -------------------------
+# GET best stored candidates for a job
+# -------------------------
+@router.get("/{job_id}/candidates")
+def get_job_candidates(
+    job_id: int,
+    top_k: int = Query(10, ge=1, le=settings.MAX_CANDIDATES),
+    session: Session = Depends(get_session),
+):
+    job = catalog.get().jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return with_resumes(session, Resume, top_candidates(session, job["skills"], top_k))
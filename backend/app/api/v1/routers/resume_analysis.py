@@ -1,9 +1,23 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, UploadFile, File, HTTPException, Query
+from starlette.concurrency import run_in_threadpool
 from sqlmodel import Session, select
+from app.core.config import settings
 from app.db.session import engine
 from app.db.models import Resume, Job
-import fitz  # PyMuPDF
-import re
+from typing import List, Optional
+from pathlib import Path
+import asyncio
+from app.services.skill_index import job_skill_index
+from app.services.candidates import index_resume
+from app.services.scoring import get_scoring_engine
+from app.services.relevance import aget_relevance_engine
+from app.services.skill_extractor import get_extractor
+from app.services.parse_cache import parse_cache, cache_key
+from app.services.workers import cpu_pool
+from app.services.uploads import save_upload
+from app.services.pdf_extract import PdfText, extract_pdf, pdf_parser_version
+from app.services.sections import sectionize
+from app.services.text_store import put_text
 
 router = APIRouter()
 
@@ -11,55 +25,140 @@ router = APIRouter()
 # -----------------------------
 # PDF Text Extraction
 # -----------------------------
-def extract_text_from_pdf(file: UploadFile) -> str:
-    text = ""
-    # Read PDF with PyMuPDF
-    with fitz.open(stream=file.file.read(), filetype="pdf") as doc:
-        for page in doc:
-            text += page.get_text("text")
-    return text
+PARSER_VERSION = pdf_parser_version()
+
+def extract_text_from_pdf(path: Path, digest: str) -> str:
+    key = cache_key(digest, PARSER_VERSION)
+    return parse_cache.get_or_parse(key, lambda: _parse_pdf_file(path))
+
+async def extract_text_from_pdf_async(path: Path, digest: str):
+    """Returns (cache key, text); PyMuPDF only runs, in the worker pool, on a cache miss."""
+    key = cache_key(digest, PARSER_VERSION)
+    return key, await parse_cache.aget_or_parse(key, lambda: cpu_pool.run(_parse_pdf_file, path))
+
+def _parse_pdf_file(path: Path) -> PdfText:
+    # Configured backend chain (PyMuPDF first by default), straight from disk;
+    # truncated text is returned but not cached
+    return extract_pdf(path)
 
 
 # -----------------------------
-# Resume Analysis Endpoint
+# Resume Analysis Endpoints
 # -----------------------------
-@router.post("/analyze_resume/")
-async def analyze_resume(file: UploadFile = File(...)):
+def _check_pdf(file: UploadFile) -> None:
     if not file.filename.endswith(".pdf"):
         raise HTTPException(status_code=400, detail="Only PDF files are supported.")
 
-    # Extract and clean text
-    text = extract_text_from_pdf(file)
-    clean_text = re.sub(r"\s+", " ", text.lower())
+async def _extract(file: UploadFile):
+    # Stream to disk, then extract text (cached by content hash)
+    stored = await save_upload(file)
+    return await extract_text_from_pdf_async(stored.path, stored.digest)
 
-    # Fetch all jobs from DB
+async def _engines():
+    """Skill index and BM25 engine for the current catalog; the scoring engine
+    covers every job the BM25 engine knows, including jobs without skills."""
     with Session(engine) as session:
-        jobs = session.exec(select(Job)).all()
+        job_skill_index.ensure_loaded(session)
+    # After a catalog change the BM25 engine is rebuilt in the threadpool
+    relevance_engine = await aget_relevance_engine(Job)
+    return get_scoring_engine(relevance_engine.job_ids), relevance_engine
 
+def _match_results(session: Session, ranked) -> list:
+    ids = [r.job_id for r in ranked]
+    jobs = {job.id: job for job in session.exec(select(Job).where(Job.id.in_(ids))).all()} if ids else {}
     match_results = []
-    for job in jobs:
-        required_skills = job.required_skills or []
-        match_count = sum(1 for skill in required_skills if skill.lower() in clean_text)
-        score = round((match_count / len(required_skills)) * 100, 2) if required_skills else 0
-
+    for r in ranked:
+        job = jobs.get(r.job_id)
+        if job is None:
+            continue
         match_results.append({
             "job_title": job.title,
-            "match_score": score,
-            "skills_matched": match_count,
-            "total_skills": len(required_skills),
+            "match_score": r.score,
+            "relevance_score": r.relevance,
+            "skills_matched": r.matched,
+            "total_skills": r.total,
             "demand": getattr(job, "demand", None),       # Added job demand
             "avg_salary": getattr(job, "avg_salary", None) # Added average salary
         })
+    return match_results
 
-    # Save resume with match results
+def _save_resume(session: Session, filename: str, text: str, skills: List[str], match_results: list) -> Resume:
+    """Add the resume and its resume_skill rows (from the skills already found); the caller commits."""
     resume = Resume(
-        filename=file.filename,
-        text=text,
-        match_result={"results": match_results}
+        filename=filename,
+        text_digest=put_text(session, text),
+        match_result={"results": match_results},
+        sections=sectionize(text).to_dict(),
     )
+    session.add(resume)
+    session.flush()  # assigns the id
+    index_resume(session, resume.id, skills)
+    return resume
+
+
+@router.post("/analyze_resume/")
+async def analyze_resume(
+    file: UploadFile = File(...),
+    top_k: Optional[int] = Query(None, ge=1, description="Return only the best K jobs"),
+):
+    _check_pdf(file)
+    key, text = await _extract(file)
+    scoring, relevance_engine = await _engines()
+    # Extraction, scoring and the commit are blocking work: keep them off the event loop
+    match_results = await run_in_threadpool(_analyze_one, file.filename, key, text, scoring, relevance_engine, top_k)
+    return {"message": "Resume analyzed successfully", "results": match_results}
+
+
+def _analyze_one(filename: str, key: str, text: str, scoring, relevance_engine, top_k: Optional[int]) -> list:
     with Session(engine) as session:
-        session.add(resume)
+        # Detect every known skill in one pass (cached with the text)
+        found = parse_cache.skills_for(key, text, get_extractor())
+
+        # Score skills and description/requirements text against every job at once, best matches first
+        relevance = relevance_engine.relative_scores(text, scoring.job_ids)
+        ranked = scoring.rank(found, top_k=top_k, relevance=relevance)
+        match_results = _match_results(session, ranked)
+
+        # Save resume with match results
+        _save_resume(session, filename, text, found, match_results)
         session.commit()
-        session.refresh(resume)
+    return match_results
 
-    return {"message": "Resume analyzed successfully", "results": match_results}
+
+@router.post("/analyze_resumes/")
+async def analyze_resumes(
+    files: List[UploadFile] = File(...),
+    top_k: Optional[int] = Query(10, ge=1, description="Best K jobs per resume"),
+):
+    """Rank several resumes against the whole catalog; the skill scores of all of them are
+    computed together (``ScoringEngine.rank_batch``)."""
+    if len(files) > settings.MAX_BATCH_FILES:
+        raise HTTPException(status_code=413, detail=f"At most {settings.MAX_BATCH_FILES} files per batch")
+    for file in files:
+        _check_pdf(file)
+    extracted = await asyncio.gather(*(_extract(file) for file in files))
+    scoring, relevance_engine = await _engines()
+    match_results = await run_in_threadpool(
+        _analyze_many, [file.filename for file in files], extracted, scoring, relevance_engine, top_k
+    )
+
+    return {
+        "message": f"{len(files)} resumes analyzed successfully",
+        "results": [
+            {"filename": file.filename, "results": results} for file, results in zip(files, match_results)
+        ],
+    }
+
+
+def _analyze_many(filenames: List[str], extracted, scoring, relevance_engine, top_k: Optional[int]) -> List[list]:
+    with Session(engine) as session:
+        extractor = get_extractor()
+        found = [parse_cache.skills_for(key, text, extractor) for key, text in extracted]
+        relevance = [relevance_engine.relative_scores(text, scoring.job_ids) for _, text in extracted]
+        ranked = scoring.rank_batch(found, top_k=top_k, relevance=relevance)
+        match_results = [_match_results(session, r) for r in ranked]
+
+        for filename, (_, text), skills, results in zip(filenames, extracted, found, match_results):
+            _save_resume(session, filename, text, skills, results)
+        session.commit()
+    return match_results
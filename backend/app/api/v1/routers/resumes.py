@@ -1,17 +1,29 @@
-from fastapi import APIRouter, UploadFile, File, Form, Depends, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, UploadFile, File, Form, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pathlib import Path
 from sqlmodel import Session, select
-from typing import Optional, List
-import aiofiles
+from typing import Optional, List, Tuple, Union
+import asyncio
 import json
-from tempfile import NamedTemporaryFile
 
 from app.db.models import Resume, Job
-from app.db.session import get_session
+from app.db.session import get_session, engine
 from app.core.config import settings
-from app.services.parsing import parse_resume_file
+from app.services.parsing import parse_resume_file, parse_resume_file_async
+from app.services.task_queue import enqueue, get_task, task_handler
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, project, keyset_select, fetch_page, stream_ndjson
+from app.services.workers import cpu_pool
+from app.services.uploads import StoredUpload, save_upload, save_archive, extract_archive, is_zip_upload
+from app.services.storage import content_key, get_store
 from app.services.matching import match_skills
+from app.services.candidates import index_resume, resume_skills
+from app.services.relevance import arelevance_for, blend, relevance_for
+from app.services.render_cache import download_response, rendered
+from app.services.improve import generate_improved_resume
+from app.services.sections import ResumeSections, sectionize
+from app.services.text_store import get_text, put_text, text_digest, with_text
+from app.services import metrics
 
 router = APIRouter(prefix="/resumes", tags=["resumes"])
 
@@ -19,185 +31,312 @@ router = APIRouter(prefix="/resumes", tags=["resumes"])
 # 1️⃣ UPLOAD + ANALYZE RESUME
 # -----------------------------------------------------
 @router.post("/upload")
+@metrics.track_uploads("v1_upload")
 async def upload_and_analyze(
     job_id: int = Form(...),
     uploaded_by: Optional[str] = Form(None),
     file: UploadFile = File(...),
+    background: bool = Query(False, description="Queue the analysis and return 202 with a task id"),
     session: Session = Depends(get_session),
 ):
 
-    # Validate allowed file types
-    if not file.filename.lower().endswith((".txt", ".pdf", ".doc", ".docx")):
-        raise HTTPException(status_code=400, detail="Unsupported file format")
+    # Stream the upload to disk (validates type and size, hashes on the fly)
+    with metrics.stage("store"):
+        stored = await save_upload(file)
 
-    # Ensure upload directory exists
-    upload_dir = Path(settings.UPLOAD_DIR)
-    upload_dir.mkdir(parents=True, exist_ok=True)
+    # Fetch job by ID
+    job = session.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
 
-    # Save uploaded file
-    file_path = upload_dir / file.filename
-    async with aiofiles.open(file_path, "wb") as f:
-        await f.write(await file.read())
+    if background:
+        task = enqueue("analyze_upload", {**stored._asdict(), "path": stored.key, "job_id": job.id, "uploaded_by": uploaded_by})
+        return JSONResponse(status_code=202, content={
+            "message": "Resume queued for analysis",
+            "task_id": task.id,
+            "status": task.status,
+            "status_url": f"{router.prefix}/tasks/{task.id}",
+        })
 
-    # Parse resume text
+    resume, recommendation_item, resume_text = await _analyze_stored(stored, job, uploaded_by)
+
+    # Compressing the text and finding its skills are CPU work, the commit may wait on the lock
+    with metrics.stage("commit", stored.kind):
+        await run_in_threadpool(_commit_resume, session, resume, resume_text)
+
+    return _upload_response(resume, job, recommendation_item)
+
+async def _analyze_stored(stored: StoredUpload, job: Job, uploaded_by: Optional[str]):
+    """Parse, match and improve one stored upload; returns an unsaved Resume, its recommendation and the text."""
+    # Parse resume text in the worker pool
     try:
-        resume_text = parse_resume_file(file_path)
+        with metrics.stage("parse", stored.kind):
+            resume_text = await parse_resume_file_async(stored.path, stored.digest)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Resume parsing failed: {str(e)}")
 
-    # Fetch job by ID
-    job = session.get(Job, job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-
     # Match skills
     try:
-        match_result = match_skills(job.skills, resume_text)
+        with metrics.stage("match", stored.kind):
+            match_result = await cpu_pool.run(match_skills, job.required_skills or [], resume_text)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Skill matching error: {str(e)}")
 
-    # Generate improved resume
-    improved_resume = generate_improved_resume(
-        resume_text,
-        job.title,
-        match_result.get("missing_skills", [])
-    )
+    # BM25 relevance to the job's description and requirements (rebuilds run in the threadpool)
+    with metrics.stage("relevance", stored.kind):
+        relevance = await arelevance_for(Job, resume_text, job.id)
+
+    return _build_resume(stored, job, uploaded_by, resume_text, match_result, relevance)
+
+def _build_resume(
+    stored: StoredUpload, job: Job, uploaded_by: Optional[str], resume_text: str, match_result: dict, relevance: float
+):
+    # Blend skill overlap with BM25 relevance
+    match_result["relevance_score"] = relevance
+    match_result["overall_score"] = round(blend(match_result.get("score", 0), relevance), 2)
+
+    # Section the text once; the improved resume and later readers reuse it
+    with metrics.stage("improve", stored.kind):
+        sections = sectionize(resume_text)
+        improved_resume = generate_improved_resume(
+            resume_text,
+            job.title,
+            match_result.get("missing_skills", []),
+            sections,
+        )
 
-    # Save resume record to DB
     resume = Resume(
-        filename=file.filename,
-        text=resume_text,
+        filename=stored.filename,
+        text_digest=text_digest(resume_text),
         uploaded_by=uploaded_by,
         match_result=match_result,
         improved_resume=improved_resume,
-        job_id=job.id
+        sections=sections.to_dict(),
+        job_id=job.id,
+        file_path=stored.key
     )
 
-    session.add(resume)
-    session.commit()
-    session.refresh(resume)
-
     # Prepare frontend recommendation object
     recommendation_item = {
         "title": job.title,
         "match_percent": match_result.get("match_percent", 0),
+        "relevance_score": match_result["relevance_score"],
+        "overall_score": match_result["overall_score"],
         "matched_skills": match_result.get("matched_skills", []),
         "missing_skills": match_result.get("missing_skills", []),
     }
+    return resume, recommendation_item, resume_text
+
+def _save_resume(session: Session, resume: Resume, resume_text: str) -> None:
+    """Add a new resume, its text blob and resume_skill rows (for /jobs/{id}/candidates); the caller commits."""
+    put_text(session, resume_text)  # no-op when this text is stored already
+    session.add(resume)
+    session.flush()  # assigns the id
+    index_resume(session, resume.id, resume_skills(session, resume_text))
 
+def _commit_resume(session: Session, resume: Resume, resume_text: str) -> None:
+    _save_resume(session, resume, resume_text)
+    session.commit()
+    session.refresh(resume)
+
+def _upload_response(resume: Resume, job: Job, recommendation_item: dict) -> dict:
     return {
         "message": "Resume analyzed successfully",
         "resume_id": resume.id,
         "job_id": job.id,
         "recommendations": [recommendation_item],
-        "improved_resume": improved_resume
+        "improved_resume": resume.improved_resume
     }
 
+@task_handler("analyze_upload")
+def analyze_upload_task(payload: dict) -> dict:
+    """Queue worker version of upload_and_analyze; runs in the worker process."""
+    # The worker may run on another host; the store hands back a local copy
+    path = get_store().local_path(content_key(payload["digest"], payload["kind"]))
+    stored = StoredUpload(path, payload["digest"], payload["size"], payload["kind"], payload["filename"])
+    resume_text = parse_resume_file(stored.path, stored.digest)
+    with Session(engine) as session:
+        job = session.get(Job, payload["job_id"])
+        if not job:
+            raise ValueError(f"Job {payload['job_id']} not found")
+        match_result = match_skills(job.required_skills or [], resume_text)
+        relevance = relevance_for(session, Job, resume_text, job.id)
+        resume, recommendation_item, resume_text = _build_resume(
+            stored, job, payload.get("uploaded_by"), resume_text, match_result, relevance
+        )
+        _commit_resume(session, resume, resume_text)
+        return _upload_response(resume, job, recommendation_item)
+
+# -----------------------------------------------------
+# 1️⃣a TASK STATUS (background uploads)
+# -----------------------------------------------------
+@router.get("/tasks/{task_id}")
+def get_task_status(task_id: str):
+    task = get_task(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task.to_status()
+
+# -----------------------------------------------------
+# 1️⃣b BATCH UPLOAD (many files or one zip) → NDJSON
+# -----------------------------------------------------
+@router.post("/batch")
+@metrics.track_uploads("v1_batch")
+async def upload_batch(
+    job_id: int = Form(...),
+    uploaded_by: Optional[str] = Form(None),
+    files: List[UploadFile] = File(...),
+    session: Session = Depends(get_session),
+):
+    job = session.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if len(files) > settings.MAX_BATCH_FILES:
+        raise HTTPException(status_code=413, detail=f"At most {settings.MAX_BATCH_FILES} files per batch")
+
+    # Store everything first; per-file problems become error lines, not a failed batch
+    items: List[Union[StoredUpload, Tuple[str, str]]] = []
+    for f in files:
+        try:
+            if is_zip_upload(f):
+                archive = await save_archive(f)
+                try:
+                    items.extend(await run_in_threadpool(extract_archive, archive))
+                finally:
+                    archive.unlink(missing_ok=True)
+            else:
+                items.append(await save_upload(f))
+        except HTTPException as e:
+            items.append((f.filename, e.detail))
+
+    return StreamingResponse(_batch_results(items, job, uploaded_by), media_type="application/x-ndjson")
+
+async def _batch_results(items, job: Job, uploaded_by: Optional[str]):
+    """Analyze stored uploads in parallel and yield one JSON line per file as it finishes."""
+    # Keep this batch within the worker pool's capacity so it never trips the 503 guard itself
+    slots = asyncio.Semaphore(max(1, cpu_pool.max_workers))
+
+    async def process(stored: StoredUpload):
+        async with slots:
+            try:
+                return stored, await _analyze_stored(stored, job, uploaded_by)
+            except HTTPException as e:
+                return stored, e
+
+    for name, error in (i for i in items if not isinstance(i, StoredUpload)):
+        yield _ndjson({"filename": name, "status": "error", "detail": error})
+
+    tasks = [asyncio.create_task(process(i)) for i in items if isinstance(i, StoredUpload)]
+    pending = 0
+    # A fresh session: the request-scoped one may be closed while the response streams
+    with Session(engine) as db:
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                stored, outcome = await next_done
+                if isinstance(outcome, HTTPException):
+                    yield _ndjson({"filename": stored.filename, "status": "error", "detail": outcome.detail})
+                    continue
+                resume, recommendation_item, resume_text = outcome
+                # Off the event loop, like the single upload; rows are committed in chunks
+                await run_in_threadpool(_save_resume, db, resume, resume_text)
+                pending += 1
+                if pending >= settings.BATCH_COMMIT_SIZE:
+                    await run_in_threadpool(db.commit)
+                    pending = 0
+                yield _ndjson({
+                    "filename": stored.filename,
+                    "status": "ok",
+                    "resume_id": resume.id,
+                    "recommendations": [recommendation_item],
+                })
+            await run_in_threadpool(db.commit)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+def _ndjson(obj) -> bytes:
+    return (json.dumps(obj) + "\n").encode("utf-8")
+
 # -----------------------------------------------------
 # 2️⃣ GET ALL RESUMES
 # -----------------------------------------------------
-@router.get("/", response_model=List[Resume])
-async def get_resumes(session: Session = Depends(get_session)):
-    resumes = session.exec(select(Resume)).all()
-    for r in resumes:
-        if isinstance(r.match_result, str):
-            r.match_result = json.loads(r.match_result)
+@router.get("/")
+def get_resumes(
+    response: Response,
+    after_id: Optional[int] = Query(None, description="Cursor: id of the last resume of the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    include: Optional[List[str]] = Query(None, description="Large columns to include: text, improved_resume, sections"),
+    stream: bool = Query(False, description="Stream every row after the cursor as NDJSON"),
+    session: Session = Depends(get_session),
+):
+    columns = project(Resume, include)
+    # Text comes from the blob table, one query per page or streamed batch
+    hydrate = with_text if include and "text" in include else None
+    if stream:
+        return StreamingResponse(
+            stream_ndjson(engine, keyset_select(Resume, columns, after_id), transform=hydrate),
+            media_type="application/x-ndjson",
+        )
+
+    resumes, next_cursor = fetch_page(session, Resume, columns, after_id, limit)
+    if hydrate is not None:
+        hydrate(session, resumes)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
     return resumes
 
 # -----------------------------------------------------
 # 3️⃣ GET SINGLE RESUME
 # -----------------------------------------------------
-@router.get("/{resume_id}", response_model=Resume)
+@router.get("/{resume_id}")
 async def get_resume(resume_id: int, session: Session = Depends(get_session)):
     resume = session.get(Resume, resume_id)
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
     if isinstance(resume.match_result, str):
         resume.match_result = json.loads(resume.match_result)
-    return resume
+    return {**resume.dict(), "text": get_text(session, resume.text_digest)}
 
 # -----------------------------------------------------
-# 4️⃣ DOWNLOAD IMPROVED RESUME
+# 3️⃣a RESUME SECTIONS
 # -----------------------------------------------------
-@router.get("/download/{resume_id}")
-def download_improved_resume(resume_id: int, session: Session = Depends(get_session)):
+@router.get("/{resume_id}/sections")
+def get_resume_sections(resume_id: int, session: Session = Depends(get_session)):
     resume = session.get(Resume, resume_id)
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
-    if not getattr(resume, "improved_resume", None):
-        raise HTTPException(status_code=404, detail="Improved resume not found")
-
-    temp_file = NamedTemporaryFile(delete=False, suffix=".txt")
-    temp_file.write(resume.improved_resume.encode("utf-8"))
-    temp_file.flush()
-    temp_file.close()
-
-    return FileResponse(
-        temp_file.name,
-        media_type="text/plain",
-        filename=f"Improved_{resume.filename}"
-    )
+    sections = ResumeSections.from_dict(resume.sections)
+    if sections is None:
+        # Stored before sectioning existed, or by an older SECTIONS_VERSION
+        sections = sectionize(get_text(session, resume.text_digest))
+        resume.sections = sections.to_dict()
+        session.add(resume)
+        session.commit()
+    return sections.to_dict()
 
 # -----------------------------------------------------
-# 5️⃣ HELPER FUNCTIONS FOR IMPROVED RESUME
+# 4️⃣ DOWNLOAD IMPROVED RESUME
 # -----------------------------------------------------
-def generate_improved_resume(original_text: str, job_title: str, missing_skills: List[str]):
-    lines = [l.strip() for l in original_text.split("\n") if l.strip()]
-    skills_section = [l for l in lines if "skill" in l.lower()]
-    improved = f"""
-=====================================================
-        IMPROVED RESUME — Optimized for {job_title}
-=====================================================
-
-📌 PROFESSIONAL SUMMARY
-Highly motivated candidate applying for the role of {job_title}.
-Enhanced readability, aligns skills with job requirements.
-
-📌 KEY SKILLS & COMPETENCIES
-Core Skills:
-{format_bullets(skills_section)}
-
-Added Missing Skills:
-{format_bullets(missing_skills if missing_skills else ['No missing skills — excellent match!'])}
-
-📌 PROFESSIONAL EXPERIENCE
-{rewrite_experience(lines)}
-
-📌 EDUCATION
-{extract_education(lines)}
-
-📌 NOTES
-- ATS-friendly formatting
-- Structured for recruiter readability
-
-=====================================================
-                 END OF IMPROVED RESUME
-=====================================================
-"""
-    return improved.strip()
-
-def format_bullets(items):
-    if not items:
-        return "  • No data found"
-    return "\n".join([f"  • {i}" for i in items])
-
-def rewrite_experience(lines):
-    exp = []
-    keywords = ["experience", "responsibility", "developed", "managed", "project", "intern"]
-    for line in lines:
-        if any(k in line.lower() for k in keywords):
-            cleaned = line.replace("-", "").strip()
-            exp.append(f"  • {rewrite_sentence(cleaned)}")
-    return "\n".join(exp) if exp else "  • No experience details detected."
-
-def rewrite_sentence(sentence):
-    verbs = ["Developed", "Implemented", "Led", "Improved", "Managed", "Optimized", "Enhanced"]
-    if not sentence:
-        return ""
-    words = sentence.split()
-    verb = verbs[len(sentence) % len(verbs)]
-    return verb + " " + " ".join(words[1:])
-
-def extract_education(lines):
-    edu = [f"  • {line.strip()}" for line in lines if any(x in line.lower() for x in ["bachelor", "master", "degree"])]
-    return "\n".join(edu) if edu else "  • No education details detected."
+@router.get("/download/{resume_id}")
+async def download_improved_resume(
+    resume_id: int,
+    request: Request,
+    format: str = Query("txt", pattern="^(txt|docx|pdf)$"),
+):
+    # Only the two columns needed; the render cache is keyed by a hash of the text
+    with Session(engine) as session:
+        row = session.exec(
+            select(Resume.filename, Resume.improved_resume).where(Resume.id == resume_id)
+        ).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    filename, improved_resume = row
+    if not improved_resume:
+        raise HTTPException(status_code=404, detail="Improved resume not found")
+
+    entry = await rendered(resume_id, improved_resume, format)
+    return download_response(request, entry, f"Improved_{Path(filename).stem}.{format}")
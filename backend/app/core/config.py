@@ -1,12 +1,101 @@
 # skillmatcher/core/config.py
 from pydantic_settings import BaseSettings
 from pathlib import Path
+from typing import Dict
 
 class Settings(BaseSettings):
     APP_NAME: str = "Skillmatcher"
     DATABASE_URL: str = "sqlite:///./skillmatcher.db"
+    DB_ECHO: bool = False
+    # Connection pool (ignored for in-memory SQLite)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    # SQLite tuning, applied on every new connection
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE_KB: int = 64 * 1024
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
     UPLOAD_DIR: str = str(Path(__file__).resolve().parents[2] / "uploads")
     MATCH_THRESHOLD: int = 75
+    # Minimum trigram (Dice) similarity for a misspelled word to count as a skill
+    FUZZY_SKILL_THRESHOLD: float = 0.75
+    # Per-skill weights when ranking jobs, e.g. SKILL_WEIGHTS='{"python": 2, "excel": 0.5}'; others weigh 1
+    SKILL_WEIGHTS: Dict[str, float] = {}
+    # Share of the overall match score that comes from BM25 text relevance (0 = skills only)
+    RELEVANCE_WEIGHT: float = 0.3
+    BM25_K1: float = 1.2
+    BM25_B: float = 0.75
+    PARSE_CACHE_SIZE: int = 512
+    # Compression for stored resume text (services/text_store.py): zstd if installed, else zlib
+    TEXT_CODEC: str = "zstd"
+    # How often a process re-checks the catalog version written by other processes
+    CATALOG_REFRESH_SECONDS: float = 5.0
+    # How often /jobs/{id}/candidates pulls in resumes indexed by other processes
+    CANDIDATE_REFRESH_SECONDS: float = 2.0
+    MAX_CANDIDATES: int = 100
+    PARSE_WORKERS: int = 2
+    PARSE_MAX_PENDING: int = 16
+    PARSE_TIMEOUT: float = 30.0
+    # PDF extraction: backend fallback chain, page cap and per-document deadline (seconds)
+    PDF_BACKENDS: str = "pymupdf,pypdf2,pdfplumber"
+    PDF_MAX_PAGES: int = 50
+    PDF_DEADLINE: float = 20.0
+    PDF_PAGE_WORKERS: int = 2
+    PDF_PARALLEL_MIN_PAGES: int = 16
+    # Profiling: requests slower than PROFILE_SLOW_SECONDS get a sampled profile (0 = off; when on,
+    # every thread is sampled while requests are in flight); a request whose X-Profile-Token
+    # header equals PROFILE_TOKEN is profiled in depth, one at a time
+    PROFILE_DIR: str = str(Path(__file__).resolve().parents[2] / "profiles")
+    PROFILE_SLOW_SECONDS: float = 0.0
+    PROFILE_SAMPLE_INTERVAL: float = 0.01
+    PROFILE_DEEP_INTERVAL: float = 0.001
+    PROFILE_BUFFER_SAMPLES: int = 50000
+    PROFILE_MAX_FILES: int = 200
+    PROFILE_TOP_FUNCTIONS: int = 60
+    PROFILE_TOKEN: str = ""
+    # Rendered improved-resume downloads (TXT/DOCX/PDF) kept in memory
+    RENDER_CACHE_BYTES: int = 64 * 1024 * 1024
+    MAX_UPLOAD_BYTES: int = 10 * 1024 * 1024
+    UPLOAD_CHUNK_SIZE: int = 64 * 1024
+    # Upload storage (services/storage.py): "local" keeps files in UPLOAD_DIR, "s3" in S3_BUCKET
+    # (S3_ENDPOINT_URL for MinIO and other S3-compatible stores) with UPLOAD_DIR as a local cache.
+    # Unreferenced files older than the grace period are deleted every STORAGE_GC_INTERVAL s (0 = off)
+    STORAGE_BACKEND: str = "local"
+    S3_BUCKET: str = ""
+    S3_PREFIX: str = "uploads"
+    S3_ENDPOINT_URL: str = ""
+    STORAGE_GC_INTERVAL: float = 3600.0
+    STORAGE_GC_GRACE_SECONDS: float = 86400.0
+    MAX_BATCH_FILES: int = 500
+    MAX_BATCH_BYTES: int = 200 * 1024 * 1024
+    BATCH_COMMIT_SIZE: int = 50
+    # Bulk job import: records per upsert batch; ADMIN_TOKEN guards /admin (empty = disabled)
+    IMPORT_BATCH_SIZE: int = 5000
+    ADMIN_TOKEN: str = ""
+    # Admission control for uploads: per-client token buckets (requests/s, burst) for each lane,
+    # global caps on admitted requests and buffered bytes; interactive requests wait up to ADMISSION_WAIT s
+    ADMISSION_ENABLED: bool = True
+    # Comma-separated proxy addresses whose X-API-Key / X-Forwarded-For identify the client (else the peer address does)
+    ADMISSION_TRUSTED_PROXIES: str = ""
+    ADMISSION_PATHS: str = "/resumes/upload,/resumes/batch,/resume/analyze_resume,/resume/analyze_resumes"
+    ADMISSION_BULK_PATHS: str = "/resumes/batch,/resume/analyze_resumes"
+    ADMISSION_RATE: float = 1.0
+    ADMISSION_BURST: float = 10
+    ADMISSION_BULK_RATE: float = 0.1
+    ADMISSION_BULK_BURST: float = 2
+    ADMISSION_MAX_IN_FLIGHT: int = 8
+    ADMISSION_BULK_SLOTS: int = 2
+    ADMISSION_MAX_BYTES: int = 256 * 1024 * 1024
+    ADMISSION_WAIT: float = 0.5
+    ADMISSION_RETRY_AFTER: float = 2.0
+    TASK_WORKERS: int = 2
+    TASK_POLL_INTERVAL: float = 1.0
+    TASK_VISIBILITY_TIMEOUT: float = 120.0
+    TASK_MAX_ATTEMPTS: int = 3
+    TASK_RETRY_BACKOFF: float = 2.0
 
     class Config:
         env_file = str(Path(__file__).resolve().parents[2] / ".env")
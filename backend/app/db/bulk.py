@@ -0,0 +1,79 @@
+# skillmatcher/db/bulk.py
+"""Set-based writes that would otherwise be one ORM round trip per row."""
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from sqlalchemy import insert
+from sqlmodel import Session
+
+UPSERT_CHUNK = 500
+
+
+def _chunks(rows: List[Dict], size: int) -> Iterable[List[Dict]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def insert_many(session: Session, table, columns: Sequence[str], rows: List[Tuple]) -> int:
+    """Plain multi-row insert of positional ``rows`` straight through the driver's executemany.
+
+    For narrow, high-volume tables where SQLAlchemy's per-row parameter
+    processing costs more than the insert itself. The caller commits.
+    """
+    if not rows:
+        return 0
+    conn = session.connection()
+    compiled = insert(table).values({c: None for c in columns}).compile(dialect=conn.dialect)
+    if not compiled.positional:
+        rows = [dict(zip(columns, row)) for row in rows]
+    conn.exec_driver_sql(compiled.string, rows)
+    return len(rows)
+
+
+def _default(model, name: str):
+    """The value a row that leaves out ``name`` gets: the model field's default, else None."""
+    field = model.model_fields.get(name)
+    if field is None or field.is_required():
+        return None
+    return field.get_default(call_default_factory=True)
+
+
+def upsert(session: Session, model, rows: Iterable[Dict], keys: Sequence[str] = ("id",), update: bool = True) -> int:
+    """Insert ``rows`` into ``model``'s table, updating rows whose ``keys`` already exist.
+
+    With ``update=False`` existing rows are left as they are (insert-or-ignore).
+    Rows may leave out columns that others set: every row is filled out to the
+    columns any row sets, with the model's field defaults (None where there is
+    none), which are then also written on update. Columns no row sets are left
+    as they are.
+
+    Uses ``INSERT ... ON CONFLICT DO UPDATE`` on SQLite and PostgreSQL and
+    falls back to ``session.merge`` elsewhere. Returns the number of rows
+    written; the caller commits.
+    """
+    rows = list(rows)
+    if not rows:
+        return 0
+    names = list(dict.fromkeys(name for row in rows for name in row))
+    if any(len(row) != len(names) for row in rows):
+        rows = [{name: row[name] if name in row else _default(model, name) for name in names} for row in rows]
+    table = model.__table__
+    dialect = session.get_bind().dialect.name
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        for row in rows:
+            if update or session.get(model, tuple(row[k] for k in keys)) is None:
+                session.merge(model(**row))
+        return len(rows)
+
+    columns = [c for c in names if c not in keys] if update else []
+    for chunk in _chunks(rows, UPSERT_CHUNK):
+        stmt = insert(table)
+        if columns:
+            stmt = stmt.on_conflict_do_update(index_elements=list(keys), set_={c: stmt.excluded[c] for c in columns})
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=list(keys))
+        session.execute(stmt, chunk)
+    return len(rows)
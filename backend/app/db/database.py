@@ -1,11 +1,7 @@
 # backend/app/db/database.py
-from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from core.config import settings  # Import the cleaned config
+from app.db.session import engine  # Shared, tuned engine (see app/db/session.py)
 
-engine = create_engine(
-    settings.DATABASE_URL, connect_args={"check_same_thread": False}
-)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
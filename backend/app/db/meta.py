@@ -0,0 +1,27 @@
+# skillmatcher/db/meta.py
+"""Small key/value table for application bookkeeping (catalog version, seed hash, ...)."""
+from typing import Optional
+
+from sqlmodel import SQLModel, Field, Session
+
+
+class AppMeta(SQLModel, table=True):
+    __tablename__ = "app_meta"
+
+    key: str = Field(primary_key=True)
+    value: str
+
+
+def get_meta(session: Session, key: str, default: Optional[str] = None) -> Optional[str]:
+    row = session.get(AppMeta, key)
+    return row.value if row is not None else default
+
+
+def set_meta(session: Session, key: str, value: str) -> None:
+    """Stage an upsert; the caller commits."""
+    row = session.get(AppMeta, key)
+    if row is None:
+        session.add(AppMeta(key=key, value=value))
+    else:
+        row.value = value
+        session.add(row)
@@ -14,9 +14,15 @@ class Job(SQLModel, table=True):
 class Resume(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     filename: str
-    text: str
-    uploaded_by: Optional[str] = None
+    # Extracted text lives once per distinct text in text_blob (services/text_store.py)
+    text_digest: Optional[str] = Field(default=None, index=True)
+    uploaded_by: Optional[str] = Field(default=None, index=True)
+    job_id: Optional[int] = Field(default=None, index=True)
+    file_path: Optional[str] = None
     match_result: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
+    improved_resume: Optional[str] = None
+    # Sectioned text (services/sections.py), computed once at upload
+    sections: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
 
 class User(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
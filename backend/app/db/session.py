@@ -1,11 +1,49 @@
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
 from sqlmodel import create_engine, SQLModel, Session
 from app.core.config import settings
 
-# Engine — uses DATABASE_URL from settings
-engine = create_engine(settings.DATABASE_URL, echo=False)
+def build_engine(url: str = None) -> Engine:
+    """The one engine factory: pooling for every backend, WAL + pragmas for SQLite."""
+    url = make_url(url or settings.DATABASE_URL)
+    kwargs = {"echo": settings.DB_ECHO, "pool_pre_ping": True}
+
+    if url.get_backend_name() == "sqlite":
+        # Connections are shared across threadpool workers; the busy timeout
+        # makes writers wait for the lock instead of failing straight away
+        kwargs["connect_args"] = {"check_same_thread": False, "timeout": settings.SQLITE_BUSY_TIMEOUT_MS / 1000}
+        if url.database not in (None, "", ":memory:"):
+            kwargs.update(pool_size=settings.DB_POOL_SIZE, max_overflow=settings.DB_MAX_OVERFLOW,
+                          pool_timeout=settings.DB_POOL_TIMEOUT)
+    else:
+        kwargs.update(pool_size=settings.DB_POOL_SIZE, max_overflow=settings.DB_MAX_OVERFLOW,
+                      pool_timeout=settings.DB_POOL_TIMEOUT, pool_recycle=settings.DB_POOL_RECYCLE)
+
+    new_engine = create_engine(url, **kwargs)
+    if url.get_backend_name() == "sqlite":
+        event.listen(new_engine, "connect", _set_sqlite_pragmas)
+    return new_engine
+
+def _set_sqlite_pragmas(dbapi_connection, _record) -> None:
+    cursor = dbapi_connection.cursor()
+    # WAL lets readers and the single writer proceed concurrently
+    cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    # Negative cache_size is in KiB rather than pages
+    cursor.execute(f"PRAGMA cache_size={-int(settings.SQLITE_CACHE_SIZE_KB)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+# Engine — uses DATABASE_URL from settings; shared by every router and service
+engine = build_engine()
 
 def create_db_and_tables() -> None:
     """Create all tables defined in SQLModel models."""
+    # Service-owned tables register with the metadata when their module is imported
+    from app.db import meta  # noqa: F401
+    from app.services import candidates, parse_cache, skill_index, task_queue, text_store  # noqa: F401
     SQLModel.metadata.create_all(engine)
 
 def get_session():
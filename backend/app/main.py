@@ -1,11 +1,36 @@
-from fastapi import FastAPI, HTTPException, Query, APIRouter, Depends, UploadFile, File, Form
+from fastapi import FastAPI, HTTPException, Query, APIRouter, Depends, UploadFile, File, Form, Header, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from sqlmodel import SQLModel, Field, Session, create_engine, select
-from typing import List, Optional, Generator
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from sqlmodel import SQLModel, Field, Session, select
+from dataclasses import asdict
+from typing import List, Optional, Generator, Tuple, Union
 from pathlib import Path
+import asyncio
+import hashlib
+import hmac
 import json
 import logging
-import shutil
+
+from app.db.bulk import upsert
+from app.db.meta import get_meta, set_meta
+from app.db.session import engine
+from app.core.config import settings
+from app.services.skill_index import job_skill_index, index_jobs, backfill, normalize_skill, decode_skills
+from app.services.candidates import index_resume, sync_index, top_candidates, with_resumes
+from app.services.relevance import arelevance_for, blend
+from app.services.sections import ResumeSections, sectionize
+from app.services.improve import build_improved_resume
+from app.services.render_cache import download_response, rendered
+from app.services.job_import import FORMATS, import_stream
+from app.services.skill_extractor import get_extractor
+from app.services.catalog_cache import CatalogCache, bump_catalog_version, cached_json
+from app.services.workers import cpu_pool
+from app.services.task_queue import enqueue, get_task, task_handler
+from app.services import pdf_extract
+from app.services import admission, metrics, profiling, storage
+from app.services.uploads import StoredUpload, extract_archive, is_zip_upload, save_archive, save_upload
+from app.services.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, project, keyset_select, fetch_page, stream_ndjson
 
 
 # -------------------------
@@ -16,8 +41,7 @@ logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 # -------------------------
 # Database setup
 # -------------------------
-DATABASE_URL = "sqlite:///./skillmatcher.db"
-engine = create_engine(DATABASE_URL, echo=False)
+# Shared engine from app/db/session.py (DATABASE_URL, pooling and SQLite pragmas come from settings)
 
 def get_session() -> Generator[Session, None, None]:
     with Session(engine) as session:
@@ -45,35 +69,44 @@ class Job(SQLModel, table=True):
 class Resume(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     filename: str
-    uploaded_by: str
-    job_id: Optional[int] = None
+    uploaded_by: str = Field(index=True)
+    job_id: Optional[int] = Field(default=None, index=True)
     file_path: Optional[str] = None
     match_result: Optional[str] = None
+    sections: Optional[str] = None  # JSON, see services/sections.py
 
 # -------------------------
 # Seed jobs from JSON
 # -------------------------
 DATA_FILE = Path(__file__).parent / "data/jobs.json"
 
+SEED_HASH_KEY = "jobs_seed_sha256"
+
 def seed_default_jobs() -> None:
+    """Upsert the jobs in data/jobs.json; skipped when the file is unchanged since the last seed."""
     if not DATA_FILE.exists():
         logging.warning(f"⚠️ JSON data file not found: {DATA_FILE}")
         return
 
-    with open(DATA_FILE, "r", encoding="utf-8") as f:
-        jobs_list = json.load(f)
-
+    raw = DATA_FILE.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
     with Session(engine) as session:
-        for job_data in jobs_list:
-            existing = session.get(Job, job_data["id"])
-            if not existing:
-                job_data["skills"] = json.dumps(job_data.get("skills", []))
-                job_data["requirements"] = json.dumps(job_data.get("requirements", []))
-                job = Job(**job_data)
-                session.add(job)
-                logging.info(f"✅ Added job: {job.title}")
+        if get_meta(session, SEED_HASH_KEY) == digest:
+            logging.info("🌟 Job seed unchanged, skipping")
+            return
+
+        jobs_list = json.loads(raw)
+        upsert(session, Job, [
+            {**job_data,
+             "skills": json.dumps(job_data.get("skills", [])),
+             "requirements": json.dumps(job_data.get("requirements", []))}
+            for job_data in jobs_list
+        ])
+        index_jobs(session, [(job_data["id"], job_data.get("skills", [])) for job_data in jobs_list])
+        bump_catalog_version(session)
+        set_meta(session, SEED_HASH_KEY, digest)
         session.commit()
-        logging.info("🌟 Job seeding complete!")
+        logging.info(f"🌟 Job seeding complete: {len(jobs_list)} jobs from {DATA_FILE.name}")
 
 # -------------------------
 # FastAPI app setup
@@ -84,7 +117,14 @@ app = FastAPI(
     description="API for job listings, resume uploads, and intelligent skill matching"
 )
 
-# Allow all origins (can restrict later)
+# Middleware added later wraps the earlier ones.
+# Per-client rate limits and global upload capacity, inside the timing middleware so rejections are measured
+admission.install(app)
+# Request/stage/DB timing and the /metrics endpoint
+metrics.install(app, engine)
+# Sampled profiles of slow requests, deep profiles behind X-Profile-Token
+profiling.install(app)
+# Allow all origins (can restrict later); outermost, so 429/503 rejections carry CORS headers too
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -99,8 +139,19 @@ app.add_middleware(
 def on_startup():
     create_db_and_tables()
     seed_default_jobs()
+    with Session(engine) as session:
+        job_skill_index.load(session)
+        backfill(session, session.exec(select(Job.id, Job.skills)).all())
+        sync_index(session, force=True)
+    storage.garbage_collector.start()
     logging.info("🚀 Application startup complete!")
 
+@app.on_event("shutdown")
+def on_shutdown():
+    storage.garbage_collector.stop()
+    cpu_pool.shutdown()
+    pdf_extract.shutdown()
+
 # -------------------------
 # Root endpoint
 # -------------------------
@@ -108,7 +159,7 @@ def on_startup():
 def read_root():
     return {
         "message": "Skillmatcher API is running 🚀",
-        "routes": ["/jobs", "/resumes/upload", "/resumes", "/docs"]
+        "routes": ["/jobs", "/resumes/upload", "/resumes/tasks/{id}", "/resumes/batch", "/resumes", "/resumes/download/{id}", "/docs"]
     }
 
 # ============================================================
@@ -116,28 +167,54 @@ def read_root():
 # ============================================================
 jobs_router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
+def load_catalog(session: Session) -> List[dict]:
+    # A new catalog version may come from another worker: refresh the skill index too
+    job_skill_index.load(session)
+    return [job.model_dump() for job in session.exec(select(Job).order_by(Job.id))]
+
+catalog = CatalogCache(engine, load_catalog)
+
 @jobs_router.get("/", response_model=List[Job])
-def get_jobs(skip: int = 0, limit: int = 50, session: Session = Depends(get_session)):
-    jobs = session.exec(select(Job).offset(skip).limit(limit)).all()
-    logging.info(f"Fetched {len(jobs)} jobs from DB")
-    return jobs
+def get_jobs(request: Request, skip: int = 0, limit: int = 50):
+    snapshot = catalog.get()
+    page_ids = snapshot.ids[skip:skip + limit]
+    logging.info(f"Fetched {len(page_ids)} jobs from catalog v{snapshot.version}")
+    return cached_json(request, snapshot, lambda: snapshot.body(page_ids))
+
+@jobs_router.get("/filter", response_model=List[Job])
+def filter_jobs(
+    request: Request,
+    skill: List[str] = Query(..., description="Repeat to combine several skills"),
+    mode: str = Query("all", pattern="^(all|any)$", description="Match all or any of the skills"),
+    skip: int = 0,
+    limit: int = 50,
+):
+    # Resolve matching ids from the skill index, then serve that page from the catalog snapshot
+    snapshot = catalog.get()
+    total, page_ids = job_skill_index.query(skill, mode, skip, limit)
+    logging.info(f"Filtered jobs by skills {skill} ({mode}): {total} found")
+    return cached_json(request, snapshot, lambda: snapshot.body(page_ids), {"X-Total-Count": str(total)})
 
 @jobs_router.get("/{job_id}", response_model=Job)
-def get_job(job_id: int, session: Session = Depends(get_session)):
-    job = session.get(Job, job_id)
-    if not job:
+def get_job(job_id: int, request: Request):
+    snapshot = catalog.get()
+    if job_id not in snapshot.blobs:
         raise HTTPException(status_code=404, detail="Job not found")
-    return job
+    return cached_json(request, snapshot, lambda: snapshot.blobs[job_id])
 
-@jobs_router.get("/filter", response_model=List[Job])
-def filter_jobs(skill: str = Query(...), session: Session = Depends(get_session)):
-    jobs = session.exec(select(Job)).all()
-    filtered = [
-        job for job in jobs
-        if skill.lower() in [s.lower() for s in json.loads(job.skills)]
-    ]
-    logging.info(f"Filtered jobs by skill '{skill}': {len(filtered)} found")
-    return filtered
+@jobs_router.get("/{job_id}/candidates")
+def get_job_candidates(
+    job_id: int,
+    top_k: int = Query(10, ge=1, le=settings.MAX_CANDIDATES),
+    session: Session = Depends(get_session),
+):
+    """Stored resumes that best fit a job, from the resume-skill index."""
+    job = catalog.get().jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    candidates = top_candidates(session, decode_skills(job["skills"]), top_k)
+    logging.info(f"Found {len(candidates)} candidates for job {job_id}")
+    return with_resumes(session, Resume, candidates)
 
 app.include_router(jobs_router)
 
@@ -157,59 +234,89 @@ app.include_router(users_router)
 # ============================================================
 resumes_router = APIRouter(prefix="/resumes", tags=["Resumes"])
 
-UPLOAD_DIR = Path(__file__).parent / "uploads"
-UPLOAD_DIR.mkdir(exist_ok=True)
-
 def extract_skills_from_resume(content: str):
-    """Mock skill extraction from plain text."""
-    common_skills = [
-        "python", "react", "javascript", "sql", "html", "css", "java",
-        "communication", "leadership", "data analysis", "machine learning",
-        "tailwind", "typescript", "redux"
-    ]
-    found = [s for s in common_skills if s.lower() in content.lower()]
-    return list(set(found))
+    """Skill extraction from plain text in a single pass over the catalog vocabulary."""
+    return get_extractor().extract(content)
+
+def skills_and_sections(content: str) -> Tuple[List[str], ResumeSections]:
+    return extract_skills_from_resume(content), sectionize(content)
+
+def read_upload_text(file_path: Path) -> str:
+    """Read file content safely."""
+    try:
+        with storage.open_mmap(file_path) as data:
+            return str(data, "utf-8", "ignore")
+    except Exception as e:
+        logging.warning(f"Could not read resume content: {e}")
+        return ""
 
 @resumes_router.post("/upload")
+@metrics.track_uploads("upload")
 async def upload_resume(
     file: UploadFile = File(...),
     job_id: int = Form(...),
     uploaded_by: str = Form(...),
+    background: bool = Query(False, description="Queue the analysis and return 202 with a task id"),
     session: Session = Depends(get_session)
 ):
-    file_path = UPLOAD_DIR / file.filename
-
-    # Save uploaded file
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-
-    # Read file content safely
-    content = ""
-    try:
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-            content = f.read()
-    except Exception as e:
-        logging.warning(f"Could not read resume content: {e}")
-
-    # Extract resume skills
-    resume_skills = extract_skills_from_resume(content)
+    # Stream the upload into the content-addressed store, then read it back off the event loop
+    with metrics.stage("store"):
+        stored = await save_upload(file)
 
     # Fetch job details
     job = session.get(Job, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    job_skills = json.loads(job.skills)
-    matched = [s for s in job_skills if s.lower() in [r.lower() for r in resume_skills]]
-    missing = [s for s in job_skills if s.lower() not in [r.lower() for r in resume_skills]]
+    if background:
+        # Picked up by `python -m app.worker` (see analyze_upload_task)
+        task = enqueue("analyze_upload", {**stored._asdict(), "path": stored.key, "job_id": job.id, "uploaded_by": uploaded_by})
+        return JSONResponse(status_code=202, content={
+            "message": "📥 Resume queued for analysis",
+            "task_id": task.id,
+            "status": task.status,
+            "status_url": f"{resumes_router.prefix}/tasks/{task.id}",
+        })
+
+    resume_entry, recommendation, resume_skills = await analyze_upload(stored, job, uploaded_by)
+
+    # Save resume info to DB (the commit may wait on the write lock)
+    with metrics.stage("commit", stored.kind):
+        await run_in_threadpool(commit_resume, session, resume_entry, resume_skills)
+
+    return {
+        "message": "✅ Resume uploaded successfully!",
+        "recommendations": [recommendation]
+    }
 
-    # Calculate match percentage
-    match_percent = round((len(matched) / len(job_skills)) * 100, 2) if job_skills else 0
+async def analyze_upload(stored: StoredUpload, job: Job, uploaded_by: str):
+    """Read, section and match one stored upload; returns the unsaved Resume, its recommendation and skills."""
+    kind = stored.kind
+    with metrics.stage("parse", kind):
+        content = await run_in_threadpool(read_upload_text, stored.path)
+
+    # Extract resume skills and split the text into sections, once (CPU work, off the event loop)
+    with metrics.stage("extract", kind):
+        resume_skills, sections = await run_in_threadpool(skills_and_sections, content)
+
+    with metrics.stage("match", kind):
+        job_skills = json.loads(job.skills)
+        found = set(resume_skills)
+        matched = [s for s in job_skills if normalize_skill(s) in found]
+        missing = [s for s in job_skills if normalize_skill(s) not in found]
+
+        # Calculate match percentage
+        match_percent = round((len(matched) / len(job_skills)) * 100, 2) if job_skills else 0
+        # BM25 relevance of the whole resume to the job's description and requirements
+        # (a rebuild after a catalog change runs in the threadpool)
+        relevance = await arelevance_for(Job, content, job.id)
 
     # Recommendations format
     recommendation = {
         "title": job.title,
         "match_percent": match_percent,
+        "relevance_score": relevance,
+        "overall_score": round(blend(match_percent, relevance), 2),
         "matched_skills": matched,
         "missing_skills": missing
     }
@@ -223,27 +330,256 @@ async def upload_resume(
         ],
     }
 
-    # Save resume info to DB
     resume_entry = Resume(
-        filename=file.filename,
+        filename=stored.filename,
         uploaded_by=uploaded_by,
-        job_id=job_id,
-        file_path=str(file_path),
-        match_result=json.dumps(match_result)
+        job_id=job.id,
+        file_path=stored.key,
+        match_result=json.dumps(match_result),
+        sections=json.dumps(sections.to_dict()),
     )
+    return resume_entry, recommendation, resume_skills
 
+def save_resume(session: Session, resume_entry: Resume, resume_skills) -> None:
+    """Add a resume row and make it findable from /jobs/{id}/candidates; the caller commits."""
     session.add(resume_entry)
+    session.flush()
+    index_resume(session, resume_entry.id, resume_skills)
+
+def commit_resume(session: Session, resume_entry: Resume, resume_skills) -> None:
+    save_resume(session, resume_entry, resume_skills)
     session.commit()
     session.refresh(resume_entry)
 
-    return {
-        "message": "✅ Resume uploaded successfully!",
-        "recommendations": [recommendation]
-    }
+@task_handler("analyze_upload")
+def analyze_upload_task(payload: dict) -> dict:
+    """Queue worker version of upload_resume; runs in the worker process (`python -m app.worker --api main`)."""
+    # The worker may run on another host; the store hands back a local copy
+    store = storage.get_store()
+    path = store.local_path(storage.content_key(payload["digest"], payload["kind"]))
+    stored = StoredUpload(path, payload["digest"], payload["size"], payload["kind"], payload["filename"])
+    with Session(engine) as session:
+        job = session.get(Job, payload["job_id"])
+        if not job:
+            raise ValueError(f"Job {payload['job_id']} not found")
+        # The worker skips on_startup; the extractor's vocabulary comes from this index
+        job_skill_index.ensure_loaded(session)
+        # Same analysis as the request path; the worker has no event loop of its own
+        resume_entry, recommendation, resume_skills = asyncio.run(analyze_upload(stored, job, payload["uploaded_by"]))
+        commit_resume(session, resume_entry, resume_skills)
+        return {
+            "message": "✅ Resume uploaded successfully!",
+            "resume_id": resume_entry.id,
+            "recommendations": [recommendation],
+        }
+
+@resumes_router.get("/tasks/{task_id}")
+def get_task_status(task_id: str):
+    """Status of a background upload, with the upload response as ``result`` once done."""
+    task = get_task(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task.to_status()
+
+@resumes_router.post("/batch")
+@metrics.track_uploads("batch")
+async def upload_batch(
+    files: List[UploadFile] = File(...),
+    job_id: int = Form(...),
+    uploaded_by: str = Form(...),
+    session: Session = Depends(get_session),
+):
+    """Upload many resumes (or one zip of them) for a job; one NDJSON line per file as it finishes."""
+    job = session.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if len(files) > settings.MAX_BATCH_FILES:
+        raise HTTPException(status_code=413, detail=f"At most {settings.MAX_BATCH_FILES} files per batch")
+
+    # Store everything first; per-file problems become error lines, not a failed batch
+    items: List[Union[StoredUpload, Tuple[str, str]]] = []
+    for f in files:
+        try:
+            if is_zip_upload(f):
+                archive = await save_archive(f)
+                try:
+                    items.extend(await run_in_threadpool(extract_archive, archive))
+                finally:
+                    archive.unlink(missing_ok=True)
+            else:
+                items.append(await save_upload(f))
+        except HTTPException as e:
+            items.append((f.filename, e.detail))
+
+    logging.info(f"📦 Batch upload for job {job_id}: {len(items)} files")
+    return StreamingResponse(batch_results(items, job, uploaded_by), media_type="application/x-ndjson")
+
+async def batch_results(items, job: Job, uploaded_by: str):
+    """Analyze stored uploads concurrently and yield one JSON line per file, committing in chunks."""
+    for name, error in (i for i in items if not isinstance(i, StoredUpload)):
+        yield ndjson_line({"filename": name, "status": "error", "detail": error})
+
+    # A fresh session: the request-scoped one is closed while the response streams
+    with Session(engine) as db:
+        async def process(stored: StoredUpload):
+            try:
+                return stored, await analyze_upload(stored, job, uploaded_by)
+            except HTTPException as e:
+                return stored, e
+
+        tasks = [asyncio.create_task(process(i)) for i in items if isinstance(i, StoredUpload)]
+        pending = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                stored, outcome = await next_done
+                if isinstance(outcome, HTTPException):
+                    yield ndjson_line({"filename": stored.filename, "status": "error", "detail": outcome.detail})
+                    continue
+                resume_entry, recommendation, resume_skills = outcome
+                await run_in_threadpool(save_resume, db, resume_entry, resume_skills)
+                pending += 1
+                if pending >= settings.BATCH_COMMIT_SIZE:
+                    await run_in_threadpool(db.commit)
+                    pending = 0
+                yield ndjson_line({
+                    "filename": stored.filename,
+                    "status": "ok",
+                    "resume_id": resume_entry.id,
+                    "recommendations": [recommendation],
+                })
+            await run_in_threadpool(db.commit)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+def ndjson_line(obj) -> bytes:
+    return (json.dumps(obj) + "\n").encode("utf-8")
 
 @resumes_router.get("/")
-def get_resumes(session: Session = Depends(get_session)):
-    resumes = session.exec(select(Resume)).all()
+def get_resumes(
+    response: Response,
+    after_id: Optional[int] = Query(None, description="Cursor: id of the last resume of the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    include: Optional[List[str]] = Query(None, description="Large columns to include"),
+    stream: bool = Query(False, description="Stream every row after the cursor as NDJSON"),
+    session: Session = Depends(get_session),
+):
+    columns = project(Resume, include)
+    if stream:
+        return StreamingResponse(
+            stream_ndjson(engine, keyset_select(Resume, columns, after_id)),
+            media_type="application/x-ndjson",
+        )
+
+    resumes, next_cursor = fetch_page(session, Resume, columns, after_id, limit)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
     return resumes
 
+@resumes_router.get("/download/{resume_id}")
+async def download_improved_resume(
+    resume_id: int,
+    request: Request,
+    format: str = Query("txt", pattern="^(txt|docx|pdf)$"),
+):
+    """The improved resume for the job it was uploaded against, as TXT, DOCX or PDF."""
+    with Session(engine) as session:
+        row = session.exec(
+            select(Resume.filename, Resume.job_id, Resume.file_path, Resume.match_result, Resume.sections)
+            .where(Resume.id == resume_id)
+        ).first()
+        if not row:
+            raise HTTPException(status_code=404, detail="Resume not found")
+        filename, job_id, file_path, match_result, sections = row
+        job = session.get(Job, job_id) if job_id is not None else None
+    if job is None:
+        raise HTTPException(status_code=404, detail="Improved resume not found")
+
+    # Built from the stored sections; the file is only read for rows saved before sectioning.
+    # The render cache is keyed by a hash of the text, so unchanged resumes render once
+    parsed = ResumeSections.from_dict(sections)
+    if parsed is None:
+        if not file_path:
+            raise HTTPException(status_code=404, detail="Improved resume not found")
+        parsed = sectionize(await run_in_threadpool(read_stored_text, file_path))
+    missing = json.loads(match_result).get("missing", []) if match_result else []
+    improved_resume = build_improved_resume(parsed, job.title, missing)
+
+    entry = await rendered(resume_id, improved_resume, format)
+    return download_response(request, entry, f"Improved_{Path(filename).stem}.{format}")
+
+def read_stored_text(file_path: str) -> str:
+    """Text of a stored upload by its ``resume.file_path`` (a storage key, or a path on older rows)."""
+    store = storage.get_store()
+    key = store.key_of(file_path)
+    return read_upload_text(store.local_path(key) if key else Path(file_path))
+
 app.include_router(resumes_router)
+
+# ============================================================
+# ADMIN ROUTER
+# ============================================================
+def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+admin_router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(require_admin)])
+
+@admin_router.post("/jobs/import")
+async def import_jobs(
+    request: Request,
+    format: Optional[str] = Query(None, pattern="^(ndjson|csv)$", description="Default: from Content-Type"),
+    batch_size: Optional[int] = Query(None, ge=1, le=100_000),
+):
+    """Upsert jobs streamed in the request body as NDJSON or CSV (fields as in data/jobs.json).
+
+    Answers in NDJSON while the body is still being read: a "progress" line after every
+    committed batch, then one "done" line with the final report (or an "error" line).
+    """
+    fmt = format or ("csv" if "csv" in request.headers.get("content-type", "") else FORMATS[0])
+    return BodyStreamingResponse(import_progress(request.stream(), fmt, batch_size), media_type="application/x-ndjson")
+
+class BodyStreamingResponse(StreamingResponse):
+    """StreamingResponse for routes that keep reading the request body while they answer.
+
+    The stock one watches ``receive`` for a disconnect while streaming, which would
+    take the remaining body chunks away from the route.
+    """
+    async def __call__(self, scope, receive, send):
+        await self.stream_response(send)
+
+async def import_progress(chunks, fmt: str, batch_size: Optional[int]):
+    events: asyncio.Queue = asyncio.Queue()
+
+    async def progress(report) -> None:
+        await events.put({"status": "progress", **asdict(report)})
+
+    async def run() -> None:
+        try:
+            report = await import_stream(engine, Job, chunks, fmt, batch_size, progress)
+            await events.put({"status": "done", **asdict(report)})
+        except Exception as e:
+            logging.exception(f"❌ Job import failed: {e}")
+            await events.put({"status": "error", "detail": str(e)})
+
+    task = asyncio.create_task(run())
+    try:
+        while True:
+            event = await events.get()
+            yield ndjson_line(event)
+            if event["status"] != "progress":
+                break
+        await task
+    finally:
+        task.cancel()
+
+@admin_router.post("/storage/gc")
+async def collect_upload_garbage(
+    grace_seconds: Optional[float] = Query(None, ge=0, description="Default: STORAGE_GC_GRACE_SECONDS"),
+):
+    """Delete stored uploads that no resume or pending task refers to."""
+    return await run_in_threadpool(storage.collect_garbage, None, grace_seconds)
+
+app.include_router(admin_router)
@@ -0,0 +1,218 @@
+# skillmatcher/services/admission.py
+"""Admission control for the upload and analysis routes.
+
+Every request to an ``ADMISSION_PATHS`` route passes three checks before its
+body is read, so an ingestion spike is turned away at the door instead of
+piling up in the parser pool and behind the SQLite write lock:
+
+* a token bucket per client and lane. The client is the peer address;
+  headers are only believed from a peer in ``ADMISSION_TRUSTED_PROXIES``,
+  which is expected to vouch for ``X-API-Key`` and to append the real client
+  to ``X-Forwarded-For`` (anyone else could pick a fresh identity per
+  request). An empty bucket answers 429;
+* a global cap on requests in flight, of which the bulk lane may only take
+  ``ADMISSION_BULK_SLOTS``, so interactive uploads always find room;
+* a global cap on request bytes being buffered (from Content-Length).
+
+Bulk traffic (``ADMISSION_BULK_PATHS`` or ``X-Priority: bulk``) is rejected
+as soon as it does not fit. Interactive requests may wait up to
+``ADMISSION_WAIT`` seconds for a slot. Over-capacity answers are 503, and
+both 429 and 503 carry Retry-After. Read routes are never gated.
+"""
+from typing import Dict, Optional, Tuple
+import asyncio
+import math
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+from app.services import metrics
+
+INTERACTIVE, BULK = "interactive", "bulk"
+
+ADMITTED = metrics.Gauge("admission_in_flight", "Admitted upload requests in progress", ("lane",))
+REJECTED = metrics.Counter("admission_rejected_total", "Upload requests turned away", ("lane", "reason"))
+
+
+def _paths(value: str) -> Tuple[str, ...]:
+    return tuple(p.strip().rstrip("/") for p in value.split(",") if p.strip())
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def take(self, now: float) -> float:
+        """Take one token; returns 0 on success, else seconds until one is available."""
+        # ``now`` may predate a bucket created just after it was read
+        self.tokens = min(self.burst, self.tokens + max(0.0, now - self.updated) * self.rate)
+        self.updated = max(now, self.updated)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate if self.rate > 0 else 60.0
+
+    def full(self, now: float) -> bool:
+        return self.tokens + (now - self.updated) * self.rate >= self.burst
+
+
+class Rejected(Exception):
+    def __init__(self, status: int, reason: str, retry_after: float):
+        self.status = status
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Buckets and capacity counters; all state is touched only from the event loop."""
+
+    MAX_BUCKETS = 10_000
+
+    def __init__(self):
+        self.paths = _paths(settings.ADMISSION_PATHS)
+        self.bulk_paths = _paths(settings.ADMISSION_BULK_PATHS)
+        self.trusted_proxies = frozenset(p.strip() for p in settings.ADMISSION_TRUSTED_PROXIES.split(",") if p.strip())
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._in_flight = {INTERACTIVE: 0, BULK: 0}
+        self._bytes = 0
+        self._freed: Optional[asyncio.Condition] = None
+
+    # Suffix match, so the routes are gated under whatever prefix their router is mounted at
+    def guards(self, path: str) -> bool:
+        return path.rstrip("/").endswith(self.paths)
+
+    def lane(self, request: Request) -> str:
+        if request.url.path.rstrip("/").endswith(self.bulk_paths) or request.headers.get("x-priority", "").lower() == BULK:
+            return BULK
+        return INTERACTIVE
+
+    def client_key(self, request: Request) -> str:
+        peer = request.client.host if request.client else "unknown"
+        if peer not in self.trusted_proxies:
+            return f"addr:{peer}"
+        key = request.headers.get("x-api-key")
+        if key:
+            return f"key:{key}"
+        # The rightmost hop our proxies did not add; entries left of it are client-supplied
+        hops = [h.strip() for h in request.headers.get("x-forwarded-for", "").split(",") if h.strip()]
+        for hop in reversed(hops):
+            if hop not in self.trusted_proxies:
+                return f"addr:{hop}"
+        return f"addr:{peer}"
+
+    # -------------------------
+    # Checks
+    # -------------------------
+    def _throttle(self, client: str, lane: str) -> None:
+        now = time.monotonic()
+        bucket = self._buckets.get((client, lane))
+        if bucket is None:
+            if len(self._buckets) >= self.MAX_BUCKETS:
+                # Full buckets carry no state worth keeping
+                self._buckets = {k: b for k, b in self._buckets.items() if not b.full(now)}
+            if lane == BULK:
+                bucket = TokenBucket(settings.ADMISSION_BULK_RATE, settings.ADMISSION_BULK_BURST)
+            else:
+                bucket = TokenBucket(settings.ADMISSION_RATE, settings.ADMISSION_BURST)
+            self._buckets[(client, lane)] = bucket
+        wait = bucket.take(now)
+        if wait:
+            raise Rejected(429, "rate_limited", wait)
+
+    def _fits(self, lane: str, size: int) -> Optional[str]:
+        """None if the request fits now, else the reason it does not."""
+        total = self._in_flight[INTERACTIVE] + self._in_flight[BULK]
+        if total >= settings.ADMISSION_MAX_IN_FLIGHT:
+            return "in_flight"
+        if lane == BULK and self._in_flight[BULK] >= settings.ADMISSION_BULK_SLOTS:
+            return "bulk_slots"
+        # One request larger than the byte budget is still let through on an idle server
+        if self._bytes and self._bytes + size > settings.ADMISSION_MAX_BYTES:
+            return "bytes"
+        return None
+
+    async def acquire(self, request: Request) -> Tuple[str, int]:
+        lane = self.lane(request)
+        self._throttle(self.client_key(request), lane)
+        length = request.headers.get("content-length")
+        size = int(length) if length and length.isdigit() else settings.MAX_UPLOAD_BYTES
+
+        reason = self._fits(lane, size)
+        if reason is not None and lane == INTERACTIVE and settings.ADMISSION_WAIT > 0:
+            if self._freed is None:
+                self._freed = asyncio.Condition()
+            deadline = time.monotonic() + settings.ADMISSION_WAIT
+            async with self._freed:
+                while reason is not None and (remaining := deadline - time.monotonic()) > 0:
+                    try:
+                        await asyncio.wait_for(self._freed.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        pass
+                    reason = self._fits(lane, size)
+        if reason is not None:
+            raise Rejected(503, reason, settings.ADMISSION_RETRY_AFTER)
+
+        self._in_flight[lane] += 1
+        self._bytes += size
+        ADMITTED.inc(lane=lane)
+        return lane, size
+
+    async def release(self, lane: str, size: int) -> None:
+        self._in_flight[lane] -= 1
+        self._bytes -= size
+        ADMITTED.dec(lane=lane)
+        if self._freed is not None:
+            async with self._freed:
+                self._freed.notify_all()
+
+    def stats(self) -> dict:
+        return {"in_flight": dict(self._in_flight), "bytes": self._bytes, "clients": len(self._buckets)}
+
+
+controller = AdmissionController()
+
+
+def _rejection(lane: str, e: Rejected) -> JSONResponse:
+    REJECTED.inc(lane=lane, reason=e.reason)
+    detail = "Too many uploads from this client" if e.status == 429 else "Server is busy with uploads, please retry shortly."
+    return JSONResponse(
+        status_code=e.status,
+        content={"detail": detail, "reason": e.reason},
+        headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))},
+    )
+
+
+class AdmissionMiddleware:
+    """Plain ASGI middleware: other routes pass through without a Request or an extra task, and
+    admitted responses (including streamed batch NDJSON) keep their slot until fully sent."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or not controller.guards(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+        request = Request(scope)
+        try:
+            lane, size = await controller.acquire(request)
+        except Rejected as e:
+            await _rejection(controller.lane(request), e)(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            await controller.release(lane, size)
+
+
+def install(app: FastAPI) -> None:
+    """Gate the ADMISSION_PATHS routes of ``app``. Call before adding CORSMiddleware, so the
+    rejections it answers itself still carry CORS headers."""
+    if settings.ADMISSION_ENABLED:
+        app.add_middleware(AdmissionMiddleware)
@@ -0,0 +1,128 @@
+# skillmatcher/services/candidates.py
+"""Reverse matching: the stored resumes that best fit a job.
+
+Every saved resume gets its detected skills written to ``resume_skill`` in
+the same transaction, and added to the in-process ``resume_skill_index`` once
+that transaction commits.
+A query only counts the resumes found in the posting lists of the job's
+skills (with their aliases) and keeps the best ``top_k`` in a bounded heap,
+so its cost follows how many resumes share a skill with the job, not the
+total number stored. Resumes saved by other processes (e.g. queue workers)
+are picked up by a periodic catch-up read of new ``resume_skill`` rows.
+"""
+from threading import Lock
+from typing import Iterable, List, NamedTuple, Tuple
+import logging
+import time
+
+from sqlmodel import SQLModel, Field, Session, select, delete
+
+from app.core.config import settings
+from app.services.pagination import keyset_select, project
+from app.services.skill_extractor import get_extractor
+from app.services.skill_index import SkillIndex, job_skill_index, normalize_skill, on_commit
+
+log = logging.getLogger(__name__)
+
+# Ids below the high-water mark re-read on catch-up, for out-of-order commits
+CATCH_UP_OVERLAP = 256
+
+
+class ResumeSkill(SQLModel, table=True):
+    __tablename__ = "resume_skill"
+
+    resume_id: int = Field(primary_key=True)
+    skill: str = Field(primary_key=True, index=True)
+
+
+class Candidate(NamedTuple):
+    resume_id: int
+    match_percent: float
+    matched_skills: List[str]
+
+
+resume_skill_index = SkillIndex(ResumeSkill.resume_id, ResumeSkill.skill)
+
+_sync_lock = Lock()
+_synced_at = 0.0
+
+
+def sync_index(session: Session, force: bool = False) -> None:
+    """Load the index on first use, then pull in other processes' inserts now and then."""
+    global _synced_at
+    now = time.monotonic()
+    if not force and resume_skill_index.loaded and now - _synced_at < settings.CANDIDATE_REFRESH_SECONDS:
+        return
+    with _sync_lock:
+        added = resume_skill_index.catch_up(session, CATCH_UP_OVERLAP)
+        _synced_at = now
+    if added:
+        log.info("Resume skill index caught up with %d resumes", added)
+
+
+# -------------------------
+# Write path
+# -------------------------
+def resume_skills(session: Session, text: str) -> List[str]:
+    """Catalog skills (and their equivalents) found in a resume's text."""
+    # Queue workers never load the catalog otherwise
+    job_skill_index.ensure_loaded(session)
+    return get_extractor().extract(text or "")
+
+
+def index_resume(session: Session, resume_id: int, skills: Iterable[str]) -> None:
+    """Stage the resume_skill rows for a flushed resume; the in-process index follows on commit."""
+    skills = sorted({n for n in map(normalize_skill, skills) if n})
+    session.exec(delete(ResumeSkill).where(ResumeSkill.resume_id == resume_id))
+    for skill in skills:
+        session.add(ResumeSkill(resume_id=resume_id, skill=skill))
+    on_commit(session, lambda: resume_skill_index.add(resume_id, skills))
+
+
+def backfill_resumes(session: Session, resumes: Iterable[Tuple[int, str]]) -> int:
+    """Index (resume_id, text) pairs missing from resume_skill; returns count added."""
+    indexed = set(session.exec(select(ResumeSkill.resume_id).distinct()).all())
+    added = 0
+    for resume_id, text in resumes:
+        if resume_id not in indexed and text:
+            index_resume(session, resume_id, resume_skills(session, text))
+            added += 1
+    if added:
+        session.commit()
+        log.info("Backfilled resume skill index for %d resumes", added)
+    return added
+
+
+# -------------------------
+# Query
+# -------------------------
+def top_candidates(session: Session, job_skills: List[str], top_k: int) -> List[Candidate]:
+    """The ``top_k`` indexed resumes covering most of ``job_skills``, best first."""
+    sync_index(session)
+    job_skills = [s for s in job_skills if normalize_skill(s)]
+    if not job_skills:
+        return []
+    vocabulary = get_extractor().vocabulary
+    groups = [vocabulary.equivalents(s) if vocabulary else (normalize_skill(s),) for s in job_skills]
+
+    candidates = []
+    for resume_id, _ in resume_skill_index.rank(groups, top_k):
+        have = set(resume_skill_index.skills_for(resume_id))
+        matched = [s for s, group in zip(job_skills, groups) if have.intersection(group)]
+        percent = round(len(matched) / len(job_skills) * 100, 2)
+        candidates.append(Candidate(resume_id, percent, matched))
+    return candidates
+
+
+def with_resumes(session: Session, model, candidates: List[Candidate]) -> List[dict]:
+    """Join ranked candidates with their resume rows (light columns only), keeping the order."""
+    ids = [c.resume_id for c in candidates]
+    if not ids:
+        return []
+    stmt = keyset_select(model, project(model)).where(model.id.in_(ids))
+    rows = {row["id"]: dict(row) for row in session.execute(stmt).mappings()}
+    return [
+        {**rows[c.resume_id], "match_percent": c.match_percent, "matched_skills": c.matched_skills}
+        for c in candidates
+        if c.resume_id in rows
+    ]
@@ -0,0 +1,111 @@
+# skillmatcher/services/catalog_cache.py
+"""Versioned in-process snapshot of the job catalog.
+
+The catalog changes rarely, so each process keeps the decoded jobs and their
+pre-serialized JSON bytes in memory, tagged with the catalog version stored
+in ``app_meta``. Writers call ``bump_catalog_version`` in the same
+transaction as their change; the local snapshot is dropped once that
+transaction commits and other processes notice the new version on their next
+periodic check. Endpoints use
+the version as an ETag and answer ``If-None-Match`` with 304.
+"""
+from threading import Lock
+from typing import Callable, Dict, List, NamedTuple, Optional
+import json
+import time
+
+from fastapi import Request, Response
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.db.meta import get_meta, set_meta
+from app.services.skill_index import on_commit
+
+CATALOG_VERSION_KEY = "catalog_version"
+
+_caches: List["CatalogCache"] = []
+
+
+class CatalogSnapshot(NamedTuple):
+    version: int
+    ids: List[int]  # in catalog (id) order
+    jobs: Dict[int, dict]
+    blobs: Dict[int, bytes]  # serialized job JSON
+
+    @property
+    def etag(self) -> str:
+        return f'W/"catalog-{self.version}"'
+
+    def body(self, ids: List[int]) -> bytes:
+        return b"[" + b",".join(self.blobs[i] for i in ids if i in self.blobs) + b"]"
+
+
+def read_catalog_version(session: Session) -> int:
+    return int(get_meta(session, CATALOG_VERSION_KEY, "0"))
+
+
+def bump_catalog_version(session: Session) -> int:
+    """Stage a version increment alongside a catalog write; local snapshots are dropped on commit."""
+    version = read_catalog_version(session) + 1
+    set_meta(session, CATALOG_VERSION_KEY, str(version))
+    # Dropping them now would let a request reload the old catalog before the commit
+    # and keep it for CATALOG_REFRESH_SECONDS; a rollback keeps them
+    on_commit(session, _invalidate_all)
+    return version
+
+
+def _invalidate_all() -> None:
+    for cache in _caches:
+        cache.invalidate()
+
+
+class CatalogCache:
+    def __init__(self, engine: Engine, loader: Callable[[Session], List[dict]]):
+        """``loader`` returns every job as a JSON-ready dict with an ``id`` key."""
+        self.engine = engine
+        self.loader = loader
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._checked_at = 0.0
+        self._lock = Lock()
+        _caches.append(self)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._snapshot = None
+
+    def get(self) -> CatalogSnapshot:
+        snapshot = self._snapshot
+        now = time.monotonic()
+        if snapshot is not None and now - self._checked_at < settings.CATALOG_REFRESH_SECONDS:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is not None and self._snapshot is not snapshot:
+                return self._snapshot  # another thread just reloaded
+            with Session(self.engine) as session:
+                version = read_catalog_version(session)
+                if self._snapshot is None or self._snapshot.version != version:
+                    jobs = {job["id"]: job for job in self.loader(session)}
+                    blobs = {i: json.dumps(job, ensure_ascii=False, default=str).encode("utf-8") for i, job in jobs.items()}
+                    self._snapshot = CatalogSnapshot(version, sorted(jobs), jobs, blobs)
+            self._checked_at = now
+            return self._snapshot
+
+
+def not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == bare for tag in header.split(","))
+
+
+def cached_json(request: Request, snapshot: CatalogSnapshot, body: Callable[[], bytes], headers: Optional[dict] = None) -> Response:
+    """200 with pre-serialized bytes, or 304 when the client already holds this version."""
+    headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache", **(headers or {})}
+    if not_modified(request, snapshot.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body(), media_type="application/json", headers=headers)
@@ -0,0 +1,75 @@
+# skillmatcher/services/improve.py
+"""Improved-resume text, built from a resume's sections and the skills its job still needs.
+
+Shared by both resume APIs. The text is what ``/resumes/download/{id}``
+renders as TXT, DOCX or PDF (see ``render_cache``).
+"""
+from typing import List, Optional
+
+from app.services.sections import ResumeSections, sectionize
+
+
+def generate_improved_resume(
+    original_text: str, job_title: str, missing_skills: List[str], sections: Optional[ResumeSections] = None
+):
+    if sections is None:
+        sections = sectionize(original_text)
+    return build_improved_resume(sections, job_title, missing_skills)
+
+def build_improved_resume(sections: ResumeSections, job_title: str, missing_skills: List[str]) -> str:
+    """The improved resume from already sectioned text (e.g. the stored ``sections`` column)."""
+    # Lines under a skills heading; otherwise any line that mentions skills
+    skills_section = sections.blocks["skills"] or sections.mentions["skills"]
+    improved = f"""
+=====================================================
+        IMPROVED RESUME — Optimized for {job_title}
+=====================================================
+
+📌 PROFESSIONAL SUMMARY
+Highly motivated candidate applying for the role of {job_title}.
+Enhanced readability, aligns skills with job requirements.
+
+📌 KEY SKILLS & COMPETENCIES
+Core Skills:
+{format_bullets(skills_section)}
+
+Added Missing Skills:
+{format_bullets(missing_skills if missing_skills else ['No missing skills — excellent match!'])}
+
+📌 PROFESSIONAL EXPERIENCE
+{rewrite_experience(sections.mentions["experience"])}
+
+📌 EDUCATION
+{extract_education(sections.mentions["education"])}
+
+📌 NOTES
+- ATS-friendly formatting
+- Structured for recruiter readability
+
+=====================================================
+                 END OF IMPROVED RESUME
+=====================================================
+"""
+    return improved.strip()
+
+def format_bullets(items):
+    if not items:
+        return "  • No data found"
+    return "\n".join([f"  • {i}" for i in items])
+
+def rewrite_experience(lines):
+    # ``lines`` are the experience mentions picked out by the sectionizer
+    exp = [f"  • {rewrite_sentence(line.replace('-', '').strip())}" for line in lines]
+    return "\n".join(exp) if exp else "  • No experience details detected."
+
+def rewrite_sentence(sentence):
+    verbs = ["Developed", "Implemented", "Led", "Improved", "Managed", "Optimized", "Enhanced"]
+    if not sentence:
+        return ""
+    words = sentence.split()
+    verb = verbs[len(sentence) % len(verbs)]
+    return verb + " " + " ".join(words[1:])
+
+def extract_education(lines):
+    edu = [f"  • {line}" for line in lines]
+    return "\n".join(edu) if edu else "  • No education details detected."
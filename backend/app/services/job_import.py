@@ -0,0 +1,239 @@
+# skillmatcher/services/job_import.py
+"""Streaming bulk import of job records (NDJSON or CSV) into the catalog.
+
+Records are read one line at a time and written in batches: one multi-row
+upsert into ``job`` and one delete plus multi-row insert into ``job_skill``
+per batch, each batch in its own short transaction, so memory stays bounded
+by the batch size and readers (WAL) are never blocked for long. The catalog
+version is bumped and the in-process skill index rebuilt once, after the
+last batch; until then readers keep serving the previous catalog snapshot.
+
+Record fields follow ``app/data/jobs.json``: ``id`` and ``title`` are
+required, ``skills`` and ``requirements`` are lists. In CSV they are JSON
+arrays or ``;``-separated values.
+"""
+from dataclasses import dataclass, field, replace
+from typing import AsyncIterable, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import codecs
+import csv
+import json
+import logging
+import time
+
+import anyio
+from anyio import from_thread, to_thread
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.db.bulk import upsert
+from app.services.catalog_cache import bump_catalog_version
+from app.services.skill_index import job_skill_index, write_job_skills
+
+log = logging.getLogger(__name__)
+
+FORMATS = ("ndjson", "csv")
+MAX_REPORTED_ERRORS = 20
+
+
+@dataclass
+class ImportReport:
+    imported: int = 0
+    rejected: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    def reject(self, where: str, reason: str) -> None:
+        self.rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(f"{where}: {reason}")
+
+
+# -------------------------
+# Reading
+# -------------------------
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Decode a byte stream into lines (line endings kept, as csv expects)."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def read_ndjson(lines: Iterable[str]) -> Iterator[Tuple[str, object]]:
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield f"line {number}", json.loads(line)
+        except ValueError as e:
+            yield f"line {number}", e
+
+
+def read_csv(lines: Iterable[str]) -> Iterator[Tuple[str, object]]:
+    reader = csv.DictReader(lines)
+    for record in reader:
+        yield f"line {reader.line_num}", record
+
+
+READERS = {"ndjson": read_ndjson, "csv": read_csv}
+
+
+def _list_field(value) -> List[str]:
+    if value is None or value == "":
+        return []
+    if isinstance(value, list):
+        return [str(v) for v in value]
+    value = str(value).strip()
+    if value.startswith("["):
+        return [str(v) for v in json.loads(value)]
+    return [v.strip() for v in value.split(";") if v.strip()]
+
+
+def job_row(record) -> Tuple[Dict, List[str]]:
+    """A ``job`` table row and its skills from one record; raises ValueError when it is unusable."""
+    if isinstance(record, Exception):
+        raise ValueError(f"invalid JSON ({record})")
+    if not isinstance(record, dict):
+        raise ValueError("record is not an object")
+    try:
+        job_id = int(record.get("id"))
+    except (TypeError, ValueError):
+        raise ValueError("missing or non-integer id")
+    title = str(record.get("title") or "").strip()
+    if not title:
+        raise ValueError("missing title")
+    skills = _list_field(record.get("skills"))
+    return {
+        "id": job_id,
+        "title": title,
+        "skills": json.dumps(skills),
+        "requirements": json.dumps(_list_field(record.get("requirements"))),
+        "demand": str(record.get("demand") or ""),
+        "avg_salary": str(record.get("avg_salary") or ""),
+        "description": str(record.get("description") or ""),
+    }, skills
+
+
+# -------------------------
+# Writing
+# -------------------------
+def _write_batch(engine: Engine, job_model, batch: List[Tuple[Dict, List[str]]]) -> None:
+    with Session(engine) as session:
+        upsert(session, job_model, [row for row, _ in batch])
+        write_job_skills(session, [(row["id"], skills) for row, skills in batch])
+        session.commit()
+
+
+def import_jobs(
+    engine: Engine,
+    job_model,
+    lines: Iterable[str],
+    fmt: str = "ndjson",
+    batch_size: Optional[int] = None,
+    on_progress: Optional[Callable[[ImportReport], None]] = None,
+) -> ImportReport:
+    """Upsert every valid record from ``lines`` into ``job_model``'s table.
+
+    Invalid records are skipped and counted. A later record with the same
+    id replaces an earlier one. ``on_progress`` is called after each batch.
+    """
+    if fmt not in READERS:
+        raise ValueError(f"Unknown import format '{fmt}' (expected one of {', '.join(FORMATS)})")
+    batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+    report = ImportReport()
+    started = time.perf_counter()
+    batch: Dict[int, Tuple[Dict, List[str]]] = {}  # by id: a repeated id within a batch would break the upsert
+
+    def flush() -> None:
+        _write_batch(engine, job_model, list(batch.values()))
+        report.imported += len(batch)
+        report.batches += 1
+        report.seconds = round(time.perf_counter() - started, 3)
+        batch.clear()
+        if on_progress is not None:
+            on_progress(report)
+
+    for where, record in READERS[fmt](lines):
+        try:
+            row, skills = job_row(record)
+        except ValueError as e:
+            report.reject(where, str(e))
+            continue
+        batch[row["id"]] = (row, skills)
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+
+    # One catalog bump and one index rebuild for the whole import
+    if report.imported:
+        with Session(engine) as session:
+            bump_catalog_version(session)
+            session.commit()
+            job_skill_index.load(session)
+    report.seconds = round(time.perf_counter() - started, 3)
+    log.info(
+        "Imported %d jobs in %d batches (%d rejected) in %.2fs",
+        report.imported, report.batches, report.rejected, report.seconds,
+    )
+    return report
+
+
+async def import_stream(
+    engine: Engine,
+    job_model,
+    chunks: AsyncIterable[bytes],
+    fmt: str = "ndjson",
+    batch_size: Optional[int] = None,
+    on_progress: Optional[Callable[[ImportReport], Awaitable[None]]] = None,
+) -> ImportReport:
+    """``import_jobs`` over an async byte stream (e.g. a request body).
+
+    Parsing and writing run in a worker thread that pulls chunks as it needs
+    them, so the event loop only moves bytes and at most a few chunks are
+    held in memory. ``on_progress`` is awaited on the event loop with a copy
+    of the report after each batch.
+    """
+    send, receive = anyio.create_memory_object_stream(max_buffer_size=4)
+
+    def pull() -> Iterator[bytes]:
+        while True:
+            try:
+                yield from_thread.run(receive.receive)
+            except anyio.EndOfStream:
+                return
+
+    def progress(report: ImportReport) -> None:
+        _log_progress(report)
+        if on_progress is not None:
+            from_thread.run(on_progress, replace(report, errors=list(report.errors)))
+
+    def run() -> ImportReport:
+        try:
+            return import_jobs(engine, job_model, iter_lines(pull()), fmt, batch_size, progress)
+        finally:
+            from_thread.run_sync(receive.close)
+
+    async def pump() -> None:
+        async with send:
+            try:
+                async for chunk in chunks:
+                    await send.send(chunk)
+            except anyio.BrokenResourceError:
+                pass  # the importer stopped early; its error is raised below
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(pump)
+        return await to_thread.run_sync(run)
+
+
+def _log_progress(report: ImportReport) -> None:
+    log.info("Job import: %d imported, %d rejected after %.1fs", report.imported, report.rejected, report.seconds)
@@ -1,6 +1,11 @@
 # skillmatcher/services/matching.py
 import re
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Tuple
+
+from app.services.skill_extractor import SkillExtractor
+from app.services.skill_index import normalize_skill
+from app.services.skill_vocabulary import SkillVocabulary
 
 def normalize(text: str) -> str:
     return re.sub(r'[^a-z0-9\s]', ' ', (text or "").lower())
@@ -10,14 +15,21 @@ def skills_from_text(text: str) -> set:
     words = set(w for w in normalize(text).split() if len(w) > 1)
     return words
 
+@lru_cache(maxsize=256)
+def _extractor_for(job_skills: Tuple[str, ...]) -> SkillExtractor:
+    # Built per distinct skill list (not per resume), so it also works inside pool workers
+    return SkillExtractor(job_skills, SkillVocabulary(job_skills))
+
 def match_skills(job_skills: List[str], resume_text: str) -> Dict:
     resume_words = skills_from_text(resume_text)
     required = [s.lower().strip() for s in job_skills]
+    # aliases ("js" -> "javascript") and near-misses ("kubernets") via the trigram index
+    found = set(_extractor_for(tuple(required)).extract(resume_text))
     matched = []
     missing = []
     for s in required:
         # match exact word or multi-word presence
-        if all(part in resume_words for part in s.split()):
+        if all(part in resume_words for part in s.split()) or normalize_skill(s) in found:
             matched.append(s)
         else:
             missing.append(s)
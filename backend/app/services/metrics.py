@@ -0,0 +1,274 @@
+# skillmatcher/services/metrics.py
+"""In-process metrics exposed in the Prometheus text format at ``/metrics``.
+
+Histograms and gauges are plain Python objects: recording a value
+is a bisect into a fixed bucket list plus a few additions under a lock, with
+no I/O and no allocation once a label combination has been seen. Values that
+already live elsewhere (cache statistics, worker pool occupancy) are read
+through callbacks at scrape time instead of being tracked twice.
+"""
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+import time
+
+from fastapi import FastAPI, Response
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_metrics: List["_Metric"] = []
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = Lock()
+        _metrics.append(self)
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(n, "")) for n in self.labelnames)
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"] + self._samples()
+
+    @abstractmethod
+    def _samples(self) -> List[str]:
+        """Sample lines in the text exposition format."""
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), fn: Optional[Callable[[], float]] = None):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._fn = fn  # read at scrape time (unlabelled gauges only)
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    @contextmanager
+    def track(self, **labels) -> Iterator[None]:
+        """Count the enclosed block as in progress."""
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+    def _samples(self) -> List[str]:
+        if self._fn is not None:
+            return [f"{self.name} {float(self._fn())}"]
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, k)} {v}" for k, v in items]
+
+
+class Counter(Gauge):
+    kind = "counter"
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts (+Inf last), sum]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        slot = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][slot] += 1
+            series[1] += value
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = [(k, list(counts), total) for k, (counts, total) in self._series.items()]
+        lines = []
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = 'le="+Inf"' if bound == float("inf") else f'le="{bound!r}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {total}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+def render() -> str:
+    return "\n".join(line for metric in _metrics for line in metric.render()) + "\n"
+
+
+# -------------------------
+# Application metrics
+# -------------------------
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template", ("method", "route", "status")
+)
+REQUESTS_IN_FLIGHT = Gauge("http_requests_in_flight", "HTTP requests being served")
+STAGE_LATENCY = Histogram(
+    "pipeline_stage_duration_seconds", "Resume pipeline stage latency by file type", ("stage", "kind")
+)
+UPLOADS_IN_FLIGHT = Gauge("resume_uploads_in_flight", "Resume uploads being processed", ("endpoint",))
+DB_QUERY_LATENCY = Histogram("db_query_duration_seconds", "Database statement latency", ("operation",), DB_BUCKETS)
+
+
+def stage(name: str, kind: str = ""):
+    """Time one pipeline stage: ``with stage("parse", ".pdf"): ...``."""
+    return STAGE_LATENCY.time(stage=name, kind=kind)
+
+
+def track_uploads(endpoint: str):
+    """Decorator counting an async upload route in resume_uploads_in_flight while it runs."""
+    def decorate(fn):
+        @wraps(fn)
+        async def wrapper(*args, **kwargs):
+            with UPLOADS_IN_FLIGHT.track(endpoint=endpoint):
+                return await fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+_callbacks_registered = False
+
+
+def register_callbacks() -> None:
+    """Gauges read from the live caches and pools at scrape time."""
+    global _callbacks_registered
+    if _callbacks_registered:
+        return
+    _callbacks_registered = True
+    from app.services.parse_cache import parse_cache
+    from app.services.render_cache import render_cache
+    from app.services.workers import cpu_pool
+
+    for field in ("hits", "misses", "evictions", "size"):
+        Gauge(f"parse_cache_{field}", f"Parse cache {field}", fn=lambda f=field: parse_cache.stats()[f])
+    Gauge("parse_cache_hit_ratio", "Parse cache hit ratio since start", fn=lambda: parse_cache.stats()["hit_ratio"])
+    for field in ("entries", "bytes", "hits", "misses"):
+        Gauge(f"render_cache_{field}", f"Download render cache {field}", fn=lambda f=field: render_cache.stats()[f])
+    Gauge("worker_pool_in_flight", "Tasks submitted to the CPU worker pool", fn=lambda: cpu_pool.in_flight)
+    Gauge("worker_pool_capacity", "Maximum tasks the CPU worker pool accepts", fn=lambda: cpu_pool.max_pending)
+
+
+# -------------------------
+# Wiring
+# -------------------------
+def instrument_engine(engine: Engine) -> None:
+    """Time every statement on ``engine`` through SQLAlchemy cursor events."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _stop(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_start"].pop()
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "OTHER"
+        DB_QUERY_LATENCY.observe(time.perf_counter() - started, operation=operation)
+
+    @event.listens_for(engine, "handle_error")
+    def _failed(context):
+        # A failed statement never reaches after_cursor_execute
+        stack = context.connection.info.get("query_start") if context.connection is not None else None
+        if stack:
+            stack.pop()
+
+
+class RequestTimingMiddleware:
+    """Request latency and in-flight count, as plain ASGI middleware.
+
+    ``@app.middleware("http")`` would run every request through
+    BaseHTTPMiddleware, which adds a task and re-streams every response
+    body. Here the only per-request work is a wrapped ``send``.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            # The route template keeps label cardinality bounded (/jobs/{job_id}, not /jobs/42)
+            route = scope.get("route")
+            REQUEST_LATENCY.observe(
+                time.perf_counter() - start,
+                method=scope["method"],
+                route=getattr(route, "path", "unmatched"),
+                status=str(status),
+            )
+
+
+def install(app: FastAPI, engine: Engine) -> None:
+    """Add the request-timing middleware, DB timing and the ``/metrics`` route to ``app``."""
+    instrument_engine(engine)
+    register_callbacks()
+    app.add_middleware(RequestTimingMiddleware)
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics() -> Response:
+        return Response(render(), media_type=CONTENT_TYPE)
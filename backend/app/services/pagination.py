@@ -0,0 +1,64 @@
+# skillmatcher/services/pagination.py
+"""Keyset pagination, column projection and streaming for large tables.
+
+Pages are addressed by the last id seen (``WHERE id > :after ORDER BY id``),
+which uses the primary key index however deep the client goes, unlike
+OFFSET. Large columns are left out of the SELECT unless asked for, and the
+streaming variant reads through a server-side cursor in fixed-size batches,
+so memory stays flat regardless of table size.
+"""
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+import json
+
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+STREAM_BATCH_SIZE = 500
+
+# Columns only loaded on request
+HEAVY_RESUME_COLUMNS = ("improved_resume", "sections")
+
+
+def project(model, include: Iterable[str] = (), heavy: Sequence[str] = HEAVY_RESUME_COLUMNS) -> list:
+    include = set(include or ())
+    return [c for c in model.__table__.columns if c.name not in heavy or c.name in include]
+
+
+def keyset_select(model, columns: list, after_id: Optional[int] = None, limit: Optional[int] = None):
+    stmt = select(*columns).order_by(model.id)
+    if after_id is not None:
+        stmt = stmt.where(model.id > after_id)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def fetch_page(
+    session: Session, model, columns: list, after_id: Optional[int] = None, limit: int = DEFAULT_PAGE_SIZE
+) -> Tuple[List[dict], Optional[int]]:
+    """One page of rows as dicts, plus the cursor for the next page (None on the last)."""
+    # One extra row tells us whether another page exists without a COUNT(*)
+    rows = [dict(r) for r in session.execute(keyset_select(model, columns, after_id, limit + 1)).mappings()]
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, rows[-1]["id"]
+    return rows, None
+
+
+def stream_ndjson(
+    engine: Engine, stmt, batch_size: int = STREAM_BATCH_SIZE, transform: Optional[Callable] = None
+) -> Iterator[bytes]:
+    """Yield rows of ``stmt`` as NDJSON lines, fetched batch by batch through a server-side cursor.
+
+    ``transform(conn, rows)``, if given, may enrich each batch of row dicts before it is written.
+    """
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(stmt)
+        for partition in result.mappings().partitions():
+            rows = [dict(row) for row in partition]
+            if transform is not None:
+                rows = transform(conn, rows)
+            yield "".join(json.dumps(row, default=str) + "\n" for row in rows).encode("utf-8")
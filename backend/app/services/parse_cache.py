@@ -0,0 +1,180 @@
+# skillmatcher/services/parse_cache.py
+"""Content-hash cache for parsed resume text and extracted skills.
+
+Entries are keyed by the SHA-256 of the uploaded bytes plus the parser
+version, held in a bounded in-memory LRU and persisted in the
+``parsed_resume`` table so a re-upload of the same CV skips parsing even
+after a restart. The text itself lives in ``text_blob`` (services/text_store.py),
+shared with the resume rows that hold the same text.
+"""
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Awaitable, Callable, List, NamedTuple, Optional, Tuple, Union
+import hashlib
+import json
+import logging
+
+from starlette.concurrency import run_in_threadpool
+from sqlmodel import SQLModel, Field, Session, select
+
+from app.core.config import settings
+from app.db.session import engine
+from app.services.storage import open_mmap
+from app.services.text_store import TextBlob, decode, put_text
+
+log = logging.getLogger(__name__)
+
+
+class ParsedResume(SQLModel, table=True):
+    __tablename__ = "parsed_resume"
+
+    key: str = Field(primary_key=True)  # "<sha256>:<parser version>"
+    text_digest: str  # text_blob row holding the parsed text
+    skills: Optional[str] = None  # JSON list
+    vocabulary: Optional[str] = None  # extractor fingerprint the skills were computed with
+
+
+# What a parser hands the cache: the text, or (text, truncated)
+ParseResult = Union[str, Tuple[str, bool]]
+
+
+class ParsedEntry(NamedTuple):
+    text: str
+    skills: Optional[List[str]] = None
+    vocabulary: Optional[str] = None
+
+
+def file_digest(path: Path) -> str:
+    with open_mmap(path) as data:
+        return hashlib.sha256(data).hexdigest()
+
+
+def cache_key(digest: str, parser_version: str) -> str:
+    return f"{digest}:{parser_version}"
+
+
+class ParseCache:
+    """Bounded LRU in front of the parsed_resume table."""
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, ParsedEntry]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _remember(self, key: str, entry: ParsedEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _peek(self, key: str) -> Optional[ParsedEntry]:
+        with self._lock:
+            return self._entries.get(key)
+
+    def _hit(self, key: str) -> Optional[ParsedEntry]:
+        """The in-memory entry for ``key``, counted as a hit; no database access."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return entry
+
+    def get(self, key: str) -> Optional[ParsedEntry]:
+        entry = self._hit(key)
+        if entry is not None:
+            return entry
+
+        row = None
+        try:
+            with Session(engine) as session:
+                row = session.exec(
+                    select(TextBlob.codec, TextBlob.data, ParsedResume.skills, ParsedResume.vocabulary)
+                    .join(TextBlob, TextBlob.digest == ParsedResume.text_digest)
+                    .where(ParsedResume.key == key)
+                ).first()
+        except Exception as e:
+            log.warning("Parse cache lookup failed: %s", e)
+        if row is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        codec, data, skills, vocabulary = row
+        entry = ParsedEntry(decode(codec, data), json.loads(skills) if skills else None, vocabulary)
+        with self._lock:
+            self.hits += 1
+        self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, entry: ParsedEntry) -> None:
+        self._remember(key, entry)
+        try:
+            with Session(engine) as session:
+                session.merge(ParsedResume(
+                    key=key,
+                    text_digest=put_text(session, entry.text),
+                    skills=json.dumps(entry.skills) if entry.skills is not None else None,
+                    vocabulary=entry.vocabulary,
+                ))
+                session.commit()
+        except Exception as e:
+            log.warning("Parse cache store failed: %s", e)
+
+    def get_or_parse(self, key: str, parse: Callable[[], ParseResult]) -> str:
+        """Cached text for ``key``, else ``parse()``'s. A parser may return (text, truncated);
+        truncated text (e.g. a PDF cut short by its deadline) is returned but not cached."""
+        entry = self.get(key)
+        if entry is not None:
+            return entry.text
+        return self._store_parsed(key, parse())
+
+    async def aget_or_parse(self, key: str, parse: Callable[[], Awaitable[ParseResult]]) -> str:
+        """Async variant for parsers that run off the event loop. Memory hits are served
+        inline; the parsed_resume lookup and store run in the threadpool."""
+        entry = self._hit(key) or await run_in_threadpool(self.get, key)
+        if entry is not None:
+            return entry.text
+        result = await parse()
+        return await run_in_threadpool(self._store_parsed, key, result)
+
+    def _store_parsed(self, key: str, result: ParseResult) -> str:
+        text, truncated = result if isinstance(result, tuple) else (result, False)
+        if truncated:
+            log.info("Partial parse of %s not cached", key)
+        else:
+            self.put(key, ParsedEntry(text))
+        return text
+
+    def skills_for(self, key: str, text: str, extractor) -> List[str]:
+        """Cached skills for a parsed file, recomputed if the vocabulary changed."""
+        entry = self._peek(key) or self.get(key)
+        if entry is None:
+            # The text itself was not cached (a partial parse): neither are its skills
+            return extractor.extract(text)
+        if entry.skills is not None and entry.vocabulary == extractor.fingerprint:
+            return entry.skills
+        skills = extractor.extract(text)
+        self.put(key, ParsedEntry(text, skills, extractor.fingerprint))
+        return skills
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+parse_cache = ParseCache(settings.PARSE_CACHE_SIZE)
@@ -1,25 +1,28 @@
 # skillmatcher/services/parsing.py
 from pathlib import Path
-import PyPDF2
-import docx
+import asyncio
 import logging
+from typing import Optional, Union
+
+from app.services.parse_cache import parse_cache, cache_key, file_digest
+from app.services.pdf_extract import PdfText, extract_pdf, pdf_parser_version
+from app.services.workers import cpu_pool
 
 log = logging.getLogger(__name__)
 
-def extract_text_from_pdf(path: Path) -> str:
-    text = []
-    try:
-        with open(path, "rb") as f:
-            reader = PyPDF2.PdfReader(f)
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text.append(page_text)
-    except Exception as e:
-        log.exception("PDF parsing failed: %s", e)
-    return "\n".join(text)
+# Bump whenever extraction output changes so cached text is not reused
+# (the PDF part follows the configured backend chain)
+PARSER_VERSION = f"docx-1+{pdf_parser_version()}"
+
+def extract_text_from_pdf(path: Path) -> PdfText:
+    # Backend fallback chain, page cap and deadline come from settings; text cut
+    # short by the deadline comes back truncated and is not cached
+    return extract_pdf(path)
 
 def extract_text_from_docx(path: Path) -> str:
+    # python-docx (and lxml) load on the first DOCX, not at import time
+    import docx
+
     try:
         doc = docx.Document(path)
         return "\n".join(p.text for p in doc.paragraphs if p.text)
@@ -27,14 +30,27 @@ def extract_text_from_docx(path: Path) -> str:
         log.exception("DOCX parsing failed: %s", e)
         return ""
 
-def parse_resume_file(path: Path) -> str:
+def parse_resume_file(path: Path, digest: Optional[str] = None) -> str:
+    """Parse a resume, reusing the cached text for files already seen."""
+    key = cache_key(digest or file_digest(path), PARSER_VERSION)
+    return parse_cache.get_or_parse(key, lambda: _parse_uncached(path))
+
+async def parse_resume_file_async(path: Path, digest: Optional[str] = None) -> str:
+    """Like parse_resume_file, but parsing runs in the worker pool off the event loop."""
+    if digest is None:
+        digest = await asyncio.to_thread(file_digest, path)
+    key = cache_key(digest, PARSER_VERSION)
+    return await parse_cache.aget_or_parse(key, lambda: cpu_pool.run(_parse_uncached, path))
+
+def _parse_uncached(path: Path) -> Union[str, PdfText]:
     lower = path.suffix.lower()
     if lower == ".pdf":
         return extract_text_from_pdf(path)
     if lower in (".docx", ".doc"):
         return extract_text_from_docx(path)
-    # fallback to plain text
+    # fallback to plain text; decoding copies the whole file anyway, so a plain
+    # read is cheaper than setting up a memory map
     try:
-        return path.read_text(encoding="utf-8", errors="ignore")
+        return path.read_bytes().decode("utf-8", "ignore")
     except Exception:
         return ""
@@ -0,0 +1,281 @@
+# skillmatcher/services/pdf_extract.py
+"""One PDF text extraction interface over several libraries.
+
+Backends (PyMuPDF, PyPDF2, pdfplumber) register themselves in ``BACKENDS``
+and are imported lazily, so a deployment only needs the ones it uses.
+``extract_pdf_text`` tries the configured chain (``PDF_BACKENDS``) in order
+and falls through to the next backend when one fails or finds no text.
+Documents are capped at ``PDF_MAX_PAGES`` pages and ``PDF_DEADLINE``
+seconds; long ones are split into page ranges that are extracted in
+parallel by a small process pool. ``extract_pdf`` reports text cut short by
+the deadline or a failed page range, and the empty result of a chain whose
+backends all raised, as ``truncated``, so callers do not cache it.
+"""
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, wait
+from contextlib import contextmanager
+from importlib.util import find_spec
+from multiprocessing import get_context, util
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Union
+import logging
+import time
+
+from app.core.config import settings
+
+log = logging.getLogger(__name__)
+
+
+class PdfDocument(ABC):
+    """An open PDF: page count plus text of one page at a time."""
+
+    page_count: int = 0
+
+    @abstractmethod
+    def page_text(self, index: int) -> str:
+        ...
+
+
+class PdfBackend(ABC):
+    name = ""
+    module = ""  # import needed for this backend
+
+    def available(self) -> bool:
+        return find_spec(self.module) is not None
+
+    @abstractmethod
+    def open(self, path: Path):
+        """Context manager yielding a PdfDocument."""
+
+
+class PdfText(NamedTuple):
+    text: str
+    # The deadline or a failed page range cut extraction short; a later try may get more
+    truncated: bool = False
+
+
+BACKENDS: Dict[str, PdfBackend] = {}
+
+
+def register_backend(cls):
+    """Class decorator adding a backend to the registry under ``cls.name``."""
+    BACKENDS[cls.name] = cls()
+    return cls
+
+
+# -------------------------
+# Backends
+# -------------------------
+class _PageList(PdfDocument):
+    def __init__(self, pages, text_of):
+        self._pages = pages
+        self._text_of = text_of
+        self.page_count = len(pages)
+
+    def page_text(self, index: int) -> str:
+        return self._text_of(self._pages[index]) or ""
+
+
+@register_backend
+class PyMuPDFBackend(PdfBackend):
+    name = "pymupdf"
+    module = "fitz"
+
+    @contextmanager
+    def open(self, path: Path) -> Iterator[PdfDocument]:
+        import fitz
+
+        with fitz.open(path) as doc:
+            yield _PageList(range(doc.page_count), lambda i: doc.load_page(i).get_text("text"))
+
+
+@register_backend
+class PyPDF2Backend(PdfBackend):
+    name = "pypdf2"
+    module = "PyPDF2"
+
+    @contextmanager
+    def open(self, path: Path) -> Iterator[PdfDocument]:
+        import PyPDF2
+        from app.services.storage import open_mmap
+
+        # The reader seeks around the file; a memory map serves that without read syscalls
+        with open_mmap(path) as data:
+            yield _PageList(PyPDF2.PdfReader(data).pages, lambda page: page.extract_text())
+
+
+@register_backend
+class PdfplumberBackend(PdfBackend):
+    name = "pdfplumber"
+    module = "pdfplumber"
+
+    @contextmanager
+    def open(self, path: Path) -> Iterator[PdfDocument]:
+        import pdfplumber
+
+        def text_of(page):
+            try:
+                return page.extract_text()
+            finally:
+                page.flush_cache()  # pdfplumber keeps every parsed object otherwise
+
+        with pdfplumber.open(path) as pdf:
+            yield _PageList(pdf.pages, text_of)
+
+
+def backend_chain(names: Optional[Union[str, Sequence[str]]] = None) -> List[PdfBackend]:
+    """Registered and importable backends for ``names`` (default: PDF_BACKENDS), in order."""
+    if names is None:
+        names = settings.PDF_BACKENDS
+    if isinstance(names, str):
+        names = [n.strip() for n in names.split(",") if n.strip()]
+    chain = []
+    for name in names:
+        backend = BACKENDS.get(name)
+        if backend is None:
+            log.warning("Unknown PDF backend '%s' ignored", name)
+        elif backend.available():
+            chain.append(backend)
+    return chain
+
+
+def pdf_parser_version(names: Optional[Union[str, Sequence[str]]] = None) -> str:
+    """Identifies the extraction setup, for parse cache keys."""
+    chain = ",".join(b.name for b in backend_chain(names))
+    return f"pdf-1:{chain}:p{settings.PDF_MAX_PAGES}"
+
+
+# -------------------------
+# Extraction
+# -------------------------
+def _extract_range(backend_name: str, path: Path, start: int, stop: int, deadline: float) -> List[str]:
+    """Text of pages [start, stop) of one document, stopping early at ``deadline`` (epoch)."""
+    pages: List[str] = []
+    with BACKENDS[backend_name].open(path) as doc:
+        for i in range(start, min(stop, doc.page_count)):
+            if time.time() > deadline:
+                break
+            pages.append(doc.page_text(i))
+    return pages
+
+
+_pool_lock = Lock()
+_page_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_page_pool() -> ProcessPoolExecutor:
+    global _page_pool
+    with _pool_lock:
+        if _page_pool is None:
+            _page_pool = ProcessPoolExecutor(settings.PDF_PAGE_WORKERS, mp_context=get_context("spawn"))
+            # Also shut down when this process exits without calling shutdown(), e.g. a
+            # cpu_pool worker holding a pool of its own: multiprocessing joins a process's
+            # children as it exits, and idle page workers would keep it waiting forever.
+            # Runs ahead of the executor's own queue finalizers (priority 10), which would
+            # otherwise close the call queue before the workers get their stop sentinel
+            util.Finalize(_page_pool, shutdown, exitpriority=100)
+        return _page_pool
+
+
+def _extract_parallel(backend: PdfBackend, path: Path, n_pages: int, deadline: float) -> PdfText:
+    workers = settings.PDF_PAGE_WORKERS
+    step = -(-n_pages // workers)
+    ranges = [(start, min(start + step, n_pages)) for start in range(0, n_pages, step)]
+    futures = [_get_page_pool().submit(_extract_range, backend.name, path, a, b, deadline) for a, b in ranges]
+    done, not_done = wait(futures, timeout=max(0.0, deadline - time.time()) + 1)
+    for f in not_done:
+        f.cancel()
+    pages: List[str] = []
+    complete = True
+    for f, (a, b) in zip(futures, ranges):  # keep page order; failed or late ranges are left out
+        if f in done and f.exception() is None:
+            result = f.result()
+            pages.extend(result)
+            complete = complete and len(result) == b - a
+        else:
+            complete = False
+            if f in done:
+                log.warning("PDF page range failed for %s: %s", path.name, f.exception())
+    if not complete:
+        log.warning("%s: %d of %d pages extracted before the deadline or a failure", path.name, len(pages), n_pages)
+    return PdfText("\n".join(p for p in pages if p), truncated=not complete)
+
+
+def _extract_with(backend: PdfBackend, path: Path, max_pages: int, deadline: float) -> PdfText:
+    with backend.open(path) as doc:
+        n_pages = min(doc.page_count, max_pages)
+        if n_pages < doc.page_count:
+            log.info("%s: only the first %d of %d pages are extracted", path.name, n_pages, doc.page_count)
+        parallel = settings.PDF_PAGE_WORKERS > 1 and n_pages >= settings.PDF_PARALLEL_MIN_PAGES
+        if not parallel:
+            pages = []
+            for i in range(n_pages):
+                if time.time() > deadline:
+                    break
+                pages.append(doc.page_text(i))
+    if parallel:
+        return _extract_parallel(backend, path, n_pages, deadline)
+    if len(pages) < n_pages:
+        log.warning("%s: extraction deadline reached after %d of %d pages", path.name, len(pages), n_pages)
+    return PdfText("\n".join(p for p in pages if p), truncated=len(pages) < n_pages)
+
+
+def extract_pdf(
+    path: Path,
+    backends: Optional[Union[str, Sequence[str]]] = None,
+    max_pages: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> PdfText:
+    """Text of a PDF from the first backend in the chain that yields any; "" if none does.
+
+    ``deadline`` is in seconds for the whole document, across fallbacks. The
+    page cap is part of ``pdf_parser_version``, so capped text is not
+    truncated; text cut short by the deadline is, and so is "" when a backend
+    raised instead of finding no text (a crash or a pool error may pass).
+    """
+    path = Path(path)
+    max_pages = max_pages or settings.PDF_MAX_PAGES
+    ends_at = time.time() + (deadline or settings.PDF_DEADLINE)
+    chain = backend_chain(backends)
+    if not chain:
+        log.error("No PDF backend available (configured: %s)", backends or settings.PDF_BACKENDS)
+        return PdfText("")
+    failed = False
+    for backend in chain:
+        if time.time() > ends_at:
+            log.warning("%s: extraction deadline reached before trying %s", path.name, backend.name)
+            return PdfText("", truncated=True)
+        try:
+            result = _extract_with(backend, path, max_pages, ends_at)
+        except Exception as e:
+            log.warning("PDF backend %s failed on %s: %s", backend.name, path.name, e)
+            failed = True
+            continue
+        if result.text.strip():
+            return result
+        if result.truncated:
+            return result  # out of time: the next backend would not get further
+        log.info("PDF backend %s found no text in %s", backend.name, path.name)
+    return PdfText("", truncated=failed)
+
+
+def extract_pdf_text(
+    path: Path,
+    backends: Optional[Union[str, Sequence[str]]] = None,
+    max_pages: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> str:
+    """``extract_pdf`` without the truncation flag, for callers that do not cache."""
+    return extract_pdf(path, backends, max_pages, deadline).text
+
+
+def shutdown() -> None:
+    """Stop the page pool. Waits for the workers to exit (pending ranges are cancelled):
+    returning earlier leaves the executor's thread joining them during interpreter
+    exit, which can hang."""
+    global _page_pool
+    with _pool_lock:
+        pool, _page_pool = _page_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
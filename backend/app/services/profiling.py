@@ -0,0 +1,257 @@
+# skillmatcher/services/profiling.py
+"""Request profiling: sampled profiles of slow requests, deep profiles on demand.
+
+Slow-request profiling is opt-in (``PROFILE_SLOW_SECONDS`` > 0), because it
+walks every thread stack each ``PROFILE_SAMPLE_INTERVAL`` whenever any request
+is in flight. When enabled, a background thread samples the stacks of every
+thread in the process (event loop, threadpool, task workers) and keeps the
+samples in a ring buffer. When a request takes longer than
+``PROFILE_SLOW_SECONDS``, the samples from its time window are written to
+``PROFILE_DIR`` as collapsed stacks (one ``thread;frame;...;frame count`` line
+per distinct stack, the input format of flamegraph tools). That shows whether
+the time went to CPU work on the event loop, to a thread waiting on SQLite, or
+to waiting on the parse pool.
+
+A request carrying ``X-Profile-Token`` equal to ``PROFILE_TOKEN`` is
+profiled in depth. The sampler runs at a finer interval, cProfile traces the
+event loop thread, and both are stored together with a ``.prof`` file that
+pstats and snakeviz can read. The response names the report in
+``X-Profile-Id``. Only one deep profile runs at a time (cProfile traces the
+whole event loop, and Python 3.12 refuses a second active profiler); further
+requests get 409 until it finishes.
+
+Samples cover the whole process, so requests running concurrently with the
+profiled one show up in its profile too.
+"""
+from collections import Counter, deque
+from pathlib import Path
+from threading import Event, Lock, Thread, get_ident
+from typing import Deque, Dict, List, Optional, Tuple
+import asyncio
+import cProfile
+import hmac
+import io
+import logging
+import pstats
+import sys
+import threading
+import time
+import uuid
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+log = logging.getLogger(__name__)
+
+TOKEN_HEADER = "X-Profile-Token"
+ID_HEADER = "X-Profile-Id"
+
+# (perf_counter timestamp, thread name, stack from outermost to innermost frame)
+Sample = Tuple[float, str, Tuple[str, ...]]
+
+
+# -------------------------
+# Stack sampler
+# -------------------------
+class StackSampler:
+    """Samples all thread stacks into a ring buffer while at least one request is active."""
+
+    def __init__(self, interval: float, max_samples: int):
+        self.interval = interval
+        self._samples: Deque[Sample] = deque(maxlen=max_samples)
+        self._labels: Dict[object, str] = {}  # code object -> "func (file:line)"
+        self._active = 0
+        self._fine = 0  # deep profiles in progress; sample at the fine interval
+        self._lock = Lock()
+        self._wake = Event()
+        self._thread: Optional[Thread] = None
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+        return label
+
+    def _sample_once(self) -> None:
+        now = time.perf_counter()
+        names = {t.ident: t.name for t in threading.enumerate()}
+        own = get_ident()
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(self._label(frame.f_code))
+                frame = frame.f_back
+            stack.reverse()
+            self._samples.append((now, names.get(ident, str(ident)), tuple(stack)))
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            self._sample_once()
+            time.sleep(settings.PROFILE_DEEP_INTERVAL if self._fine else self.interval)
+
+    def _ensure_started(self) -> None:
+        if self._thread is None:
+            self._thread = Thread(target=self._run, name="profile-sampler", daemon=True)
+            self._thread.start()
+
+    def begin(self, fine: bool = False) -> None:
+        with self._lock:
+            self._ensure_started()
+            self._active += 1
+            self._fine += fine
+            self._wake.set()
+
+    def end(self, fine: bool = False) -> None:
+        with self._lock:
+            self._active -= 1
+            self._fine -= fine
+            if self._active <= 0:
+                self._wake.clear()
+
+    def window(self, start: float, stop: float) -> List[Sample]:
+        return [s for s in list(self._samples) if start <= s[0] <= stop]
+
+
+sampler = StackSampler(settings.PROFILE_SAMPLE_INTERVAL, settings.PROFILE_BUFFER_SAMPLES)
+
+
+def collapse(samples: List[Sample]) -> List[str]:
+    """Collapsed-stack lines, heaviest first."""
+    counts = Counter(";".join((thread,) + stack) for _, thread, stack in samples)
+    return [f"{stack} {count}" for stack, count in counts.most_common()]
+
+
+# -------------------------
+# Reports
+# -------------------------
+def _rotate(folder: Path) -> None:
+    """Keep only the newest PROFILE_MAX_FILES reports (a report may have a .prof companion)."""
+    reports = sorted(folder.glob("*.txt"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for old in reports[settings.PROFILE_MAX_FILES:]:
+        old.unlink(missing_ok=True)
+        old.with_suffix(".prof").unlink(missing_ok=True)
+
+
+def write_report(
+    profile_id: str,
+    meta: Dict[str, object],
+    samples: List[Sample],
+    profiler: Optional[cProfile.Profile] = None,
+) -> Path:
+    folder = Path(settings.PROFILE_DIR)
+    folder.mkdir(parents=True, exist_ok=True)
+    lines = [f"{key}: {value}" for key, value in meta.items()]
+    lines += ["", f"# Sampled stacks, all threads ({len(samples)} samples)"] + collapse(samples)
+    if profiler is not None:
+        out = io.StringIO()
+        stats = pstats.Stats(profiler, stream=out)
+        stats.sort_stats("cumulative").print_stats(settings.PROFILE_TOP_FUNCTIONS)
+        stats.dump_stats(folder / f"{profile_id}.prof")
+        lines += ["", "# cProfile, event loop thread", out.getvalue()]
+    path = folder / f"{profile_id}.txt"
+    path.write_text("\n".join(lines), encoding="utf-8")
+    _rotate(folder)
+    return path
+
+
+def _save(profile_id: str, meta: Dict[str, object], samples: List[Sample], profiler=None) -> None:
+    try:
+        path = write_report(profile_id, meta, samples, profiler)
+        log.info("Profile of %s %s (%.2fs) written to %s", meta["method"], meta["path"], meta["seconds"], path)
+    except OSError as e:
+        log.warning("Could not write profile %s: %s", profile_id, e)
+
+
+# Held while a deep profile runs
+_deep_lock = Lock()
+
+
+def _authorized(headers: Headers) -> bool:
+    token = headers.get(TOKEN_HEADER)
+    return bool(settings.PROFILE_TOKEN and token) and hmac.compare_digest(token, settings.PROFILE_TOKEN)
+
+
+# -------------------------
+# Wiring
+# -------------------------
+class ProfilingMiddleware:
+    """Plain ASGI middleware: no extra task per request, and response bodies pass straight through."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        deep = _authorized(Headers(scope=scope))
+        if not (deep or settings.PROFILE_SLOW_SECONDS > 0):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        status = 500
+
+        async def send_with_id(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if deep:
+                    MutableHeaders(scope=message)[ID_HEADER] = profile_id
+            await send(message)
+
+        profiler = None
+        if deep:
+            if not _deep_lock.acquire(blocking=False):
+                await _busy(scope, receive, send)
+                return
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:  # another profiler is active in this process (3.12+)
+                _deep_lock.release()
+                await _busy(scope, receive, send)
+                return
+
+        sampler.begin(fine=deep)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                _deep_lock.release()
+            stop = time.perf_counter()
+            sampler.end(fine=deep)
+
+            seconds = stop - start
+            if deep or seconds >= settings.PROFILE_SLOW_SECONDS:
+                meta = {
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "route": getattr(scope.get("route"), "path", "unmatched"),
+                    "status": status,
+                    "seconds": round(seconds, 4),
+                    "trigger": "header" if deep else f"slow (>= {settings.PROFILE_SLOW_SECONDS}s)",
+                }
+                # Written off the event loop; the response does not wait for it
+                asyncio.get_running_loop().run_in_executor(
+                    None, _save, profile_id, meta, sampler.window(start, stop), profiler
+                )
+
+
+async def _busy(scope: Scope, receive: Receive, send: Send) -> None:
+    response = JSONResponse(status_code=409, content={"detail": "A deep profile is already running, retry shortly"})
+    await response(scope, receive, send)
+
+
+def install(app: FastAPI) -> None:
+    """Add the profiling middleware to ``app``."""
+    app.add_middleware(ProfilingMiddleware)
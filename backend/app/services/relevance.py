@@ -0,0 +1,250 @@
+# skillmatcher/services/relevance.py
+"""BM25 relevance of resume text against job titles, descriptions and requirements.
+
+``job_text_index`` keeps a sparse term-frequency vector per job. It is synced
+from the job table whenever the catalog changes, and only jobs whose text
+actually changed are re-tokenized. For scoring, the vectors are compiled into
+a term x job matrix in column form, with each cell already holding its BM25
+weight. A resume is scored against every job by gathering the columns of its
+terms and reducing them with one ``bincount``, so the cost follows the
+postings touched, not the number of jobs.
+"""
+from collections import Counter
+from threading import Lock, RLock
+from typing import Dict, Iterable, List, Optional, Tuple
+import hashlib
+import json
+import logging
+import re
+
+import numpy as np
+from sqlmodel import Session, select
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.db.session import engine as db_engine
+from app.services.skill_index import job_skill_index
+
+log = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"[a-z][a-z0-9+#]*")
+
+STOPWORDS = frozenset("""
+a about above after all also am an and any are as at be been being below both but by can could did do does
+doing down during each etc few for from further had has have having he her here hers him his how i if in
+into is it its itself just me more most my no nor not of off on once only or other our ours out over own
+per same she should so some such than that the their theirs them then there these they this those through
+to too under until up us very was we were what when where which while who whom why will with within you
+your yours
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN.findall((text or "").lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def job_document(title: str, description: str, requirements) -> str:
+    """The text of a job that takes part in relevance scoring."""
+    if isinstance(requirements, str):
+        try:
+            requirements = json.loads(requirements)
+        except ValueError:
+            requirements = [requirements]
+    return "\n".join([title or "", description or "", *(requirements or [])])
+
+
+# -------------------------
+# Incremental term vectors
+# -------------------------
+class TermIndex:
+    """Per-job term frequencies, updated one job at a time."""
+
+    def __init__(self):
+        # id -> (text hash, term ids, term frequencies, length)
+        self._docs: Dict[int, Tuple[str, np.ndarray, np.ndarray, int]] = {}
+        self._terms: Dict[str, int] = {}  # term -> term id; only grows
+        self._lock = RLock()
+        # Bumped on every change so compiled engines know when to rebuild
+        self.version = 0
+        self.synced_for: Optional[int] = None  # job_skill_index version of the last sync
+
+    def update(self, job_id: int, text: str) -> bool:
+        """(Re)index one job; returns False if its text did not change."""
+        digest = hashlib.sha1((text or "").encode("utf-8")).hexdigest()
+        with self._lock:
+            current = self._docs.get(job_id)
+            if current is not None and current[0] == digest:
+                return False
+            terms = tokenize(text)
+            counts = Counter(terms)
+            ids = np.fromiter((self._terms.setdefault(t, len(self._terms)) for t in counts), dtype=np.int64, count=len(counts))
+            tfs = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+            self._docs[job_id] = (digest, ids, tfs, len(terms))
+            self.version += 1
+            return True
+
+    def remove(self, job_id: int) -> None:
+        with self._lock:
+            if self._docs.pop(job_id, None) is not None:
+                self.version += 1
+
+    def sync(self, docs: Iterable[Tuple[int, str]]) -> int:
+        """Make the index hold exactly ``docs`` (job_id, text); returns jobs re-tokenized."""
+        changed = 0
+        seen = set()
+        with self._lock:
+            for job_id, text in docs:
+                seen.add(job_id)
+                changed += self.update(job_id, text)
+            for job_id in set(self._docs) - seen:
+                self.remove(job_id)
+                changed += 1
+        return changed
+
+    def snapshot(self):
+        """(version, term -> id, {job_id: (term ids, tfs, length)}) under one lock."""
+        with self._lock:
+            docs = {job_id: (ids, tfs, length) for job_id, (_, ids, tfs, length) in self._docs.items()}
+            return self.version, dict(self._terms), docs
+
+
+job_text_index = TermIndex()
+
+
+# -------------------------
+# Compiled BM25 engine
+# -------------------------
+class BM25Engine:
+    """Term x job BM25 weight matrix for one version of a TermIndex."""
+
+    def __init__(self, index: TermIndex, k1: Optional[float] = None, b: Optional[float] = None):
+        k1 = settings.BM25_K1 if k1 is None else k1
+        b = settings.BM25_B if b is None else b
+        self.version, self.columns, docs = index.snapshot()
+        self.job_ids = np.array(sorted(docs), dtype=np.int64)
+        n_jobs, n_terms = len(self.job_ids), len(self.columns)
+        vectors = [docs[j] for j in self.job_ids.tolist()]
+
+        lengths = np.array([length for _, _, length in vectors], dtype=np.float64)
+        avgdl = lengths.mean() if n_jobs and lengths.mean() > 0 else 1.0
+        norm = k1 * (1 - b + b * lengths / avgdl)
+
+        # Stack every job's vector, then group the cells by term (stable, so rows stay sorted)
+        term_ids = np.concatenate([ids for ids, _, _ in vectors]) if vectors else np.zeros(0, dtype=np.int64)
+        tf = np.concatenate([tfs for _, tfs, _ in vectors]) if vectors else np.zeros(0)
+        rows = np.repeat(np.arange(n_jobs, dtype=np.int64), [len(ids) for ids, _, _ in vectors])
+        order = np.argsort(term_ids, kind="stable")
+        self.rows, tf, term_ids = rows[order], tf[order], term_ids[order]
+
+        sizes = np.bincount(term_ids, minlength=n_terms)
+        self.col_ptr = np.zeros(n_terms + 1, dtype=np.int64)
+        np.cumsum(sizes, out=self.col_ptr[1:])
+        # Lucene-style idf: always positive, so common terms just weigh little
+        idf = np.log1p((n_jobs - sizes + 0.5) / (sizes + 0.5))
+        self.values = idf[term_ids] * tf * (k1 + 1) / (tf + norm[self.rows])
+
+    @property
+    def n_jobs(self) -> int:
+        return len(self.job_ids)
+
+    def scores(self, text: str) -> np.ndarray:
+        """Raw BM25 score of ``text`` against every job, in ``job_ids`` order."""
+        cols = sorted({self.columns[t] for t in tokenize(text) if t in self.columns})
+        nnz = [np.arange(self.col_ptr[c], self.col_ptr[c + 1]) for c in cols if self.col_ptr[c + 1] > self.col_ptr[c]]
+        if not nnz:
+            return np.zeros(self.n_jobs)
+        nnz = np.concatenate(nnz)
+        return np.bincount(self.rows[nnz], weights=self.values[nnz], minlength=self.n_jobs)
+
+    def relative_scores(self, text: str, job_ids: np.ndarray) -> np.ndarray:
+        """Scores for ``job_ids`` on a 0-100 scale, relative to the best job in the catalog."""
+        raw = self.scores(text)
+        out = np.zeros(len(job_ids))
+        best = raw.max() if self.n_jobs else 0.0
+        if best <= 0:
+            return out
+        pos = np.searchsorted(self.job_ids, job_ids)
+        known = (pos < self.n_jobs) & (self.job_ids[np.minimum(pos, self.n_jobs - 1)] == job_ids)
+        out[known] = raw[pos[known]] * 100.0 / best
+        return out
+
+    def top(self, text: str, top_k: int = 10) -> List[Tuple[int, float]]:
+        """Best ``top_k`` (job_id, score) pairs by BM25 alone."""
+        raw = self.scores(text)
+        if top_k < self.n_jobs:
+            candidates = np.argpartition(-raw, top_k - 1)[:top_k] if top_k > 0 else np.zeros(0, dtype=np.int64)
+        else:
+            candidates = np.arange(self.n_jobs)
+        order = candidates[np.lexsort((self.job_ids[candidates], -raw[candidates]))]
+        return [(int(self.job_ids[r]), float(raw[r])) for r in order]
+
+
+def blend(skill_score, relevance, weight: Optional[float] = None):
+    """Weighted mix of skill overlap and text relevance (both 0-100); works on arrays too."""
+    weight = settings.RELEVANCE_WEIGHT if weight is None else weight
+    return (1 - weight) * skill_score + weight * relevance
+
+
+# -------------------------
+# Shared engine over the current catalog
+# -------------------------
+_lock = Lock()
+_engine: Optional[BM25Engine] = None
+
+
+def sync_job_texts(session: Session, job_model) -> int:
+    """Re-read job texts from ``job_model``'s table; jobs whose text is unchanged are skipped."""
+    rows = session.exec(
+        select(job_model.id, job_model.title, job_model.description, job_model.requirements)
+    ).all()
+    return job_text_index.sync((job_id, job_document(title, desc, reqs)) for job_id, title, desc, reqs in rows)
+
+
+def get_relevance_engine(session: Session, job_model) -> BM25Engine:
+    """Engine for the current catalog; job texts are re-synced when the skill index changes."""
+    global _engine
+    with _lock:
+        if job_text_index.synced_for != job_skill_index.version:
+            version = job_skill_index.version
+            changed = sync_job_texts(session, job_model)
+            job_text_index.synced_for = version
+            if changed:
+                log.info("Relevance index updated for %d jobs", changed)
+        if _engine is None or _engine.version != job_text_index.version:
+            _engine = BM25Engine(job_text_index)
+    return _engine
+
+
+def _engine_is_current() -> bool:
+    return (
+        _engine is not None
+        and job_text_index.synced_for == job_skill_index.version
+        and _engine.version == job_text_index.version
+    )
+
+
+async def aget_relevance_engine(job_model) -> BM25Engine:
+    """``get_relevance_engine`` for async handlers: the re-sync and rebuild after a catalog
+    change run in the threadpool, so requests arriving meanwhile are not stalled."""
+    if _engine_is_current():
+        return _engine
+
+    def build() -> BM25Engine:
+        with Session(db_engine) as session:
+            return get_relevance_engine(session, job_model)
+
+    return await run_in_threadpool(build)
+
+
+def relevance_for(session: Session, job_model, text: str, job_id: int) -> float:
+    """0-100 relevance of ``text`` to one job, relative to the best job in the catalog."""
+    return _relevance(get_relevance_engine(session, job_model), text, job_id)
+
+
+async def arelevance_for(job_model, text: str, job_id: int) -> float:
+    """Async ``relevance_for``; see ``aget_relevance_engine``."""
+    return _relevance(await aget_relevance_engine(job_model), text, job_id)
+
+
+def _relevance(engine: BM25Engine, text: str, job_id: int) -> float:
+    return round(float(engine.relative_scores(text, np.array([job_id], dtype=np.int64))[0]), 2)
@@ -0,0 +1,214 @@
+# skillmatcher/services/render_cache.py
+"""Rendered improved-resume downloads, served from memory.
+
+Each (resume id, content version, format) is rendered once and kept in a
+size-bounded LRU (``RENDER_CACHE_BYTES``), so repeat downloads are a dict
+lookup plus a slice. The content version is a hash of the improved resume
+text, so an edited resume never serves a stale rendering. TXT is encoded
+inline; DOCX and PDF are built in the CPU worker pool, off the event loop.
+Responses carry an ETag (304 on If-None-Match) and honour single byte
+ranges.
+"""
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, NamedTuple, Optional, Tuple
+import hashlib
+import io
+import re
+
+from fastapi import HTTPException, Request, Response
+
+from app.core.config import settings
+from app.services.catalog_cache import not_modified
+from app.services.workers import cpu_pool
+
+MEDIA_TYPES = {
+    "txt": "text/plain; charset=utf-8",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "pdf": "application/pdf",
+}
+# python-docx stamps zip entries with the current time, so DOCX bytes differ between renders
+DETERMINISTIC = {"txt", "pdf"}
+
+
+# -------------------------
+# Renderers (module-level so the worker pool can pickle them)
+# -------------------------
+def _pdf_escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _wrap(line: str, width: int):
+    while len(line) > width:
+        cut = line.rfind(" ", 0, width)
+        cut = cut if cut > 0 else width
+        yield line[:cut]
+        line = line[cut:].lstrip()
+    yield line
+
+
+def render_pdf(text: str, lines_per_page: int = 56, width: int = 95) -> bytes:
+    """Plain text as a minimal multi-page PDF (10pt Helvetica, A4)."""
+    lines = [part for line in text.split("\n") for part in _wrap(line, width)]
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+
+    # 1: catalog, 2: page tree, 3: font, then (page, content) pairs
+    kids = " ".join(f"{4 + 2 * i} 0 R" for i in range(len(pages)))
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    for i, page in enumerate(pages):
+        body = ["BT", "/F1 10 Tf", "14 TL", "50 800 Td"] + [f"({_pdf_escape(line)}) Tj T*" for line in page] + ["ET"]
+        # WinAnsi (cp1252) covers bullets and dashes; characters outside it (emoji) are dropped
+        stream = "\n".join(body).encode("cp1252", "ignore")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Resources << /Font << /F1 3 0 R >> >> "
+            f"/Contents {5 + 2 * i} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + obj + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % off for off in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def render_docx(text: str) -> bytes:
+    import docx
+
+    document = docx.Document()
+    for line in text.split("\n"):
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+RENDERERS = {"docx": render_docx, "pdf": render_pdf}
+
+
+# -------------------------
+# Cache
+# -------------------------
+class Rendered(NamedTuple):
+    body: bytes
+    etag: str
+    media_type: str
+
+
+class RenderCache:
+    """LRU of rendered downloads, bounded by total bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[int, str, str], Rendered]" = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[int, str, str]) -> Optional[Rendered]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Tuple[int, str, str], entry: Rendered) -> None:
+        if len(entry.body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old.body)
+            self._entries[key] = entry
+            self._size += len(entry.body)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.body)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._size, "hits": self.hits, "misses": self.misses}
+
+
+render_cache = RenderCache(settings.RENDER_CACHE_BYTES)
+
+
+def content_version(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+async def rendered(resume_id: int, text: str, fmt: str) -> Rendered:
+    """``text`` rendered as ``fmt``, from the cache when this version was rendered before."""
+    version = content_version(text)
+    key = (resume_id, version, fmt)
+    entry = render_cache.get(key)
+    if entry is not None:
+        return entry
+    body = text.encode("utf-8") if fmt == "txt" else await cpu_pool.run(RENDERERS[fmt], text)
+    etag = f'"resume-{resume_id}-{version}.{fmt}"'
+    entry = Rendered(body, etag if fmt in DETERMINISTIC else f"W/{etag}", MEDIA_TYPES[fmt])
+    render_cache.put(key, entry)
+    return entry
+
+
+# -------------------------
+# HTTP
+# -------------------------
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def byte_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """(start, end inclusive) for a single-range header; None means send everything."""
+    if not header:
+        return None
+    match = _RANGE.match(header.strip())
+    if match is None:
+        return None  # multiple or non-byte ranges: ignored, full response
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:  # suffix: the last N bytes
+        start, end = max(0, size - int(last)), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise HTTPException(status_code=416, detail="Requested range not satisfiable",
+                            headers={"Content-Range": f"bytes */{size}"})
+    return start, end
+
+
+def download_response(request: Request, entry: Rendered, filename: str) -> Response:
+    """200, 206 or 304 for a rendered download, straight from memory."""
+    headers = {
+        "ETag": entry.etag,
+        "Accept-Ranges": "bytes",
+        "Cache-Control": "private, no-cache",
+        "Content-Disposition": f'attachment; filename="{filename}"',
+    }
+    if not_modified(request, entry.etag):
+        return Response(status_code=304, headers=headers)
+
+    size = len(entry.body)
+    if_range = request.headers.get("if-range")
+    # If-Range only matches a strong ETag: the client must hold exactly these bytes
+    honour = if_range is None or (if_range == entry.etag and not entry.etag.startswith("W/"))
+    ranged = byte_range(request.headers.get("range"), size) if honour else None
+    if ranged is None:
+        return Response(content=entry.body, media_type=entry.media_type, headers=headers)
+    start, end = ranged
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return Response(content=entry.body[start:end + 1], status_code=206, media_type=entry.media_type, headers=headers)
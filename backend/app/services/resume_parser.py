@@ -1,14 +1,11 @@
-import pdfplumber
-from docx import Document
+from app.services.pdf_extract import extract_pdf_text
 
 def extract_text_from_pdf(file_path: str) -> str:
-    text = ""
-    with pdfplumber.open(file_path) as pdf:
-        for page in pdf.pages:
-            text += page.extract_text() or ""
-    return text.lower()
+    return extract_pdf_text(file_path).lower()
 
 def extract_text_from_docx(file_path: str) -> str:
+    from docx import Document
+
     doc = Document(file_path)
     text = "\n".join([para.text for para in doc.paragraphs])
     return text.lower()
@@ -0,0 +1,173 @@
+# skillmatcher/services/scoring.py
+"""Vectorized resume -> job ranking.
+
+The catalog is kept as a sparse job x skill weight matrix in column form
+(one slice of job rows per skill), rebuilt from the skill index whenever the
+catalog changes. Scoring a resume gathers the columns of the skills it has
+and reduces them with a single ``bincount``, so the cost is proportional to
+the number of postings touched, and top-k uses a partial sort. An optional
+per-job relevance vector (see ``relevance``) is blended in before ranking.
+
+Skills weigh 1 unless ``SKILL_WEIGHTS`` says otherwise. Jobs without any
+skills are only in the skill index's snapshot if they were indexed in this
+process, so callers pass the catalog's job ids and such jobs rank with a
+skill score of 0.
+"""
+from threading import Lock
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.relevance import blend
+from app.services.skill_index import SkillIndex, job_skill_index, normalize_skill
+
+
+class JobScore(NamedTuple):
+    job_id: int
+    score: float  # weighted % of the job's skills present in the resume, blended with relevance if given
+    matched: int
+    total: int
+    relevance: float = 0.0  # 0-100 text relevance, when ranking with one
+
+
+class ScoringEngine:
+    """Precomputed job x skill matrix for one version of the skill index."""
+
+    def __init__(
+        self, index: SkillIndex, weights: Optional[Dict[str, float]] = None, job_ids: Optional[np.ndarray] = None
+    ):
+        weights = {normalize_skill(k): v for k, v in (weights or {}).items()}
+        self.version, by_skill, indexed_ids = index.snapshot()
+        vocabulary = sorted(by_skill)
+        # The catalog ids this engine was built for (None: only the indexed jobs)
+        self.catalog_ids = job_ids
+        self.job_ids = np.array(indexed_ids, dtype=np.int64)
+        if job_ids is not None:
+            self.job_ids = np.union1d(self.job_ids, np.asarray(job_ids, dtype=np.int64))
+        postings = [np.asarray(by_skill[skill], dtype=np.int64) for skill in vocabulary]
+
+        self.columns = {skill: i for i, skill in enumerate(vocabulary)}
+        sizes = np.array([len(p) for p in postings], dtype=np.int64)
+        self.col_ptr = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        np.cumsum(sizes, out=self.col_ptr[1:])
+        all_ids = np.concatenate(postings) if postings else np.zeros(0, dtype=np.int64)
+        self.rows = np.searchsorted(self.job_ids, all_ids)
+        self.col_weight = np.array([weights.get(s, 1.0) for s in vocabulary], dtype=np.float64)
+        self.values = np.repeat(self.col_weight, sizes)
+
+        n_jobs = len(self.job_ids)
+        self.job_total = np.bincount(self.rows, weights=self.values, minlength=n_jobs)
+        self.job_count = np.bincount(self.rows, minlength=n_jobs)
+
+    @property
+    def n_jobs(self) -> int:
+        return len(self.job_ids)
+
+    def _columns_for(self, skills: Iterable[str]) -> List[int]:
+        cols = {self.columns.get(normalize_skill(s)) for s in skills}
+        cols.discard(None)
+        return sorted(cols)
+
+    def _gather(self, cols: Sequence[int]):
+        if not cols:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+        slices = [np.arange(self.col_ptr[c], self.col_ptr[c + 1]) for c in cols]
+        nnz = np.concatenate(slices)
+        return self.rows[nnz], self.values[nnz]
+
+    def _top(
+        self, weighted: np.ndarray, counts: np.ndarray, top_k: Optional[int], relevance: Optional[np.ndarray] = None
+    ) -> List[JobScore]:
+        scores = np.divide(weighted * 100.0, self.job_total, out=np.zeros(self.n_jobs), where=self.job_total > 0)
+        if relevance is not None:
+            scores = blend(scores, relevance)
+        else:
+            relevance = np.zeros(self.n_jobs)
+        if top_k is not None and top_k < self.n_jobs:
+            if top_k <= 0:
+                return []
+            candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            candidates = np.arange(self.n_jobs)
+        # Highest score first, ties broken by job id
+        order = candidates[np.lexsort((self.job_ids[candidates], -scores[candidates]))]
+        return [
+            JobScore(
+                int(self.job_ids[r]), round(float(scores[r]), 2), int(counts[r]), int(self.job_count[r]),
+                round(float(relevance[r]), 2),
+            )
+            for r in order
+        ]
+
+    def rank(
+        self, skills: Iterable[str], top_k: Optional[int] = 10, relevance: Optional[np.ndarray] = None
+    ) -> List[JobScore]:
+        """Score one resume's skills against every job; ``top_k=None`` ranks all.
+
+        ``relevance`` holds a 0-100 score per job in ``job_ids`` order, e.g.
+        ``BM25Engine.relative_scores(text, engine.job_ids)``.
+        """
+        rows, vals = self._gather(self._columns_for(skills))
+        weighted = np.bincount(rows, weights=vals, minlength=self.n_jobs)
+        counts = np.bincount(rows, minlength=self.n_jobs)
+        return self._top(weighted, counts, top_k, relevance)
+
+    def rank_batch(
+        self,
+        skill_sets: Sequence[Iterable[str]],
+        top_k: Optional[int] = 10,
+        relevance: Optional[Sequence[np.ndarray]] = None,
+        chunk_size: int = 64,
+    ) -> List[List[JobScore]]:
+        """Rank many resumes; each chunk is reduced with one bincount over resume x job cells.
+
+        ``relevance`` holds one per-job vector per resume, as for ``rank``.
+        """
+        n = self.n_jobs
+        results: List[List[JobScore]] = []
+        for start in range(0, len(skill_sets), chunk_size):
+            chunk = skill_sets[start:start + chunk_size]
+            rows, vals = [], []
+            for offset, skills in enumerate(chunk):
+                r, v = self._gather(self._columns_for(skills))
+                rows.append(r + offset * n)
+                vals.append(v)
+            flat_rows = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+            size = len(chunk) * n
+            weighted = np.bincount(flat_rows, weights=np.concatenate(vals), minlength=size).reshape(len(chunk), n)
+            counts = np.bincount(flat_rows, minlength=size).reshape(len(chunk), n)
+            results.extend(
+                self._top(weighted[i], counts[i], top_k, None if relevance is None else relevance[start + i])
+                for i in range(len(chunk))
+            )
+        return results
+
+
+# -------------------------
+# Shared engine over the current catalog
+# -------------------------
+_lock = Lock()
+_engine: Optional[ScoringEngine] = None
+
+
+def _is_current(engine: Optional[ScoringEngine], job_ids: Optional[np.ndarray]) -> bool:
+    if engine is None or engine.version != job_skill_index.version:
+        return False
+    if job_ids is None or engine.catalog_ids is job_ids:
+        return True
+    return engine.catalog_ids is not None and np.array_equal(engine.catalog_ids, job_ids)
+
+
+def get_scoring_engine(job_ids: Optional[np.ndarray] = None) -> ScoringEngine:
+    """Engine for the current skill index and ``SKILL_WEIGHTS``, rebuilt when the catalog changes.
+
+    ``job_ids`` is every job in the catalog (e.g. ``BM25Engine.job_ids``), so
+    jobs without skills are ranked too.
+    """
+    global _engine
+    if not _is_current(_engine, job_ids):
+        with _lock:
+            if not _is_current(_engine, job_ids):
+                _engine = ScoringEngine(job_skill_index, settings.SKILL_WEIGHTS, job_ids)
+    return _engine
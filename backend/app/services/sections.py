@@ -0,0 +1,111 @@
+# skillmatcher/services/sections.py
+"""Single-pass resume sectionizer.
+
+``sectionize`` walks the extracted text once. Each line is stripped and
+lowercased a single time, then checked against one heading table (dict
+lookups, also for "Skills: ..." inline headings) and a short list of keyword
+substrings. Per-line regex scans cost more than the rest of the walk put
+together, so there are none. The result has two parts:
+
+* ``blocks``: lines grouped under the heading they appear below (skills,
+  experience, education, projects, summary for anything before the first
+  heading, other for unrecognised headings such as certifications);
+* ``mentions``: lines that mention skills, experience or education
+  anywhere in the document, which is what the improved resume is built from.
+
+The structure is stored on the resume row (``Resume.sections``) so later
+readers (improved resume, re-analysis) reuse it instead of re-scanning the
+text. Bump ``SECTIONS_VERSION`` when the output changes; older stored
+structures are then recomputed on first use.
+"""
+from typing import Dict, List, NamedTuple, Optional
+import json
+import re
+
+SECTIONS_VERSION = 1
+
+BLOCKS = ("summary", "skills", "experience", "education", "projects", "other")
+MENTIONS = ("skills", "experience", "education")
+
+_HEADINGS = {
+    "summary": ("summary", "professional summary", "profile", "objective", "career objective", "about me"),
+    "skills": (
+        "skills", "technical skills", "key skills", "core skills", "skills & competencies",
+        "core competencies", "competencies", "technologies", "tech stack", "tools",
+    ),
+    "experience": (
+        "experience", "work experience", "professional experience", "employment", "employment history",
+        "work history", "internship", "internships",
+    ),
+    "education": ("education", "academic background", "academics", "qualifications", "educational qualifications"),
+    "projects": ("projects", "personal projects", "academic projects", "key projects"),
+    "other": (
+        "certifications", "certificates", "awards", "achievements", "languages", "interests", "hobbies",
+        "publications", "references", "activities", "volunteering",
+    ),
+}
+_HEADING_OF: Dict[str, str] = {alias: block for block, aliases in _HEADINGS.items() for alias in aliases}
+
+# "Skills: Python, SQL" opens the skills block and keeps the rest as content.
+# No heading contains these characters, so the text before the first one is the candidate heading.
+_INLINE_SEPARATOR = re.compile(r"[:\-–|]")
+_DECORATION = " \t:-–—•*#|=_"
+
+# Substrings that make a line a mention of each kind
+_MENTION_WORDS = (
+    ("skills", ("skill",)),
+    ("experience", ("experience", "responsibility", "developed", "managed", "project", "intern")),
+    ("education", ("bachelor", "master", "degree")),
+)
+
+
+class ResumeSections(NamedTuple):
+    blocks: Dict[str, List[str]]
+    mentions: Dict[str, List[str]]
+
+    def to_dict(self) -> dict:
+        return {"version": SECTIONS_VERSION, "blocks": self.blocks, "mentions": self.mentions}
+
+    @classmethod
+    def from_dict(cls, data) -> Optional["ResumeSections"]:
+        """The stored structure, or None when missing or from another SECTIONS_VERSION."""
+        if isinstance(data, str):
+            data = json.loads(data)
+        if not data or data.get("version") != SECTIONS_VERSION:
+            return None
+        return cls(data["blocks"], data["mentions"])
+
+
+def sectionize(text: str) -> ResumeSections:
+    blocks: Dict[str, List[str]] = {name: [] for name in BLOCKS}
+    mentions: Dict[str, List[str]] = {name: [] for name in MENTIONS}
+    current = blocks["summary"]
+
+    for raw in (text or "").split("\n"):
+        line = raw.strip()
+        if not line:
+            continue
+        low = line.lower()
+
+        # A heading on its own line switches block and is not content
+        if len(low) <= 40:
+            block = _HEADING_OF.get(low.strip(_DECORATION))
+            if block is not None:
+                current = blocks[block]
+                continue
+        separator = _INLINE_SEPARATOR.search(low)
+        block = _HEADING_OF.get(low[:separator.start()].rstrip()) if separator is not None else None
+        content = line[separator.end():].lstrip() if block is not None else ""
+        if content:
+            current = blocks[block]
+            current.append(content)
+        else:
+            current.append(line)
+
+        for kind, words in _MENTION_WORDS:
+            for word in words:
+                if word in low:
+                    mentions[kind].append(line)
+                    break
+
+    return ResumeSections(blocks, mentions)
@@ -1,6 +1,8 @@
 from sqlmodel import Session, select
 from ..db.session import engine
 from ..db.models import Job
+from .skill_index import index_jobs
+from .catalog_cache import bump_catalog_version
 
 DEFAULT_JOBS = [
     {"title":"Frontend Developer", "description":"Build UI with React/HTML/CSS", "required_skills":["javascript","react","html","css"]},
@@ -12,14 +14,14 @@ DEFAULT_JOBS = [
 def seed_default_jobs():
     """Insert default jobs if Job table is empty."""
     with Session(engine) as session:
-        existing = session.exec(select(Job)).all()
-        if existing:
+        if session.exec(select(Job.id).limit(1)).first() is not None:
             return
-        for j in DEFAULT_JOBS:
-            job = Job(
-                title=j["title"],
-                description=j["description"],
-                required_skills=j["required_skills"]
-            )
-            session.add(job)
+        jobs = [
+            Job(title=j["title"], description=j["description"], required_skills=j["required_skills"])
+            for j in DEFAULT_JOBS
+        ]
+        session.add_all(jobs)
+        session.flush()
+        index_jobs(session, [(job.id, job.required_skills) for job in jobs])
+        bump_catalog_version(session)
         session.commit()
@@ -0,0 +1,167 @@
+# skillmatcher/services/skill_extractor.py
+"""Single-pass multi-pattern skill extraction (Aho-Corasick).
+
+The automaton is compiled once from the skill vocabulary and scans resume text
+in one pass, so the cost depends on the text length only, not on how many
+skills or jobs are in the catalog. With a vocabulary attached, every hit is
+expanded to all equivalent forms of the skill and the remaining words are
+run through its fuzzy (trigram) lookup, so "JS" and "kubernets" both count.
+"""
+from collections import deque
+import hashlib
+import re
+from threading import Lock
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from app.services.skill_index import job_skill_index, normalize_skill
+from app.services.skill_vocabulary import SkillVocabulary
+
+# Skills worth detecting even when no job in the catalog asks for them yet
+COMMON_SKILLS = [
+    "python", "react", "javascript", "sql", "html", "css", "java",
+    "communication", "leadership", "data analysis", "machine learning",
+    "tailwind", "typescript", "redux",
+]
+
+
+class SkillHit(NamedTuple):
+    skill: str  # normalized skill
+    start: int  # offsets into the original text
+    end: int
+
+
+# Candidate words for fuzzy lookup: "kubernets", "node.js", "c++"
+_TOKEN = re.compile(r"[a-z][a-z0-9+#]*(?:[.-][a-z0-9+#]+)*")
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class SkillExtractor:
+    """Aho-Corasick automaton over normalized (lowercase, single-spaced) skills."""
+
+    def __init__(self, skills: Iterable[str], vocabulary: Optional[SkillVocabulary] = None):
+        self.vocabulary = vocabulary
+        patterns = {n for n in map(normalize_skill, skills) if n}
+        if vocabulary is not None:
+            patterns.update(vocabulary.surfaces)
+        self.patterns: List[str] = sorted(patterns)
+        # Identifies the vocabulary so cached extraction results can be validated
+        signature = "\n".join(self.patterns) + (f"\n{vocabulary.fingerprint}" if vocabulary else "")
+        self.fingerprint = hashlib.sha1(signature.encode("utf-8")).hexdigest()
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        for idx, pattern in enumerate(self.patterns):
+            self._insert(idx, pattern)
+        self._link()
+
+    def _insert(self, idx: int, pattern: str) -> None:
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(idx)
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find_all(self, text: str) -> List[SkillHit]:
+        """All whole-word skill occurrences in ``text``, in order of their end offset."""
+        if not text or not self.patterns:
+            return []
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # A few code points change length when lowercased; keep offsets aligned
+            lowered = "".join(ch.lower()[:1] for ch in text)
+
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        hits: List[SkillHit] = []
+        # Original offset of every character fed to the automaton; runs of
+        # whitespace are fed as a single space so "data\n  analysis" matches.
+        fed: List[int] = []
+        fed_chars: List[str] = []
+        state = 0
+        size = len(lowered)
+        for i, ch in enumerate(lowered):
+            if ch.isspace():
+                if fed_chars and fed_chars[-1] == " ":
+                    continue
+                ch = " "
+            fed.append(i)
+            fed_chars.append(ch)
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+            after_ok = i + 1 >= size or not _is_word_char(lowered[i + 1])
+            for idx in out[state]:
+                pattern = patterns[idx]
+                first = len(fed) - len(pattern)
+                before_ok = first == 0 or not _is_word_char(fed_chars[first - 1])
+                # Boundaries only matter where the pattern itself starts/ends on a word char
+                if (before_ok or not _is_word_char(pattern[0])) and (after_ok or not _is_word_char(pattern[-1])):
+                    hits.append(SkillHit(pattern, fed[first], i + 1))
+        return hits
+
+    def extract(self, text: str) -> List[str]:
+        """Distinct normalized skills found in ``text``, in order of first appearance.
+
+        With a vocabulary, exact hits (and their equivalents) come first,
+        followed by skills only reached through fuzzy lookup.
+        """
+        vocabulary = self.vocabulary
+        seen: Dict[str, None] = {}
+        for hit in self.find_all(text):
+            if vocabulary is None:
+                seen.setdefault(hit.skill, None)
+                continue
+            for form in vocabulary.equivalents(hit.skill):
+                seen.setdefault(form, None)
+        if vocabulary is not None and text:
+            for token in dict.fromkeys(_TOKEN.findall(text.lower())):
+                if token in seen:
+                    continue
+                match = vocabulary.fuzzy(token)
+                if match is not None:
+                    for form in vocabulary.equivalents(match):
+                        seen.setdefault(form, None)
+        return list(seen)
+
+
+# -------------------------
+# Shared extractor over the catalog vocabulary
+# -------------------------
+_lock = Lock()
+_extractor: Optional[SkillExtractor] = None
+_built_for: Optional[int] = None
+
+
+def get_extractor() -> SkillExtractor:
+    """Extractor for COMMON_SKILLS plus every catalog skill, rebuilt when the index changes."""
+    global _extractor, _built_for
+    version = job_skill_index.version
+    if _extractor is None or _built_for != version:
+        with _lock:
+            if _extractor is None or _built_for != version:
+                skills = COMMON_SKILLS + job_skill_index.vocabulary()
+                _extractor = SkillExtractor(skills, SkillVocabulary(skills))
+                _built_for = version
+    return _extractor
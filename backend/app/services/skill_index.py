@@ -0,0 +1,294 @@
+# skillmatcher/services/skill_index.py
+"""Skill -> job inverted index.
+
+The ``job_skill`` table is the durable, normalized copy of every job's skill
+list; ``job_skill_index`` is the in-process posting-list cache built from it.
+Both are updated through ``index_job`` / ``unindex_job`` so filtering never
+has to scan or decode the ``job`` table: the rows are staged in the caller's
+session and the cache follows once that session commits (``on_commit``), so
+a rolled-back write never shows up in it. ``SkillIndex`` itself works
+over any (id, skill) table; resumes use it too (see ``candidates``).
+"""
+from bisect import bisect_left, insort
+from heapq import merge, nlargest
+from threading import RLock
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import json
+import logging
+
+from sqlalchemy import event
+from sqlmodel import SQLModel, Field, Session, select, delete
+
+from app.db.bulk import insert_many
+
+log = logging.getLogger(__name__)
+
+
+class JobSkill(SQLModel, table=True):
+    __tablename__ = "job_skill"
+
+    job_id: int = Field(primary_key=True)
+    skill: str = Field(primary_key=True, index=True)
+
+
+def normalize_skill(skill: str) -> str:
+    return " ".join((skill or "").lower().split())
+
+
+def decode_skills(value) -> List[str]:
+    """Job skills are stored either as a JSON string or a JSON column."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = json.loads(value)
+    return list(value)
+
+
+class SkillIndex:
+    """Sorted posting lists of job ids keyed by normalized skill."""
+
+    def __init__(self, id_column=None, skill_column=None):
+        # Columns of the durable (id, skill) table this index is loaded from
+        self._id_column = JobSkill.job_id if id_column is None else id_column
+        self._skill_column = JobSkill.skill if skill_column is None else skill_column
+        self._postings: Dict[str, List[int]] = {}
+        self._job_skills: Dict[int, List[str]] = {}
+        self._lock = RLock()
+        self.loaded = False
+        # Bumped on every change so derived structures know when to rebuild
+        self.version = 0
+        # Highest id loaded from the table; see catch_up
+        self.high_water = 0
+
+    # -------------------------
+    # Maintenance
+    # -------------------------
+    def load(self, session: Session) -> None:
+        # Streamed in id order (the primary key), so posting lists come out sorted;
+        # a Core query on the connection skips the ORM row loader
+        rows = session.connection().execute(
+            select(self._id_column, self._skill_column).order_by(self._id_column).execution_options(yield_per=10_000)
+        )
+        postings: Dict[str, List[int]] = {}
+        job_skills: Dict[int, List[str]] = {}
+        for job_id, skill in rows:
+            postings.setdefault(skill, []).append(job_id)
+            job_skills.setdefault(job_id, []).append(skill)
+        with self._lock:
+            self._postings = postings
+            self._job_skills = job_skills
+            self.loaded = True
+            self.version += 1
+            self.high_water = max(job_skills, default=0)
+        log.info("Skill index loaded: %d skills, %d ids", len(postings), len(job_skills))
+
+    def ensure_loaded(self, session: Session) -> None:
+        if not self.loaded:
+            self.load(session)
+
+    def catch_up(self, session: Session, overlap: int = 0) -> int:
+        """Add rows written by other processes since the last load; returns ids added.
+
+        Only for append-mostly tables with increasing ids. ``overlap`` re-reads
+        that many ids below the high-water mark, for inserts committed out of
+        order; ids already present are left alone.
+        """
+        if not self.loaded:
+            self.load(session)
+            return 0
+        rows = session.connection().execute(
+            select(self._id_column, self._skill_column).where(self._id_column > self.high_water - overlap)
+        ).all()
+        fresh: Dict[int, List[str]] = {}
+        for item_id, skill in rows:
+            if item_id not in self._job_skills:
+                fresh.setdefault(item_id, []).append(skill)
+        for item_id, skills in fresh.items():
+            self.add(item_id, skills)
+        return len(fresh)
+
+    def add(self, job_id: int, skills: Iterable[str]) -> None:
+        with self._lock:
+            self._discard(job_id)
+            normalized = sorted({n for n in map(normalize_skill, skills) if n})
+            for skill in normalized:
+                insort(self._postings.setdefault(skill, []), job_id)
+            self._job_skills[job_id] = normalized
+            self.high_water = max(self.high_water, job_id)
+            self.version += 1
+
+    def remove(self, job_id: int) -> None:
+        with self._lock:
+            self._discard(job_id)
+            self.version += 1
+
+    def _discard(self, job_id: int) -> None:
+        # Caller holds the lock and bumps the version
+        for skill in self._job_skills.pop(job_id, []):
+            ids = self._postings.get(skill)
+            if not ids:
+                continue
+            pos = bisect_left(ids, job_id)
+            if pos < len(ids) and ids[pos] == job_id:
+                del ids[pos]
+            if not ids:
+                del self._postings[skill]
+
+    # -------------------------
+    # Queries
+    # -------------------------
+    def postings(self, skill: str) -> List[int]:
+        return self._postings.get(normalize_skill(skill), [])
+
+    def skills_for(self, job_id: int) -> List[str]:
+        return self._job_skills.get(job_id, [])
+
+    def vocabulary(self) -> List[str]:
+        with self._lock:
+            return list(self._postings)
+
+    def snapshot(self) -> Tuple[int, Dict[str, List[int]], List[int]]:
+        """Consistent copy of (version, postings, sorted job ids) for derived structures."""
+        with self._lock:
+            postings = {skill: list(ids) for skill, ids in self._postings.items()}
+            return self.version, postings, sorted(self._job_skills)
+
+    def match(self, skills: Iterable[str], mode: str = "all") -> List[int]:
+        """Return sorted job ids having all (or any) of ``skills``."""
+        with self._lock:
+            lists = [self.postings(s) for s in {normalize_skill(s) for s in skills} if s]
+            if not lists:
+                return []
+            if mode == "any":
+                result: List[int] = []
+                for job_id in merge(*lists):
+                    if not result or result[-1] != job_id:
+                        result.append(job_id)
+                return result
+
+            # AND: walk the shortest list and probe the others by bisection,
+            # so the cost tracks the rarest skill rather than the catalog.
+            lists.sort(key=len)
+            smallest, others = lists[0], lists[1:]
+            result = []
+            for job_id in smallest:
+                for ids in others:
+                    pos = bisect_left(ids, job_id)
+                    if pos == len(ids) or ids[pos] != job_id:
+                        break
+                else:
+                    result.append(job_id)
+            return result
+
+    def rank(self, requirements: Iterable[Iterable[str]], top_k: int) -> List[Tuple[int, int]]:
+        """The ``top_k`` ids meeting the most requirements, as (id, requirements met).
+
+        Each requirement is a group of equivalent skill spellings. Only ids in
+        the posting lists of those skills are counted, and a bounded heap keeps
+        the best ones, so the cost follows the postings, not the index size.
+        Ties go to the lower id.
+        """
+        counts: Dict[int, int] = {}
+        with self._lock:
+            for group in requirements:
+                lists = [self._postings.get(s, []) for s in {normalize_skill(s) for s in group} if s]
+                ids = lists[0] if len(lists) == 1 else set().union(*lists)
+                for item_id in ids:
+                    counts[item_id] = counts.get(item_id, 0) + 1
+        return nlargest(top_k, counts.items(), key=lambda kv: (kv[1], -kv[0]))
+
+    def query(
+        self, skills: Iterable[str], mode: str = "all", skip: int = 0, limit: Optional[int] = 50
+    ) -> Tuple[int, List[int]]:
+        """Paginated ``match``: returns (total matches, ids of the requested page)."""
+        ids = self.match(skills, mode)
+        end = None if limit is None else skip + limit
+        return len(ids), ids[skip:end]
+
+
+job_skill_index = SkillIndex()
+
+
+# -------------------------
+# Commit hooks
+# -------------------------
+_ON_COMMIT = "skill_index.on_commit"
+
+
+def on_commit(session: Session, fn: Callable[[], None]) -> None:
+    """Run ``fn`` once ``session`` commits; dropped if it rolls back or closes instead."""
+    session.info.setdefault(_ON_COMMIT, []).append(fn)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_on_commit(session) -> None:
+    for fn in session.info.pop(_ON_COMMIT, ()):
+        fn()
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _drop_on_commit(session, transaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(_ON_COMMIT, None)
+
+
+# -------------------------
+# Write-through helpers
+# -------------------------
+def index_job(session: Session, job_id: int, skills: Iterable[str]) -> None:
+    """Replace the job_skill rows for a job; the in-process index follows on commit."""
+    skills = list(skills)
+    session.exec(delete(JobSkill).where(JobSkill.job_id == job_id))
+    for skill in {n for n in map(normalize_skill, skills) if n}:
+        session.add(JobSkill(job_id=job_id, skill=skill))
+    on_commit(session, lambda: job_skill_index.add(job_id, skills))
+
+
+def write_job_skills(session: Session, jobs: Iterable[Tuple[int, Iterable[str]]], chunk: int = 500) -> int:
+    """Replace the job_skill rows of many jobs: one delete and one multi-row insert per ``chunk``.
+
+    Only the table is written; the in-process index is left to the caller
+    (``index_jobs``, or one ``job_skill_index.load`` after a bulk import).
+    """
+    jobs = [(job_id, list(skills)) for job_id, skills in jobs]
+    for start in range(0, len(jobs), chunk):
+        part = jobs[start:start + chunk]
+        session.exec(delete(JobSkill).where(JobSkill.job_id.in_([job_id for job_id, _ in part])))
+        insert_many(session, JobSkill.__table__, ("job_id", "skill"), [
+            (job_id, skill)
+            for job_id, skills in part
+            for skill in {n for n in map(normalize_skill, skills) if n}
+        ])
+    return len(jobs)
+
+
+def index_jobs(session: Session, jobs: Iterable[Tuple[int, Iterable[str]]]) -> int:
+    """Bulk ``index_job``."""
+    jobs = [(job_id, list(skills)) for job_id, skills in jobs]
+    write_job_skills(session, jobs)
+
+    def apply() -> None:
+        for job_id, skills in jobs:
+            job_skill_index.add(job_id, skills)
+
+    on_commit(session, apply)
+    return len(jobs)
+
+
+def unindex_job(session: Session, job_id: int) -> None:
+    session.exec(delete(JobSkill).where(JobSkill.job_id == job_id))
+    on_commit(session, lambda: job_skill_index.remove(job_id))
+
+
+def backfill(session: Session, jobs: Iterable[Tuple[int, object]]) -> int:
+    """Index any (job_id, skills) pairs missing from job_skill; returns count added."""
+    indexed = set(session.exec(select(JobSkill.job_id).distinct()).all())
+    added = 0
+    for job_id, skills in jobs:
+        if job_id not in indexed:
+            index_job(session, job_id, decode_skills(skills))
+            added += 1
+    if added:
+        session.commit()
+        log.info("Backfilled skill index for %d jobs", added)
+    return added
@@ -1,5 +1,3 @@
-from difflib import SequenceMatcher
-
 def match_skills(resume_text: str, job_skills: list[str]) -> dict:
     matched = []
     missing = []
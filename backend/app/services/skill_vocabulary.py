@@ -0,0 +1,163 @@
+# skillmatcher/services/skill_vocabulary.py
+"""Canonical skill vocabulary: aliases plus fuzzy lookup over a trigram index.
+
+Every known surface form ("js", "javascript", "ecmascript") maps to one
+canonical skill, and all forms of a skill are treated as equivalent when
+matching. Misspelled or inflected tokens ("kubernets", "firewall") are
+resolved through a character-trigram index: a lookup only visits the terms
+sharing at least one trigram with the token, so its cost depends on those
+posting lists rather than on the size of the vocabulary.
+"""
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import hashlib
+
+from app.core.config import settings
+from app.services.skill_index import normalize_skill
+
+# canonical skill -> other ways resumes and job posts write it
+SKILL_ALIASES: Dict[str, List[str]] = {
+    "javascript": ["js", "ecmascript", "es6"],
+    "typescript": ["ts"],
+    "tailwind css": ["tailwind", "tailwindcss"],
+    "rest apis": ["rest api", "restful api", "restful apis", "api", "apis"],
+    "node.js": ["node", "nodejs", "node js"],
+    "react": ["react.js", "reactjs", "react js"],
+    "react native": ["react-native"],
+    "web3.js": ["web3", "web3js"],
+    "html": ["html5"],
+    "css": ["css3"],
+    "c++": ["cpp"],
+    "machine learning": ["ml"],
+    "ai": ["artificial intelligence"],
+    "nlp": ["natural language processing"],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "pytorch": ["torch"],
+    "tensorflow": ["tensor flow"],
+    "power bi": ["powerbi"],
+    "ci/cd": ["ci cd", "cicd", "continuous integration", "continuous delivery", "continuous deployment"],
+    "kubernetes": ["k8s"],
+    "aws": ["amazon web services"],
+    "azure": ["microsoft azure"],
+    "postgresql": ["postgres"],
+    "git": ["github", "gitlab"],
+    "excel": ["microsoft excel", "ms excel"],
+    "firewalls": ["firewall"],
+    "penetration testing": ["pentesting", "pen testing", "pentest"],
+    "test automation": ["automated testing", "automation testing"],
+    "data visualization": ["data visualisation"],
+    "data pipelines": ["data pipeline"],
+    "smart contracts": ["smart contract"],
+    "wireframing": ["wireframes", "wireframe"],
+    "etl": ["extract transform load"],
+    "iam": ["identity and access management"],
+    "siem": ["security information and event management"],
+    "ids/ips": ["intrusion detection"],
+}
+
+# Shorter tokens are too ambiguous to correct ("sq" -> "sql"?)
+MIN_FUZZY_LENGTH = 4
+# Cap on remembered token lookups per vocabulary
+FUZZY_CACHE_SIZE = 50_000
+
+
+def trigrams(term: str) -> Set[str]:
+    """Character trigrams of ``term``, padded so short words still get a few."""
+    padded = f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """Inverted index from trigram to term ids, scored with the Dice coefficient."""
+
+    def __init__(self, terms: Iterable[str]):
+        self.terms: List[str] = list(terms)
+        self._sizes: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+        for tid, term in enumerate(self.terms):
+            grams = trigrams(term)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(tid)
+
+    def search(self, term: str, threshold: float) -> Optional[Tuple[str, float]]:
+        """Most similar indexed term scoring at least ``threshold``, or None."""
+        grams = trigrams(term)
+        n = len(grams)
+        # Dice >= t is impossible outside this size window, whatever the overlap
+        lo, hi = n * threshold / (2 - threshold), n * (2 - threshold) / threshold
+        common: Dict[int, int] = {}
+        for gram in grams:
+            for tid in self._postings.get(gram, ()):
+                common[tid] = common.get(tid, 0) + 1
+
+        best: Optional[Tuple[str, float]] = None
+        for tid, shared in common.items():
+            size = self._sizes[tid]
+            if size < lo or size > hi:
+                continue
+            score = 2 * shared / (n + size)
+            if score >= threshold and (best is None or score > best[1]):
+                best = (self.terms[tid], score)
+        return best
+
+
+class SkillVocabulary:
+    """Skills plus the built-in alias groups, with canonical and fuzzy lookup."""
+
+    def __init__(
+        self,
+        skills: Iterable[str] = (),
+        aliases: Optional[Dict[str, List[str]]] = None,
+        threshold: Optional[float] = None,
+    ):
+        aliases = SKILL_ALIASES if aliases is None else aliases
+        self.threshold = settings.FUZZY_SKILL_THRESHOLD if threshold is None else threshold
+
+        self._canonical: Dict[str, str] = {}
+        self._groups: Dict[str, Tuple[str, ...]] = {}
+        for canonical, forms in aliases.items():
+            canonical = normalize_skill(canonical)
+            group = tuple(dict.fromkeys([canonical] + [normalize_skill(f) for f in forms]))
+            for form in group:
+                self._canonical.setdefault(form, canonical)
+                self._groups.setdefault(form, group)
+        for skill in skills:
+            skill = normalize_skill(skill)
+            if skill:
+                self._canonical.setdefault(skill, skill)
+                self._groups.setdefault(skill, (skill,))
+
+        self.surfaces: List[str] = sorted(self._canonical)
+        self._trigrams = TrigramIndex(self.surfaces)
+        self._fuzzy_cache: Dict[str, Optional[str]] = {}
+        signature = "\n".join(f"{s}={self._canonical[s]}" for s in self.surfaces) + f"\n{self.threshold}"
+        self.fingerprint = hashlib.sha1(signature.encode("utf-8")).hexdigest()
+
+    def __contains__(self, skill: str) -> bool:
+        return normalize_skill(skill) in self._canonical
+
+    def canonical(self, skill: str) -> str:
+        skill = normalize_skill(skill)
+        return self._canonical.get(skill, skill)
+
+    def equivalents(self, skill: str) -> Tuple[str, ...]:
+        """Every known surface form of ``skill``, canonical first."""
+        skill = normalize_skill(skill)
+        return self._groups.get(skill, (skill,))
+
+    def fuzzy(self, token: str) -> Optional[str]:
+        """Known surface form closest to ``token``, if any is similar enough."""
+        token = normalize_skill(token)
+        if token in self._canonical:
+            return token
+        if len(token) < MIN_FUZZY_LENGTH:
+            return None
+        try:
+            return self._fuzzy_cache[token]
+        except KeyError:
+            pass
+        hit = self._trigrams.search(token, self.threshold)
+        if len(self._fuzzy_cache) >= FUZZY_CACHE_SIZE:
+            self._fuzzy_cache.clear()
+        self._fuzzy_cache[token] = found = hit[0] if hit else None
+        return found
@@ -0,0 +1,345 @@
+# skillmatcher/services/storage.py
+"""Content-addressed upload storage behind one interface.
+
+Files are stored under the SHA-256 of their bytes, sharded two levels deep
+by hash prefix (``ab/cd/abcd….pdf``). A lookup is a single path, and no
+directory grows past a few dozen entries even with millions of files.
+Identical uploads are stored once. ``STORAGE_BACKEND`` selects the store:
+
+* ``local``: files under ``UPLOAD_DIR``;
+* ``s3``: any S3-compatible service (``S3_ENDPOINT_URL`` points at MinIO or
+  another local stand-in). boto3 is imported lazily, and objects the
+  parsers need are fetched into a local cache under ``UPLOAD_DIR``.
+
+The digest and PDF readers map files with ``open_mmap``. The garbage
+collector deletes stored files that no resume row (``resume.file_path``) and
+no pending analysis task refers to, once they are older than
+``STORAGE_GC_GRACE_SECONDS``.
+"""
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Dict, Iterator, Optional, Set, Tuple, Union
+from uuid import uuid4
+import json
+import logging
+import mmap
+import os
+import time
+
+from app.core.config import settings
+
+log = logging.getLogger(__name__)
+
+
+def content_key(digest: str, kind: str) -> str:
+    """Storage key for content with this SHA-256 and extension, e.g. ``ab/cd/abcd….pdf``."""
+    return f"{digest[:2]}/{digest[2:4]}/{digest}{kind}"
+
+
+@contextmanager
+def open_mmap(path: Path) -> Iterator[Union[mmap.mmap, bytes]]:
+    """A read-only memory map of ``path`` (``b""`` for an empty file, which cannot be mapped)."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+class Store(ABC):
+    name = ""
+
+    @abstractmethod
+    def tmp_path(self) -> Path:
+        """A fresh local path to stream an upload into before ``put``."""
+
+    @abstractmethod
+    def put(self, tmp_path: Path, key: str) -> Path:
+        """Move ``tmp_path`` into the store under ``key``; returns a local path to read it from.
+
+        Putting a key that is already stored refreshes its modification time,
+        so the garbage collector's grace period starts over.
+        """
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    def local_path(self, key: str) -> Path:
+        """A readable local copy of ``key``."""
+
+    @abstractmethod
+    def delete(self, key: str, older_than: Optional[float] = None) -> None:
+        """Remove ``key``; with ``older_than``, only if it was not written or re-stored since then."""
+
+    @abstractmethod
+    def iter_keys(self) -> Iterator[Tuple[str, float]]:
+        """Every stored (key, modification time), streamed."""
+
+    def key_of(self, file_path: str) -> Optional[str]:
+        """The key a ``resume.file_path`` value refers to (rows from before sharding hold absolute paths)."""
+        return file_path
+
+
+STORES: Dict[str, type] = {}
+
+
+def register_store(cls):
+    """Class decorator adding a store to the registry under ``cls.name``."""
+    STORES[cls.name] = cls
+    return cls
+
+
+# -------------------------
+# Stores
+# -------------------------
+@register_store
+class LocalStore(Store):
+    name = "local"
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root or settings.UPLOAD_DIR)
+
+    def path(self, key: str) -> Path:
+        return self.root / key
+
+    def tmp_path(self) -> Path:
+        self.root.mkdir(parents=True, exist_ok=True)
+        return self.root / f".{uuid4().hex}.part"
+
+    def put(self, tmp_path: Path, key: str) -> Path:
+        path = self.path(key)
+        if path.exists():
+            tmp_path.unlink(missing_ok=True)  # same key, same bytes
+            os.utime(path)  # freshly referenced: keep it out of the GC grace window
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_path, path)
+        return path
+
+    def exists(self, key: str) -> bool:
+        return self.path(key).exists()
+
+    def local_path(self, key: str) -> Path:
+        return self.path(key)
+
+    def delete(self, key: str, older_than: Optional[float] = None) -> None:
+        path = self.path(key)
+        try:
+            if older_than is None or path.stat().st_mtime < older_than:
+                path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def iter_keys(self) -> Iterator[Tuple[str, float]]:
+        if not self.root.is_dir():
+            return
+        with os.scandir(self.root) as top:
+            for entry in top:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_file():
+                    yield entry.name, entry.stat().st_mtime  # flat layout from before sharding
+                elif entry.is_dir() and len(entry.name) == 2:
+                    with os.scandir(entry.path) as shards:
+                        for shard in shards:
+                            if not shard.is_dir():
+                                continue
+                            with os.scandir(shard.path) as files:
+                                for f in files:
+                                    if f.is_file() and not f.name.startswith("."):
+                                        yield f"{entry.name}/{shard.name}/{f.name}", f.stat().st_mtime
+
+    def key_of(self, file_path: str) -> Optional[str]:
+        path = Path(file_path)
+        if not path.is_absolute():
+            return file_path
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return None  # outside this store (e.g. the old app/uploads directory)
+
+    def sweep_tmp(self, older_than: float) -> int:
+        """Remove ``.part`` files left behind by interrupted uploads."""
+        removed = 0
+        if self.root.is_dir():
+            for entry in os.scandir(self.root):
+                if entry.name.endswith(".part") and entry.stat().st_mtime < older_than:
+                    Path(entry.path).unlink(missing_ok=True)
+                    removed += 1
+        return removed
+
+
+@register_store
+class S3Store(Store):
+    name = "s3"
+
+    def __init__(self):
+        self.bucket = settings.S3_BUCKET
+        self.prefix = settings.S3_PREFIX.strip("/")
+        self.cache = LocalStore()
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            import boto3
+
+            self._client = boto3.client("s3", endpoint_url=settings.S3_ENDPOINT_URL or None)
+        return self._client
+
+    def _object(self, key: str) -> str:
+        return f"{self.prefix}/{key}" if self.prefix else key
+
+    def tmp_path(self) -> Path:
+        return self.cache.tmp_path()
+
+    def put(self, tmp_path: Path, key: str) -> Path:
+        name = self._object(key)
+        if self._head(key) is None:
+            self.client.upload_file(str(tmp_path), self.bucket, name)
+        else:
+            # Same bytes already stored: copy the object onto itself to refresh LastModified,
+            # which is what the garbage collector's grace period is measured from
+            self.client.copy_object(
+                Bucket=self.bucket, Key=name, CopySource={"Bucket": self.bucket, "Key": name},
+                MetadataDirective="REPLACE",
+            )
+        return self.cache.put(tmp_path, key)
+
+    def _head(self, key: str) -> Optional[dict]:
+        """The object's metadata, or None when it does not exist."""
+        from botocore.exceptions import ClientError
+
+        try:
+            return self.client.head_object(Bucket=self.bucket, Key=self._object(key))
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    def exists(self, key: str) -> bool:
+        return self._head(key) is not None
+
+    def local_path(self, key: str) -> Path:
+        path = self.cache.path(key)
+        if not path.exists():
+            tmp_path = self.cache.tmp_path()
+            try:
+                self.client.download_file(self.bucket, self._object(key), str(tmp_path))
+                self.cache.put(tmp_path, key)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+        return path
+
+    def delete(self, key: str, older_than: Optional[float] = None) -> None:
+        if older_than is not None:
+            head = self._head(key)
+            if head is None or head["LastModified"].timestamp() >= older_than:
+                return  # gone already, or re-stored since the collector listed it
+        self.client.delete_object(Bucket=self.bucket, Key=self._object(key))
+        self.cache.delete(key)
+
+    def iter_keys(self) -> Iterator[Tuple[str, float]]:
+        skip = len(self.prefix) + 1 if self.prefix else 0
+        pages = self.client.get_paginator("list_objects_v2").paginate(
+            Bucket=self.bucket, Prefix=f"{self.prefix}/" if self.prefix else ""
+        )
+        for page in pages:
+            for obj in page.get("Contents", ()):
+                yield obj["Key"][skip:], obj["LastModified"].timestamp()
+
+
+_store: Optional[Store] = None
+_store_lock = Lock()
+
+
+def get_store() -> Store:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = STORES[settings.STORAGE_BACKEND]()
+        return _store
+
+
+# -------------------------
+# Garbage collection
+# -------------------------
+def referenced_keys(store: Store) -> Set[str]:
+    """Keys still needed: resume rows plus uploads waiting in the task queue."""
+    from sqlalchemy import column, inspect, select, table
+    from app.db.session import engine
+    from app.services.task_queue import QUEUED, RUNNING, AnalysisTask
+
+    keys: Set[str] = set()
+    resume = table("resume", column("file_path"))
+    with engine.connect() as conn:
+        rows = conn.execution_options(yield_per=10_000).execute(
+            select(resume.c.file_path).where(resume.c.file_path.is_not(None))
+        )
+        for (file_path,) in rows:
+            key = store.key_of(file_path)
+            if key:
+                keys.add(key)
+        # The queue table only exists where the v1 task queue has been set up
+        if not inspect(conn).has_table(AnalysisTask.__tablename__):
+            return keys
+        payloads = conn.execute(
+            select(AnalysisTask.payload).where(AnalysisTask.status.in_((QUEUED, RUNNING)))
+        )
+        for (payload,) in payloads:
+            data = json.loads(payload)
+            if "digest" in data and "kind" in data:
+                keys.add(content_key(data["digest"], data["kind"]))
+    return keys
+
+
+def collect_garbage(store: Optional[Store] = None, grace: Optional[float] = None) -> Dict[str, int]:
+    """Delete stored files nothing refers to and that are older than ``grace`` seconds."""
+    store = store or get_store()
+    cutoff = time.time() - (settings.STORAGE_GC_GRACE_SECONDS if grace is None else grace)
+    # Listed before the references are read, so a file stored in between is never judged unreferenced
+    candidates = [key for key, mtime in store.iter_keys() if mtime < cutoff]
+    keys = referenced_keys(store)
+    stats = {"scanned": len(candidates), "deleted": 0}
+    for key in candidates:
+        if key not in keys:
+            # A re-upload of the same bytes while we were scanning refreshes the mtime and is kept
+            store.delete(key, older_than=cutoff)
+            stats["deleted"] += 1
+    local = store if isinstance(store, LocalStore) else getattr(store, "cache", None)
+    stats["tmp_removed"] = local.sweep_tmp(cutoff) if local is not None else 0
+    log.info("Storage GC: %(scanned)d old files checked, %(deleted)d deleted, %(tmp_removed)d partial uploads removed", stats)
+    return stats
+
+
+class GarbageCollector:
+    """Runs ``collect_garbage`` every ``STORAGE_GC_INTERVAL`` seconds on a daemon thread."""
+
+    def __init__(self):
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    def start(self) -> None:
+        if settings.STORAGE_GC_INTERVAL <= 0 or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._run, name="storage-gc", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.wait(settings.STORAGE_GC_INTERVAL):
+            try:
+                collect_garbage()
+            except Exception:
+                log.exception("Storage garbage collection failed")
+
+
+garbage_collector = GarbageCollector()
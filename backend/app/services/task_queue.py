@@ -0,0 +1,182 @@
+# skillmatcher/services/task_queue.py
+"""Durable local task queue backed by the application database.
+
+Tasks live in the ``analysis_task`` table. A worker claims one by moving its
+``visible_at`` into the future (the visibility timeout); if the worker dies,
+the task becomes visible again once that passes and another worker retries
+it. Failed attempts are retried with exponential backoff until
+``max_attempts`` is reached.
+"""
+from typing import Callable, Dict, Optional
+from uuid import uuid4
+import json
+import logging
+import time
+
+from sqlalchemy import Index, update
+from sqlmodel import SQLModel, Field, Session, select
+
+from app.core.config import settings
+from app.db.session import engine
+
+log = logging.getLogger(__name__)
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+
+class AnalysisTask(SQLModel, table=True):
+    __tablename__ = "analysis_task"
+    __table_args__ = (Index("ix_analysis_task_ready", "status", "visible_at"),)
+
+    id: str = Field(default_factory=lambda: uuid4().hex, primary_key=True)
+    kind: str
+    payload: str  # JSON
+    status: str = QUEUED
+    attempts: int = 0
+    max_attempts: int = Field(default_factory=lambda: settings.TASK_MAX_ATTEMPTS)
+    visible_at: float = Field(default_factory=time.time)
+    locked_by: Optional[str] = None
+    result: Optional[str] = None  # JSON
+    error: Optional[str] = None
+    # Epoch seconds, like visible_at
+    created_at: float = Field(default_factory=time.time)
+    updated_at: float = Field(default_factory=time.time)
+
+    def to_status(self) -> dict:
+        return {
+            "task_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "attempts": self.attempts,
+            "result": json.loads(self.result) if self.result else None,
+            "error": self.error,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+# -------------------------
+# Handlers
+# -------------------------
+HANDLERS: Dict[str, Callable[[dict], dict]] = {}
+
+
+def task_handler(kind: str):
+    """Register the function that processes tasks of ``kind`` (payload dict -> result dict)."""
+    def register(fn: Callable[[dict], dict]):
+        HANDLERS[kind] = fn
+        return fn
+    return register
+
+
+# -------------------------
+# Queue operations
+# -------------------------
+def enqueue(kind: str, payload: dict) -> AnalysisTask:
+    task = AnalysisTask(kind=kind, payload=json.dumps(payload))
+    with Session(engine) as session:
+        session.add(task)
+        session.commit()
+        session.refresh(task)
+    return task
+
+
+def get_task(task_id: str) -> Optional[AnalysisTask]:
+    with Session(engine) as session:
+        return session.get(AnalysisTask, task_id)
+
+
+def claim(worker_id: str, visibility_timeout: Optional[float] = None) -> Optional[AnalysisTask]:
+    """Atomically take the oldest visible task, or return None if there is none."""
+    timeout = visibility_timeout or settings.TASK_VISIBILITY_TIMEOUT
+    with Session(engine) as session:
+        for _ in range(5):
+            now = time.time()
+            candidate = session.exec(
+                select(AnalysisTask)
+                .where(AnalysisTask.status.in_((QUEUED, RUNNING)), AnalysisTask.visible_at <= now)
+                .order_by(AnalysisTask.visible_at)
+                .limit(1)
+            ).first()
+            if candidate is None:
+                return None
+
+            if candidate.attempts >= candidate.max_attempts:
+                # Its last attempt timed out without reporting back
+                _finish(session, candidate.id, FAILED, error=candidate.error or "Visibility timeout exceeded")
+                continue
+
+            # Conditional update: only one worker can win the same visible row
+            claimed = session.execute(
+                update(AnalysisTask)
+                .where(AnalysisTask.id == candidate.id, AnalysisTask.visible_at == candidate.visible_at)
+                .values(
+                    status=RUNNING,
+                    attempts=AnalysisTask.attempts + 1,
+                    visible_at=now + timeout,
+                    locked_by=worker_id,
+                    updated_at=time.time(),
+                )
+            ).rowcount
+            session.commit()
+            if claimed:
+                session.expire_all()
+                return session.get(AnalysisTask, candidate.id)
+    return None
+
+
+def _finish(session: Session, task_id: str, status: str, owner: Optional[AnalysisTask] = None, **values) -> bool:
+    """Record a task's outcome; with ``owner``, only while that claim still holds the task."""
+    conditions = [AnalysisTask.id == task_id]
+    if owner is not None:
+        # A worker whose visibility timeout ran out may report back after another
+        # worker re-claimed the task; its late result must not overwrite the new run
+        conditions += [AnalysisTask.locked_by == owner.locked_by, AnalysisTask.attempts == owner.attempts]
+    updated = session.execute(
+        update(AnalysisTask)
+        .where(*conditions)
+        .values(status=status, locked_by=None, updated_at=time.time(), **values)
+    ).rowcount
+    session.commit()
+    return bool(updated)
+
+
+def complete(task: AnalysisTask, result: dict) -> bool:
+    """Mark a claimed task done; False when the claim was lost to another worker."""
+    with Session(engine) as session:
+        done = _finish(session, task.id, DONE, owner=task, result=json.dumps(result, default=str), error=None)
+    if not done:
+        log.warning("Task %s finished on %s after its claim expired; result dropped", task.id, task.locked_by)
+    return done
+
+
+def fail(task: AnalysisTask, error: str) -> bool:
+    """Requeue a claimed task with backoff, or mark it failed after its last attempt."""
+    with Session(engine) as session:
+        if task.attempts >= task.max_attempts:
+            failed = _finish(session, task.id, FAILED, owner=task, error=error)
+        else:
+            backoff = settings.TASK_RETRY_BACKOFF * 2 ** (task.attempts - 1)
+            failed = _finish(session, task.id, QUEUED, owner=task, error=error, visible_at=time.time() + backoff)
+    if not failed:
+        log.warning("Task %s failed on %s after its claim expired; error dropped", task.id, task.locked_by)
+    return failed
+
+
+def run_one(worker_id: str) -> bool:
+    """Claim and process a single task; returns False when the queue was empty."""
+    task = claim(worker_id)
+    if task is None:
+        return False
+    handler = HANDLERS.get(task.kind)
+    if handler is None:
+        fail(task, f"No handler registered for task kind '{task.kind}'")
+        return True
+    try:
+        result = handler(json.loads(task.payload))
+    except Exception as e:
+        log.exception("Task %s (%s) failed on attempt %d", task.id, task.kind, task.attempts)
+        fail(task, str(e))
+    else:
+        complete(task, result)
+    return True
@@ -0,0 +1,113 @@
+# skillmatcher/services/text_store.py
+"""Content-addressed, compressed storage for extracted resume text.
+
+A resume row only carries ``text_digest`` (SHA-256 of the UTF-8 text). The
+text itself is stored once per distinct digest in ``text_blob``, compressed
+with ``TEXT_CODEC`` (zstd when the zstandard package is installed, zlib
+otherwise). The same CV uploaded against several jobs is stored once, and
+list and analytics queries over ``resume`` never page text in. Every blob
+records the codec it was written with, so changing TEXT_CODEC never breaks
+older rows.
+"""
+from importlib.util import find_spec
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Union
+import hashlib
+import zlib
+
+from sqlalchemy import Column, LargeBinary, select
+from sqlalchemy.engine import Connection
+from sqlmodel import SQLModel, Field, Session
+
+from app.core.config import settings
+from app.db.bulk import upsert
+
+
+class TextBlob(SQLModel, table=True):
+    __tablename__ = "text_blob"
+
+    digest: str = Field(primary_key=True)  # SHA-256 of the UTF-8 text
+    codec: str
+    size: int  # uncompressed bytes
+    data: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
+
+
+# -------------------------
+# Codecs
+# -------------------------
+class Codec(NamedTuple):
+    name: str
+    module: str  # import needed for this codec
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    import zstandard
+    return zstandard.ZstdCompressor(level=10).compress(data)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    import zstandard
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+CODECS: Dict[str, Codec] = {
+    "zlib": Codec("zlib", "zlib", lambda data: zlib.compress(data, 9), zlib.decompress),
+    "zstd": Codec("zstd", "zstandard", _zstd_compress, _zstd_decompress),
+}
+
+
+def write_codec() -> Codec:
+    """The configured codec, or zlib when its library is not installed."""
+    codec = CODECS.get(settings.TEXT_CODEC, CODECS["zlib"])
+    return codec if find_spec(codec.module) is not None else CODECS["zlib"]
+
+
+def text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def decode(codec: str, data: bytes) -> str:
+    return CODECS[codec].decompress(data).decode("utf-8")
+
+
+# -------------------------
+# Store
+# -------------------------
+def put_text(session: Session, text: str) -> str:
+    """Store ``text`` unless an identical one is stored already; returns its digest. The caller commits."""
+    raw = text.encode("utf-8")
+    digest = hashlib.sha256(raw).hexdigest()
+    # Most puts are repeats (re-uploads, cache entries for stored resumes): skip the compression
+    if session.execute(select(TextBlob.digest).where(TextBlob.digest == digest)).first() is not None:
+        return digest
+    codec = write_codec()
+    upsert(
+        session, TextBlob,
+        [{"digest": digest, "codec": codec.name, "size": len(raw), "data": codec.compress(raw)}],
+        keys=("digest",), update=False,
+    )
+    return digest
+
+
+def get_texts(session: Union[Session, Connection], digests: Iterable[Optional[str]]) -> Dict[str, str]:
+    """Decompressed text for each stored digest, in one query."""
+    wanted = {d for d in digests if d}
+    if not wanted:
+        return {}
+    rows = session.execute(
+        select(TextBlob.digest, TextBlob.codec, TextBlob.data).where(TextBlob.digest.in_(wanted))
+    )
+    return {digest: decode(codec, data) for digest, codec, data in rows}
+
+
+def get_text(session: Session, digest: Optional[str]) -> str:
+    return get_texts(session, [digest]).get(digest, "") if digest else ""
+
+
+def with_text(session: Union[Session, Connection], rows: List[dict]) -> List[dict]:
+    """Add a ``text`` key to resume row dicts that carry ``text_digest``."""
+    texts = get_texts(session, (row.get("text_digest") for row in rows))
+    for row in rows:
+        row["text"] = texts.get(row.get("text_digest"), "")
+    return rows
@@ -0,0 +1,192 @@
+# skillmatcher/services/uploads.py
+"""Streaming upload ingestion.
+
+Uploads are copied to disk in fixed-size chunks while the SHA-256 digest and
+the file type (from magic bytes) are computed on the fly, so memory per upload
+stays constant and oversized files are aborted as soon as they cross the
+limit. Finished files go to the configured store (services/storage.py) under
+their content hash, so identical uploads are kept once and two clients
+uploading a "resume.pdf" at the same time can no longer overwrite each other.
+"""
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple, Union
+import asyncio
+import hashlib
+import zipfile
+
+import aiofiles
+from fastapi import HTTPException, UploadFile
+
+from app.core.config import settings
+from app.services.storage import Store, content_key, get_store
+
+ALLOWED_EXTENSIONS = (".txt", ".pdf", ".doc", ".docx")
+
+# Leading bytes of each binary format we accept
+MAGIC_BYTES = {
+    b"%PDF-": ".pdf",
+    b"PK\x03\x04": ".docx",
+    b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1": ".doc",
+}
+
+
+class StoredUpload(NamedTuple):
+    path: Path  # local copy to parse
+    digest: str  # sha256 of the content
+    size: int
+    kind: str  # sniffed extension, e.g. ".pdf"
+    filename: str  # name supplied by the client
+
+    @property
+    def key(self) -> str:
+        """Storage key, what ``Resume.file_path`` records."""
+        return content_key(self.digest, self.kind)
+
+
+def sniff_kind(head: bytes) -> Optional[str]:
+    for magic, kind in MAGIC_BYTES.items():
+        if head.startswith(magic):
+            return kind
+    # Plain text: no NUL bytes and decodable (allowing a split multibyte char at the end)
+    if b"\x00" in head:
+        return None
+    try:
+        head.decode("utf-8")
+    except UnicodeDecodeError as e:
+        if e.start < len(head) - 3:
+            return None
+    return ".txt"
+
+
+def _check_kind(filename: str, kind: Optional[str]) -> str:
+    suffix = Path(filename).suffix.lower()
+    # .doc files are sometimes really .docx (and vice versa); both go to the Word parser
+    word = (".doc", ".docx")
+    if kind is None or (kind != suffix and not (kind in word and suffix in word)):
+        raise HTTPException(status_code=400, detail=f"File content does not match a {suffix or 'supported'} file")
+    return kind
+
+
+class _Ingest:
+    """Validates, sizes and hashes a stream chunk by chunk; writing is up to the caller."""
+
+    def __init__(self, filename: str, max_bytes: int):
+        self.filename = filename
+        self.max_bytes = max_bytes
+        self.digest = hashlib.sha256()
+        self.size = 0
+        self.kind: Optional[str] = None
+
+    def feed(self, chunk: bytes) -> None:
+        if self.kind is None:
+            self.kind = _check_kind(self.filename, sniff_kind(chunk[:512]))
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise HTTPException(status_code=413, detail=f"File exceeds the {self.max_bytes} byte limit")
+        self.digest.update(chunk)
+
+    def finish(self, tmp_path: Path, store: Store) -> StoredUpload:
+        if self.size == 0:
+            raise HTTPException(status_code=400, detail="Uploaded file is empty")
+        hexdigest = self.digest.hexdigest()
+        path = store.put(tmp_path, content_key(hexdigest, self.kind))
+        return StoredUpload(path, hexdigest, self.size, self.kind, self.filename)
+
+
+def _check_extension(filename: str) -> None:
+    if not filename.lower().endswith(ALLOWED_EXTENSIONS):
+        raise HTTPException(status_code=400, detail="Unsupported file format")
+
+
+async def save_upload(
+    file: UploadFile,
+    store: Optional[Store] = None,
+    max_bytes: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> StoredUpload:
+    """Stream ``file`` into ``store`` (default: the configured one) and return where and what was stored."""
+    filename = file.filename or ""
+    _check_extension(filename)
+
+    store = store or get_store()
+    chunk_size = chunk_size or settings.UPLOAD_CHUNK_SIZE
+
+    ingest = _Ingest(filename, max_bytes or settings.MAX_UPLOAD_BYTES)
+    tmp_path = store.tmp_path()
+    try:
+        async with aiofiles.open(tmp_path, "wb") as out:
+            while True:
+                chunk = await file.read(chunk_size)
+                if not chunk:
+                    break
+                ingest.feed(chunk)
+                await out.write(chunk)
+        # Off the event loop: a remote store uploads here
+        return await asyncio.to_thread(ingest.finish, tmp_path, store)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+# -------------------------
+# Zip archives (batch uploads)
+# -------------------------
+def is_zip_upload(file: UploadFile) -> bool:
+    return (file.filename or "").lower().endswith(".zip")
+
+
+async def save_archive(file: UploadFile, store: Optional[Store] = None) -> Path:
+    """Stream a zip archive to a temporary file; the caller removes it when done."""
+    tmp_path = (store or get_store()).tmp_path()
+    size = 0
+    try:
+        async with aiofiles.open(tmp_path, "wb") as out:
+            while True:
+                chunk = await file.read(settings.UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > settings.MAX_BATCH_BYTES:
+                    raise HTTPException(status_code=413, detail=f"Archive exceeds the {settings.MAX_BATCH_BYTES} byte limit")
+                await out.write(chunk)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    if not zipfile.is_zipfile(tmp_path):
+        tmp_path.unlink(missing_ok=True)
+        raise HTTPException(status_code=400, detail="Not a valid zip archive")
+    return tmp_path
+
+
+def extract_archive(
+    archive: Path, store: Optional[Store] = None, max_files: Optional[int] = None
+) -> List[Union[StoredUpload, Tuple[str, str]]]:
+    """Store every resume in ``archive``; failures come back as (filename, error) pairs.
+
+    Blocking: run it in a threadpool. Members are streamed through the same
+    size/type checks as direct uploads, so a zip bomb stops at MAX_UPLOAD_BYTES.
+    """
+    store = store or get_store()
+    max_files = max_files or settings.MAX_BATCH_FILES
+    results: List[Union[StoredUpload, Tuple[str, str]]] = []
+    with zipfile.ZipFile(archive) as zf:
+        members = [m for m in zf.infolist() if not m.is_dir() and not Path(m.filename).name.startswith(".")]
+        for member in members[:max_files]:
+            name = Path(member.filename).name
+            tmp_path = store.tmp_path()
+            try:
+                _check_extension(name)
+                ingest = _Ingest(name, settings.MAX_UPLOAD_BYTES)
+                with zf.open(member) as src, open(tmp_path, "wb") as out:
+                    for chunk in iter(lambda: src.read(settings.UPLOAD_CHUNK_SIZE), b""):
+                        ingest.feed(chunk)
+                        out.write(chunk)
+                results.append(ingest.finish(tmp_path, store))
+            except HTTPException as e:
+                results.append((name, e.detail))
+            except (zipfile.BadZipFile, OSError, RuntimeError) as e:
+                results.append((name, str(e)))
+            finally:
+                tmp_path.unlink(missing_ok=True)
+        for member in members[max_files:]:
+            results.append((Path(member.filename).name, f"Archive holds more than {max_files} files"))
+    return results
@@ -0,0 +1,92 @@
+# skillmatcher/services/workers.py
+"""Bounded process pool for CPU-bound parsing and matching.
+
+Async route handlers hand blocking work to ``cpu_pool.run`` so a large PDF
+never stalls the event loop. Submissions are capped: once ``max_pending``
+tasks are in flight, new ones are rejected straight away with a 503 and a
+Retry-After header instead of queueing without bound.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from threading import Lock
+from typing import Callable, Optional, TypeVar
+import asyncio
+import logging
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class WorkerPool:
+    def __init__(self, max_workers: int, max_pending: int, timeout: float):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = Lock()
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a process that holds DB connections and threads is unsafe
+                self._executor = ProcessPoolExecutor(self.max_workers, mp_context=get_context("spawn"))
+            return self._executor
+
+    def _release(self, _future=None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    async def run(self, fn: Callable[..., T], *args, timeout: Optional[float] = None) -> T:
+        with self._lock:
+            if self._in_flight >= self.max_pending:
+                raise HTTPException(
+                    status_code=503,
+                    detail="Server is busy processing resumes, please retry shortly.",
+                    headers={"Retry-After": "5"},
+                )
+            self._in_flight += 1
+
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BrokenProcessPool:
+            self._release()
+            raise self._reset()
+        except Exception:
+            self._release()
+            raise
+        # The slot is only freed once the worker is really done, even after a timeout
+        future.add_done_callback(self._release)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout or self.timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            raise HTTPException(status_code=504, detail="Resume processing timed out")
+        except BrokenProcessPool:
+            raise self._reset()
+
+    def _reset(self) -> HTTPException:
+        """Drop a broken pool so the next submission starts a fresh one."""
+        log.warning("Worker pool broken, recreating it")
+        self.shutdown()
+        return HTTPException(status_code=503, detail="Worker pool restarting", headers={"Retry-After": "1"})
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+cpu_pool = WorkerPool(settings.PARSE_WORKERS, settings.PARSE_MAX_PENDING, settings.PARSE_TIMEOUT)
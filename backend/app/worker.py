@@ -0,0 +1,98 @@
+# app/worker.py
+"""Background worker for the analysis task queue.
+
+Run from the backend folder:
+
+    python -m app.worker --concurrency 4
+
+``--api`` picks the handlers that match the API that queued the tasks:
+``main`` (``uvicorn app.main:app``, the default) or ``v1``. The two define
+their own ``job`` and ``resume`` tables, so a worker loads only one of them.
+"""
+from multiprocessing import get_context
+import argparse
+import importlib
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+
+from app.core.config import settings
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+
+# Importing a module registers its task handlers
+HANDLER_MODULES = {
+    "main": "app.main",
+    "v1": "app.api.v1.routers.resumes",
+}
+
+
+def worker_loop(index: int, poll_interval: float, api: str = "main") -> None:
+    importlib.import_module(HANDLER_MODULES[api])
+    from app.db.session import create_db_and_tables
+    from app.services.task_queue import run_one
+
+    from app.services import pdf_extract
+
+    create_db_and_tables()
+    worker_id = f"{socket.gethostname()}:{os.getpid()}:{index}"
+    logging.info(f"👷 Worker {worker_id} started")
+    try:
+        while True:
+            try:
+                if not run_one(worker_id):
+                    time.sleep(poll_interval)
+            except Exception as e:
+                # Usually a transient lock or connection error; back off and keep going
+                logging.warning(f"Worker {worker_id} error: {e}")
+                time.sleep(poll_interval)
+    finally:
+        pdf_extract.shutdown()
+
+
+def _child_main(index: int, poll_interval: float, api: str) -> None:
+    # The parent stops us with SIGTERM; exit through the finally blocks so the page pool goes too.
+    # Ctrl-C reaches the whole process group, and the parent handles it for everyone
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    worker_loop(index, poll_interval, api)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Process queued resume analysis tasks")
+    parser.add_argument("--concurrency", type=int, default=settings.TASK_WORKERS)
+    parser.add_argument("--poll-interval", type=float, default=settings.TASK_POLL_INTERVAL)
+    parser.add_argument("--api", choices=sorted(HANDLER_MODULES), default="main", help="API whose tasks to process")
+    args = parser.parse_args()
+
+    if args.concurrency <= 1:
+        worker_loop(0, args.poll_interval, args.api)
+        return
+
+    # Not daemonic: long PDFs are extracted by a page pool inside each worker, and a
+    # daemonic process may not start children
+    ctx = get_context("spawn")
+    procs = [
+        ctx.Process(target=_child_main, args=(i, args.poll_interval, args.api), name=f"worker-{i}")
+        for i in range(args.concurrency)
+    ]
+
+    def stop(signum, frame) -> None:
+        logging.info(f"Stopping {len(procs)} workers")
+        for p in procs:
+            if p.is_alive():
+                p.terminate()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+# bench/corpus.py
+"""Synthetic, reproducible resumes and job catalogs for the benchmarks.
+
+Run from the backend folder to write a corpus to disk:
+
+    python -m bench.corpus /tmp/corpus --resumes 20 --words 800 --jobs 10000
+
+Everything is drawn from a seeded RNG, so the same arguments always give the
+same files and catalogs.
+"""
+from pathlib import Path
+from typing import Dict, List, Optional
+import argparse
+import json
+import random
+
+# Real skills from the catalog, padded with synthetic ones for large catalogs
+BASE_SKILLS = [
+    "Python", "JavaScript", "TypeScript", "React", "Node.js", "SQL", "Docker", "Kubernetes", "AWS", "Azure",
+    "HTML", "CSS", "Tailwind CSS", "REST APIs", "Git", "Linux", "Java", "C++", "Machine Learning", "NLP",
+    "Pandas", "TensorFlow", "PyTorch", "Scikit-learn", "Tableau", "Power BI", "Excel", "Figma", "Agile",
+    "Scrum", "CI/CD", "Terraform", "Django", "FastAPI", "Redux", "Flutter", "Spark", "Hadoop", "ETL",
+    "Communication", "Leadership", "Project Management", "Data Visualization", "Statistics", "Networking",
+]
+
+FILLER = (
+    "worked on designed delivered improved team project customers platform service data reporting "
+    "performance quality scalable production features release stakeholders requirements analysis "
+    "migration architecture testing deployment monitoring automation documentation responsible for "
+    "collaborated with cross functional engineers product managers built maintained optimized reduced "
+    "increased latency throughput cost reliability users internal tools pipeline workflows"
+).split()
+
+TITLES = [
+    "Software Engineer", "Data Scientist", "Frontend Developer", "Backend Developer", "DevOps Engineer",
+    "Data Engineer", "QA Engineer", "Product Analyst", "ML Engineer", "Cloud Architect",
+]
+
+
+def skill_vocabulary(size: int = 2000) -> List[str]:
+    return BASE_SKILLS + [f"Skill {i}" for i in range(max(0, size - len(BASE_SKILLS)))]
+
+
+# -------------------------
+# Resumes
+# -------------------------
+def resume_text(words: int = 600, seed: int = 0, skills: Optional[List[str]] = None) -> str:
+    """A plausible resume of about ``words`` words with a skills line and experience bullets."""
+    rng = random.Random(seed)
+    skills = skills or BASE_SKILLS
+    lines = [
+        f"Candidate {seed}",
+        "Summary",
+        " ".join(rng.choices(FILLER, k=30)),
+        "Skills",
+        ", ".join(rng.sample(skills, min(12, len(skills)))),
+        "Experience",
+    ]
+    count = sum(len(line.split()) for line in lines)
+    while count < words:
+        line = " ".join(rng.choices(FILLER, k=14) + rng.sample(skills, 2))
+        lines.append(f"- {line.capitalize()}.")
+        count += 17
+    lines += ["Education", "B.Tech in Computer Science, 2019"]
+    return "\n".join(lines)
+
+
+def write_txt(text: str, path: Path) -> Path:
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def write_docx(text: str, path: Path) -> Path:
+    import docx
+
+    document = docx.Document()
+    for line in text.split("\n"):
+        document.add_paragraph(line)
+    document.save(path)
+    return path
+
+
+def _pdf_escape(line: str) -> str:
+    return line.encode("latin-1", "replace").decode("latin-1").replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_pdf(text: str, path: Path, lines_per_page: int = 48) -> Path:
+    """Minimal multi-page text PDF (Helvetica), readable by every extraction backend."""
+    lines = text.split("\n")
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+
+    objects: List[bytes] = []
+    n_pages = len(pages)
+    # 1: catalog, 2: page tree, 3: font, then (page, content) pairs
+    kids = " ".join(f"{4 + 2 * i} 0 R" for i in range(n_pages))
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {n_pages} >>".encode())
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    for i, page in enumerate(pages):
+        body = ["BT", "/F1 10 Tf", "14 TL", "50 780 Td"]
+        body += [f"({_pdf_escape(line)}) Tj T*" for line in page]
+        body.append("ET")
+        stream = "\n".join(body).encode("latin-1")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] /Resources << /Font << /F1 3 0 R >> >> "
+            f"/Contents {5 + 2 * i} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + obj + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % off for off in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(bytes(out))
+    return path
+
+
+WRITERS = {".txt": write_txt, ".docx": write_docx, ".pdf": write_pdf}
+
+
+def write_resume(folder: Path, kind: str, words: int = 600, seed: int = 0) -> Path:
+    folder.mkdir(parents=True, exist_ok=True)
+    return WRITERS[kind](resume_text(words, seed), folder / f"resume_{seed}_{words}{kind}")
+
+
+# -------------------------
+# Job catalogs
+# -------------------------
+def job_catalog(size: int, seed: int = 0, vocabulary: int = 2000, skills_per_job: int = 8) -> List[Dict]:
+    """``size`` jobs shaped like app/data/jobs.json; skill popularity is skewed like real catalogs."""
+    rng = random.Random(seed)
+    skills = skill_vocabulary(vocabulary)
+    weights = [1.0 / (rank + 1) for rank in range(len(skills))]  # Zipf-like
+    jobs = []
+    for job_id in range(1, size + 1):
+        chosen = list(dict.fromkeys(rng.choices(skills, weights, k=skills_per_job)))
+        jobs.append({
+            "id": job_id,
+            "title": f"{rng.choice(TITLES)} {job_id}",
+            "skills": chosen,
+            "requirements": [f"Experience with {s}" for s in chosen[:3]] + ["Strong communication skills"],
+            "demand": rng.choice(["High", "Medium", "Low"]),
+            "avg_salary": f"${rng.randint(60, 180)}k",
+            "description": " ".join(rng.choices(FILLER, k=25) + chosen),
+        })
+    return jobs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write a synthetic benchmark corpus")
+    parser.add_argument("out", type=Path)
+    parser.add_argument("--resumes", type=int, default=10, help="Resumes per file type")
+    parser.add_argument("--words", type=int, default=600)
+    parser.add_argument("--kinds", default=".txt,.docx,.pdf")
+    parser.add_argument("--jobs", type=int, action="append", help="Catalog size (repeatable), e.g. 1000")
+    args = parser.parse_args()
+
+    for kind in args.kinds.split(","):
+        for seed in range(args.resumes):
+            write_resume(args.out / "resumes", kind, args.words, seed)
+    for size in args.jobs or []:
+        (args.out / f"jobs_{size}.json").write_text(json.dumps(job_catalog(size)))
+    print(f"Corpus written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# bench/pdf_backends.py
+"""Throughput of each PDF extraction backend on a corpus of PDFs.
+
+Run from the backend folder:
+
+    python -m bench.pdf_backends [corpus_dir ...] [--repeat 3] [--json results.json]
+
+Every PDF under the given folders (default: the upload folders) is
+extracted with each available backend on its own, without the parse cache.
+"""
+from pathlib import Path
+from typing import Dict, List
+import argparse
+import json
+import time
+
+from app.core.config import settings
+from app.services.pdf_extract import BACKENDS, extract_pdf_text
+
+DEFAULT_CORPUS = [Path(__file__).resolve().parents[1] / "app" / "uploads", Path(settings.UPLOAD_DIR)]
+
+
+def find_pdfs(folders: List[Path]) -> List[Path]:
+    return sorted({p for folder in folders if folder.is_dir() for p in folder.rglob("*") if p.suffix.lower() == ".pdf"})
+
+
+def bench_backend(name: str, pdfs: List[Path], repeat: int) -> Dict:
+    backend = BACKENDS[name]
+    result = {"backend": name, "available": backend.available()}
+    if not result["available"]:
+        return result
+
+    pages = empty = errors = 0
+    for pdf in pdfs:
+        try:
+            with backend.open(pdf) as doc:
+                pages += min(doc.page_count, settings.PDF_MAX_PAGES)
+        except Exception:
+            errors += 1
+
+    size = sum(p.stat().st_size for p in pdfs)
+    chars = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for pdf in pdfs:
+            text = extract_pdf_text(pdf, backends=[name])
+            chars += len(text)
+            empty += not text.strip()
+    elapsed = time.perf_counter() - start
+    runs = len(pdfs) * repeat
+    result.update({
+        "documents": len(pdfs),
+        "pages": pages,
+        "errors": errors,
+        "empty": empty // repeat,
+        "seconds": round(elapsed, 4),
+        "docs_per_s": round(runs / elapsed, 2) if elapsed else None,
+        "pages_per_s": round(pages * repeat / elapsed, 2) if elapsed else None,
+        "mb_per_s": round(size * repeat / elapsed / 1e6, 2) if elapsed else None,
+        "chars_per_doc": chars // max(1, runs),
+    })
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark PDF extraction backends")
+    parser.add_argument("corpus", nargs="*", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--backend", action="append", choices=sorted(BACKENDS), help="Only these backends")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", type=Path, help="Also write the results to this file")
+    args = parser.parse_args()
+
+    pdfs = find_pdfs(args.corpus)
+    if not pdfs:
+        parser.error(f"No PDF files found in {', '.join(map(str, args.corpus))}")
+
+    results = [bench_backend(name, pdfs, args.repeat) for name in args.backend or sorted(BACKENDS)]
+
+    print(f"{len(pdfs)} PDFs, {args.repeat} runs each")
+    print(f"{'backend':<12}{'docs/s':>10}{'pages/s':>10}{'MB/s':>8}{'empty':>7}{'errors':>8}")
+    for r in results:
+        if not r["available"]:
+            print(f"{r['backend']:<12}{'not installed':>30}")
+            continue
+        print(f"{r['backend']:<12}{r['docs_per_s']:>10}{r['pages_per_s']:>10}{r['mb_per_s']:>8}{r['empty']:>7}{r['errors']:>8}")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+# bench/run.py
+"""Micro-benchmarks for parsing, extraction, matching, ranking and the hot endpoints.
+
+Run from the backend folder:
+
+    python -m bench.run                          # full suite, catalogs of 1k/10k/100k jobs
+    python -m bench.run --quick                  # 1k catalog, fewer runs
+    python -m bench.run --json results.json      # machine-readable results
+    python -m bench.run --save-baseline          # store results as bench/baseline.json
+    python -m bench.run --tolerance 0.3          # exit 1 if any median is >30% slower than baseline
+
+Each group runs in a fresh process against a throwaway SQLite database, so
+results do not depend on local data and the two model sets (app.main and
+app.db.models) never meet in one interpreter. Timings are per call in
+milliseconds; the regression check compares medians.
+"""
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+BASELINE = Path(__file__).with_name("baseline.json")
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+# Synthetic jobs are numbered above the seeded catalog (app/data/jobs.json)
+JOB_ID_OFFSET = 1_000_000
+
+
+def measure(name: str, fn: Callable[[], object], runs: int, **params) -> Dict:
+    fn()  # warm-up: caches, lazy imports, catalog snapshots
+    times = []
+    for _ in range(max(1, runs)):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+    label = name + ("[" + ",".join(f"{k}={v}" for k, v in params.items()) + "]" if params else "")
+    return {
+        "name": label,
+        "runs": len(times),
+        "median_ms": round(statistics.median(times), 4),
+        "p95_ms": round(times[min(len(times) - 1, int(len(times) * 0.95))], 4),
+        "min_ms": round(times[0], 4),
+    }
+
+
+# -------------------------
+# Groups (each runs in its own process)
+# -------------------------
+def bench_functions(sizes: List[int], runs: int, workdir: str) -> List[Dict]:
+    """Pure functions: parsing, skill extraction, matching, improved resume, ranking."""
+    from app.services.improve import generate_improved_resume
+    from app.services.matching import match_skills
+    from app.services.parsing import _parse_uncached
+    from app.services.relevance import BM25Engine, TermIndex, job_document
+    from app.services.scoring import ScoringEngine
+    from app.services.skill_extractor import SkillExtractor
+    from app.services.skill_index import SkillIndex
+    from app.services.skill_vocabulary import SkillVocabulary
+    from bench import corpus
+
+    results = []
+    folder = Path(workdir) / "resumes"
+    for words in (600, 3000):
+        for kind in (".txt", ".docx", ".pdf"):
+            path = corpus.write_resume(folder, kind, words)
+            results.append(measure("parse_resume_file", lambda: _parse_uncached(path), runs, kind=kind[1:], words=words))
+
+        text = corpus.resume_text(words)
+        job_skills = corpus.BASE_SKILLS[:8]
+        missing = job_skills[4:]
+        results.append(measure("match_skills", lambda: match_skills(job_skills, text), runs * 5, words=words))
+        results.append(measure(
+            "generate_improved_resume", lambda: generate_improved_resume(text, "Software Engineer", missing), runs * 5, words=words
+        ))
+
+    text = corpus.resume_text(600)
+    for size in sizes:
+        jobs = corpus.job_catalog(size)
+        index = SkillIndex()
+        terms = TermIndex()
+        for job in jobs:
+            index.add(job["id"], job["skills"])
+            terms.update(job["id"], job_document(job["title"], job["description"], job["requirements"]))
+        skills = index.vocabulary()
+        extractor = SkillExtractor(skills, SkillVocabulary(skills))
+        found = extractor.extract(text)
+        scoring = ScoringEngine(index)
+        bm25 = BM25Engine(terms)
+
+        results.append(measure("extract_skills", lambda: extractor.extract(text), runs * 2, jobs=size))
+        results.append(measure("skill_index.query", lambda: index.query(["Python", "SQL"], "any", 0, 50), runs * 5, jobs=size))
+        results.append(measure("scoring.rank", lambda: scoring.rank(found, top_k=10), runs * 2, jobs=size))
+        results.append(measure("bm25.top", lambda: bm25.top(text, 10), runs * 2, jobs=size))
+        results.append(measure(
+            "rank_blended", lambda: scoring.rank(found, 10, bm25.relative_scores(text, scoring.job_ids)), runs * 2, jobs=size
+        ))
+    return results
+
+
+def _load_catalog(size: int, loaded: int) -> None:
+    """Bulk-insert synthetic jobs ``loaded``..``size`` into the app.main tables."""
+    import json as _json
+
+    from sqlalchemy import insert
+    from sqlmodel import Session
+
+    from app.db.session import engine
+    from app.main import Job
+    from app.services.catalog_cache import bump_catalog_version
+    from app.services.skill_index import JobSkill, job_skill_index, normalize_skill
+    from bench import corpus
+
+    jobs = corpus.job_catalog(size)[loaded:]
+    with Session(engine) as session:
+        session.execute(insert(Job), [
+            {**job, "id": job["id"] + JOB_ID_OFFSET, "skills": _json.dumps(job["skills"]),
+             "requirements": _json.dumps(job["requirements"])}
+            for job in jobs
+        ])
+        session.execute(insert(JobSkill), [
+            {"job_id": job["id"] + JOB_ID_OFFSET, "skill": skill}
+            for job in jobs
+            for skill in {normalize_skill(s) for s in job["skills"]}
+        ])
+        bump_catalog_version(session)
+        session.commit()
+        job_skill_index.load(session)
+
+
+def bench_endpoints(sizes: List[int], runs: int, workdir: str) -> List[Dict]:
+    """In-process requests against app.main: resume upload and skill filter."""
+    from fastapi.testclient import TestClient
+    from sqlmodel import Session, select
+
+    from app.db.session import engine
+    from app.main import Resume, app
+    from app.services.storage import get_store
+    from bench import corpus
+
+    results = []
+    resume = corpus.resume_text(600).encode("utf-8")
+    loaded = 0
+    try:
+        with TestClient(app) as client:
+            for size in sizes:
+                _load_catalog(size, loaded)
+                loaded = size
+
+                def upload():
+                    r = client.post("/resumes/upload", files={"file": ("resume.txt", resume)}, data={"job_id": 1, "uploaded_by": "bench"})
+                    assert r.status_code == 200, r.text
+
+                def filter_jobs():
+                    r = client.get("/jobs/filter", params={"skill": ["Python", "SQL"], "mode": "any", "limit": 50})
+                    assert r.status_code == 200, r.text
+
+                results.append(measure("POST /resumes/upload", upload, runs, jobs=size))
+                results.append(measure("GET /jobs/filter", filter_jobs, runs * 5, jobs=size))
+    finally:
+        # resume.file_path holds storage keys; remove the files this run stored
+        store = get_store()
+        with Session(engine) as session:
+            for file_path in set(session.exec(select(Resume.file_path)).all()):
+                key = store.key_of(file_path) if file_path else None
+                if key:
+                    store.delete(key)
+    return results
+
+
+GROUPS = {"functions": bench_functions, "endpoints": bench_endpoints}
+
+
+def _run_group(name: str, sizes: List[int], runs: int, workdir: str) -> List[Dict]:
+    import logging
+
+    logging.disable(logging.INFO)  # per-request logging would dominate the timings
+    return GROUPS[name](sizes, runs, workdir)
+
+
+# -------------------------
+# Baseline comparison
+# -------------------------
+def compare(results: List[Dict], baseline: List[Dict], tolerance: float) -> List[Dict]:
+    """Rows slower than baseline by more than ``tolerance`` (0.3 = 30%)."""
+    before = {r["name"]: r for r in baseline}
+    regressions = []
+    for r in results:
+        base = before.get(r["name"])
+        if base is None or base["median_ms"] <= 0:
+            continue
+        r["baseline_ms"] = base["median_ms"]
+        r["change"] = round(r["median_ms"] / base["median_ms"] - 1, 4)
+        if r["change"] > tolerance:
+            regressions.append(r)
+    return regressions
+
+
+def print_table(results: List[Dict]) -> None:
+    print(f"{'benchmark':<58}{'median ms':>11}{'p95 ms':>10}{'baseline':>10}{'change':>9}")
+    for r in results:
+        baseline = f"{r['baseline_ms']:.3f}" if "baseline_ms" in r else "-"
+        change = f"{r['change']:+.0%}" if "change" in r else "-"
+        print(f"{r['name']:<58}{r['median_ms']:>11.3f}{r['p95_ms']:>10.3f}{baseline:>10}{change:>9}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the skillmatcher micro-benchmarks")
+    parser.add_argument("--group", action="append", choices=sorted(GROUPS), help="Only these groups")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="Catalog sizes, comma separated")
+    parser.add_argument("--runs", type=int, default=10, help="Timed calls per benchmark (some use a multiple)")
+    parser.add_argument("--quick", action="store_true", help="Only the 1k catalog and 3 runs")
+    parser.add_argument("--json", type=Path, help="Write results to this file")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Overwrite the baseline with these results")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="Allowed slowdown before failing (0.3 = 30%%)")
+    args = parser.parse_args(argv)
+
+    sizes = [1000] if args.quick else sorted(int(s) for s in args.sizes.split(","))
+    runs = 3 if args.quick else args.runs
+
+    results: List[Dict] = []
+    with tempfile.TemporaryDirectory(prefix="skillmatcher-bench-") as workdir:
+        # Inherited by the group processes before they import the app
+        os.environ["DATABASE_URL"] = f"sqlite:///{Path(workdir) / 'bench.db'}"
+        os.environ["UPLOAD_DIR"] = str(Path(workdir) / "uploads")
+        ctx = get_context("spawn")
+        for name in args.group or list(GROUPS):
+            print(f"Running {name} benchmarks...", file=sys.stderr)
+            with ctx.Pool(1) as pool:
+                results += pool.apply(_run_group, (name, sizes, runs, workdir))
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "sizes": sizes,
+            "runs": runs,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+    regressions: List[Dict] = []
+    if args.baseline.exists() and not args.save_baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text())["results"], args.tolerance)
+    print_table(results)
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Baseline saved to {args.baseline}")
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) slower than baseline by more than {args.tolerance:.0%}:")
+        for r in regressions:
+            print(f"  {r['name']}: {r['baseline_ms']:.3f} -> {r['median_ms']:.3f} ms ({r['change']:+.0%})")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,18 @@
 # create_and_seed.py (run from backend folder)
-from app.db.session import create_db_and_tables
+from sqlmodel import Session, select
+
+from app.db.models import Resume
+from app.db.session import create_db_and_tables, engine
+from app.services.candidates import backfill_resumes
 from app.services.seed import seed_default_jobs
+from app.services.text_store import get_texts
 
 if __name__ == "__main__":
     create_db_and_tables()
     seed_default_jobs()
+    # Resumes stored before the resume-skill index existed
+    with Session(engine) as session:
+        rows = session.exec(select(Resume.id, Resume.text_digest)).all()
+        texts = get_texts(session, (digest for _, digest in rows))
+        backfill_resumes(session, [(resume_id, texts.get(digest, "")) for resume_id, digest in rows])
     print("Database created and seed run.")
@@ -0,0 +1,37 @@
+# import_jobs.py (run from backend folder)
+"""Bulk-load jobs from an NDJSON or CSV feed.
+
+    python import_jobs.py feed.ndjson
+    python import_jobs.py feed.csv --batch-size 10000
+    gunzip -c feed.ndjson.gz | python import_jobs.py - --format ndjson
+"""
+import argparse
+import json
+import sys
+from dataclasses import asdict
+
+from app.main import Job, create_db_and_tables
+from app.db.session import engine
+from app.services.job_import import FORMATS, ImportReport, import_jobs
+
+
+def _progress(report: ImportReport) -> None:
+    rate = report.imported / report.seconds if report.seconds else 0
+    print(f"\r{report.imported:>10,} imported  {report.rejected:>8,} rejected  {rate:>9,.0f}/s", end="", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import jobs into the catalog")
+    parser.add_argument("path", help="NDJSON or CSV file, or - for stdin")
+    parser.add_argument("--format", choices=FORMATS, help="Default: from the file extension")
+    parser.add_argument("--batch-size", type=int, help="Records per upsert batch (default: IMPORT_BATCH_SIZE)")
+    args = parser.parse_args()
+
+    fmt = args.format or ("csv" if args.path.lower().endswith(".csv") else "ndjson")
+    create_db_and_tables()
+    # newline="" lets csv handle line endings inside quoted fields
+    source = sys.stdin if args.path == "-" else open(args.path, encoding="utf-8-sig", newline="")
+    with source:
+        report = import_jobs(engine, Job, source, fmt, args.batch_size, _progress)
+    print(file=sys.stderr)
+    print(json.dumps(asdict(report), indent=2))
@@ -0,0 +1,55 @@
+# tests/conftest.py
+"""Shared fixtures: a throwaway database and upload directory, and the v1 routers on a bare app.
+
+The environment is set before anything under ``app`` is imported, because
+settings and the engine are read at import time. ``app.main`` defines its own
+``job`` and ``resume`` tables, so its tests (tests/main_app) cannot share a
+process with the v1 ones: they are collected only when MAIN_APP_TESTS is set,
+and test_main_app.py runs them in a pytest of their own.
+"""
+import os
+import tempfile
+
+_tmp = tempfile.mkdtemp(prefix="skillmatcher-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/test.db"
+os.environ["UPLOAD_DIR"] = os.path.join(_tmp, "uploads")
+os.environ["STORAGE_GC_INTERVAL"] = "0"
+
+collect_ignore = [] if os.environ.get("MAIN_APP_TESTS") else ["main_app"]
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="session")
+def v1_app() -> FastAPI:
+    # app.main defines its own Job/Resume tables, so the v1 routers get an app of their own
+    from app.api.v1.routers import jobs, resume_analysis, resumes
+    from app.db.session import create_db_and_tables
+    from app.services.seed import seed_default_jobs
+
+    create_db_and_tables()
+    seed_default_jobs()
+    app = FastAPI()
+    app.include_router(jobs.router, prefix="/jobs")
+    app.include_router(resumes.router)
+    app.include_router(resume_analysis.router, prefix="/resume")
+    return app
+
+
+@pytest.fixture
+def client(v1_app):
+    with TestClient(v1_app) as client:
+        yield client
+
+
+@pytest.fixture
+def job_id(v1_app) -> int:
+    """The seeded Backend Developer job (python, sql, api, django, fastapi)."""
+    from sqlmodel import Session, select
+    from app.db.models import Job
+    from app.db.session import engine
+
+    with Session(engine) as session:
+        return session.exec(select(Job.id).where(Job.title == "Backend Developer")).one()
@@ -0,0 +1,28 @@
+# tests/main_app/conftest.py
+"""Fixtures for app.main, which is only imported here (see tests/conftest.py)."""
+import os
+
+os.environ["ADMIN_TOKEN"] = "test-admin"
+os.environ["ADMISSION_ENABLED"] = "0"
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(scope="session")
+def main_client():
+    from app.main import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def backend_job(main_client) -> int:
+    """The seeded Backend Developer job (Python, FastAPI, SQL, REST APIs, Docker)."""
+    from sqlmodel import Session, select
+    from app.db.session import engine
+    from app.main import Job
+
+    with Session(engine) as session:
+        return session.exec(select(Job.id).where(Job.title == "Backend Developer")).first()
@@ -0,0 +1,52 @@
+# tests/main_app/test_admin.py
+import json
+
+ADMIN = {"X-Admin-Token": "test-admin"}  # see conftest.py
+# Skills no seeded job has, so the other tests' expectations hold
+RECORDS = [
+    {"id": 900_001, "title": "COBOL Maintainer", "skills": ["COBOL", "JCL"], "demand": "Low"},
+    {"id": 900_002, "title": "Fortran Modeller", "skills": ["Fortran", "COBOL"]},
+    {"title": "No id"},
+]
+
+
+def _ndjson(records) -> bytes:
+    return "".join(json.dumps(r) + "\n" for r in records).encode()
+
+
+def test_import_requires_the_admin_token(main_client):
+    response = main_client.post("/admin/jobs/import", content=_ndjson(RECORDS[:1]))
+    assert response.status_code == 401
+    wrong = main_client.post("/admin/jobs/import", content=_ndjson(RECORDS[:1]), headers={"X-Admin-Token": "nope"})
+    assert wrong.status_code == 401
+
+
+def test_import_streams_progress_and_updates_the_catalog(main_client):
+    etag = main_client.get("/jobs/").headers["etag"]
+    response = main_client.post(
+        "/admin/jobs/import",
+        params={"batch_size": 1},
+        content=_ndjson(RECORDS),
+        headers={**ADMIN, "Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200, response.text
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["status"] for line in lines] == ["progress", "progress", "done"]
+    done = lines[-1]
+    assert (done["imported"], done["rejected"]) == (2, 1)
+    assert "missing or non-integer id" in done["errors"][0]
+
+    # Visible at once: the catalog version moved and the skill index follows it
+    assert main_client.get("/jobs/", headers={"If-None-Match": etag}).status_code == 200
+    found = main_client.get("/jobs/filter", params={"skill": "cobol"}).json()
+    assert {job["title"] for job in found} == {"COBOL Maintainer", "Fortran Modeller"}
+    assert main_client.get("/jobs/900001").json()["demand"] == "Low"
+
+
+def test_import_csv(main_client):
+    body = b"id,title,skills\n900003,Ada Engineer,Ada;SPARK\n"  # lists are ;-separated in CSV
+    response = main_client.post(
+        "/admin/jobs/import", content=body, headers={**ADMIN, "Content-Type": "text/csv"},
+    )
+    assert json.loads(response.text.splitlines()[-1])["imported"] == 1
+    assert [job["title"] for job in main_client.get("/jobs/filter", params={"skill": "Ada"}).json()] == ["Ada Engineer"]
@@ -0,0 +1,61 @@
+# tests/main_app/test_jobs.py
+import json
+
+from app.main import DATA_FILE
+
+SEEDED = json.loads(DATA_FILE.read_text())
+
+
+def _titles_with(*skills, mode=all):
+    wanted = [s.lower() for s in skills]
+    return {job["title"] for job in SEEDED if mode(s in {k.lower() for k in job["skills"]} for s in wanted)}
+
+
+def test_filter_jobs_by_all_skills(main_client):
+    response = main_client.get("/jobs/filter", params={"skill": ["Python", "sql"], "limit": 100})
+    assert response.status_code == 200
+    titles = {job["title"] for job in response.json()}
+    assert titles == _titles_with("python", "sql") and "Backend Developer" in titles
+    assert int(response.headers["X-Total-Count"]) == len(titles)
+
+
+def test_filter_jobs_by_any_skill_pages(main_client):
+    expected = _titles_with("react", "docker", mode=any)
+    first = main_client.get("/jobs/filter", params={"skill": ["React", "Docker"], "mode": "any", "limit": 2})
+    assert int(first.headers["X-Total-Count"]) == len(expected)
+    assert len(first.json()) == 2
+    rest = main_client.get("/jobs/filter", params={"skill": ["React", "Docker"], "mode": "any", "skip": 2, "limit": 100})
+    assert {job["title"] for job in first.json() + rest.json()} == expected
+
+
+def test_filter_jobs_revalidates_with_the_catalog_etag(main_client):
+    params = {"skill": ["Python"]}
+    etag = main_client.get("/jobs/filter", params=params).headers["etag"]
+    assert main_client.get("/jobs/filter", params=params, headers={"If-None-Match": etag}).status_code == 304
+
+
+def _upload(client, job_id, name, text, uploaded_by):
+    response = client.post(
+        "/resumes/upload",
+        data={"job_id": job_id, "uploaded_by": uploaded_by},
+        files={"file": (name, text.encode(), "text/plain")},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["recommendations"][0]
+
+
+def test_candidates_are_ranked_by_skill_overlap(main_client, backend_job):
+    strong = _upload(main_client, backend_job, "strong.txt", "Skills\nPython, FastAPI, SQL, Docker\n", "ranking")
+    weak = _upload(main_client, backend_job, "weak.txt", "Skills\nPython, Excel\n", "ranking")
+    assert strong["match_percent"] > weak["match_percent"]
+
+    response = main_client.get(f"/jobs/{backend_job}/candidates", params={"top_k": 50})
+    assert response.status_code == 200
+    ours = [c for c in response.json() if c["uploaded_by"] == "ranking"]
+    assert [c["filename"] for c in ours] == ["strong.txt", "weak.txt"]
+    assert ours[0]["match_percent"] == strong["match_percent"]
+    assert ours[1]["matched_skills"] == ["Python"]
+
+
+def test_candidates_for_an_unknown_job(main_client):
+    assert main_client.get("/jobs/999999/candidates").status_code == 404
@@ -0,0 +1,87 @@
+# tests/main_app/test_resumes.py
+import io
+import json
+import zipfile
+
+BACKEND_CV = b"Jane Doe\nSkills\nPython, SQL, FastAPI\nExperience\n- Built REST APIs in Python\n"
+ANALYST_CV = b"John Roe\nSkills\nExcel, Pandas\nEducation\nBSc Statistics\n"
+
+
+def _lines(response):
+    return [json.loads(line) for line in response.text.splitlines() if line]
+
+
+def _zip(**files: bytes) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def test_batch_upload_streams_one_line_per_file(main_client, backend_job):
+    response = main_client.post(
+        "/resumes/batch",
+        data={"job_id": backend_job, "uploaded_by": "batch"},
+        files=[
+            ("files", ("jane.txt", BACKEND_CV, "text/plain")),
+            ("files", ("fake.pdf", b"not a pdf", "application/pdf")),
+            ("files", ("more.zip", _zip(**{"john.txt": ANALYST_CV}), "application/zip")),
+        ],
+    )
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = {line["filename"]: line for line in _lines(response)}
+    assert {name: line["status"] for name, line in lines.items()} == {"jane.txt": "ok", "fake.pdf": "error", "john.txt": "ok"}
+
+    jane = lines["jane.txt"]["recommendations"][0]
+    assert set(jane["matched_skills"]) >= {"Python", "SQL", "FastAPI"}
+    assert "Docker" in jane["missing_skills"]
+    # Every ok line names a saved resume
+    saved = {r["id"]: r["filename"] for r in main_client.get("/resumes/", params={"limit": 500}).json()}
+    assert saved[lines["jane.txt"]["resume_id"]] == "jane.txt"
+    assert saved[lines["john.txt"]["resume_id"]] == "john.txt"
+
+
+def test_batch_upload_unknown_job(main_client):
+    response = main_client.post(
+        "/resumes/batch",
+        data={"job_id": 999_999, "uploaded_by": "batch"},
+        files=[("files", ("jane.txt", BACKEND_CV, "text/plain"))],
+    )
+    assert response.status_code == 404
+
+
+def _batch_resume_id(client, job_id, name, data) -> int:
+    response = client.post(
+        "/resumes/batch",
+        data={"job_id": job_id, "uploaded_by": "download"},
+        files=[("files", (name, data, "text/plain"))],
+    )
+    (line,) = _lines(response)
+    return line["resume_id"]
+
+
+def test_download_improved_resume_with_etag_and_range(main_client, backend_job):
+    resume_id = _batch_resume_id(main_client, backend_job, "jane.txt", BACKEND_CV)
+    url = f"/resumes/download/{resume_id}"
+
+    full = main_client.get(url)
+    assert full.status_code == 200
+    assert 'filename="Improved_jane.txt"' in full.headers["content-disposition"]
+    assert "Optimized for Backend Developer" in full.text
+    assert "Docker" in full.text  # a missing skill
+    etag = full.headers["etag"]
+    assert main_client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    part = main_client.get(url, headers={"Range": "bytes=10-19"})
+    assert part.status_code == 206
+    assert part.headers["content-range"] == f"bytes 10-19/{len(full.content)}"
+    assert part.content == full.content[10:20]
+    # A stale If-Range gets the whole body
+    stale = main_client.get(url, headers={"Range": "bytes=10-19", "If-Range": '"stale"'})
+    assert stale.status_code == 200 and stale.content == full.content
+
+
+def test_download_unknown_resume(main_client):
+    assert main_client.get("/resumes/download/999999").status_code == 404
@@ -0,0 +1,29 @@
+# tests/main_app/test_tasks.py
+from app.services.task_queue import DONE, run_one
+
+
+def test_background_upload_runs_in_the_worker(main_client, backend_job):
+    response = main_client.post(
+        "/resumes/upload",
+        params={"background": True},
+        data={"job_id": backend_job, "uploaded_by": "tests"},
+        files={"file": ("queued.txt", b"Skills\nPython, FastAPI, SQL\n", "text/plain")},
+    )
+    assert response.status_code == 202, response.text
+    body = response.json()
+    assert body["status_url"] == f"/resumes/tasks/{body['task_id']}"
+
+    assert run_one("tests")
+    status = main_client.get(body["status_url"]).json()
+    assert status["status"] == DONE, status
+    recommendation = status["result"]["recommendations"][0]
+    assert set(recommendation["matched_skills"]) >= {"Python", "FastAPI", "SQL"}
+    assert "Docker" in recommendation["missing_skills"]
+
+    # Saved and indexed like a direct upload
+    candidates = main_client.get(f"/jobs/{backend_job}/candidates").json()
+    assert status["result"]["resume_id"] in [c["id"] for c in candidates]
+
+
+def test_unknown_task_is_404(main_client):
+    assert main_client.get("/resumes/tasks/nope").status_code == 404
@@ -0,0 +1,126 @@
+# tests/test_admission.py
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.services import admission
+from app.services.admission import AdmissionController, AdmissionMiddleware, TokenBucket
+
+
+@pytest.fixture
+def gated(monkeypatch):
+    monkeypatch.setattr(admission.settings, "ADMISSION_RATE", 0.001)
+    monkeypatch.setattr(admission.settings, "ADMISSION_BURST", 2)
+    controller = AdmissionController()
+    monkeypatch.setattr(admission, "controller", controller)
+
+    app = FastAPI()
+    app.add_middleware(AdmissionMiddleware)
+
+    @app.post("/resumes/upload")
+    def upload():
+        return {"in_flight": dict(controller._in_flight)}
+
+    @app.post("/resumes/batch")
+    def batch():
+        return StreamingResponse(iter([b"{}\n"] * 3), media_type="application/x-ndjson")
+
+    @app.get("/jobs")
+    def jobs():
+        return []
+
+    with TestClient(app) as client:
+        yield client, controller
+
+
+def test_token_bucket_refills_at_its_rate():
+    bucket = TokenBucket(rate=1.0, burst=2)
+    now = bucket.updated
+    assert bucket.take(now) == 0 and bucket.take(now) == 0
+    assert bucket.take(now) == pytest.approx(1.0)
+    assert bucket.take(now + 1.0) == 0
+
+
+def test_clients_are_rate_limited_separately(gated):
+    client, controller = gated
+    controller.trusted_proxies = frozenset({"testclient"})  # TestClient's peer address
+    alice = {"X-API-Key": "alice"}
+    assert [client.post("/resumes/upload", headers=alice).status_code for _ in range(3)] == [200, 200, 429]
+    rejected = client.post("/resumes/upload", headers=alice)
+    assert int(rejected.headers["Retry-After"]) >= 1
+    assert client.post("/resumes/upload", headers={"X-API-Key": "bob"}).status_code == 200
+    # Reads are never gated
+    assert all(client.get("/jobs").status_code == 200 for _ in range(5))
+
+
+def test_headers_from_untrusted_peers_do_not_pick_the_bucket(gated):
+    client, controller = gated
+    statuses = [
+        client.post("/resumes/upload", headers={"X-API-Key": f"key-{i}", "X-Forwarded-For": f"10.0.0.{i}"}).status_code
+        for i in range(3)
+    ]
+    assert statuses == [200, 200, 429]
+
+
+def test_forwarded_client_behind_a_trusted_proxy(gated):
+    client, controller = gated
+    controller.trusted_proxies = frozenset({"testclient"})
+    # The client made up the first hop; the proxy appended the address it saw
+    spoofed = [
+        client.post("/resumes/upload", headers={"X-Forwarded-For": f"10.0.0.{i}, 192.0.2.7"}).status_code
+        for i in range(3)
+    ]
+    assert spoofed == [200, 200, 429]
+    assert client.post("/resumes/upload", headers={"X-Forwarded-For": "192.0.2.8"}).status_code == 200
+
+
+def test_rejections_carry_cors_headers(monkeypatch):
+    from fastapi.middleware.cors import CORSMiddleware
+
+    monkeypatch.setattr(admission.settings, "ADMISSION_RATE", 0.001)
+    monkeypatch.setattr(admission.settings, "ADMISSION_BURST", 1)
+    monkeypatch.setattr(admission, "controller", AdmissionController())
+    app = FastAPI()
+    # The order app.main uses
+    admission.install(app)
+    app.add_middleware(CORSMiddleware, allow_origins=["*"])
+
+    @app.post("/resumes/upload")
+    def upload():
+        return {}
+
+    with TestClient(app) as client:
+        origin = {"Origin": "https://example.com"}
+        assert client.post("/resumes/upload", headers=origin).status_code == 200
+        rejected = client.post("/resumes/upload", headers=origin)
+    assert rejected.status_code == 429
+    assert rejected.headers["access-control-allow-origin"] == "*"
+
+
+def test_slots_are_held_until_the_response_is_sent(gated):
+    client, controller = gated
+    assert client.post("/resumes/upload").json() == {"in_flight": {"interactive": 1, "bulk": 0}}
+    assert client.post("/resumes/batch", headers={"X-API-Key": "bulk"}).text == "{}\n" * 3
+    assert controller.stats()["in_flight"] == {"interactive": 0, "bulk": 0}
+    assert controller.stats()["bytes"] == 0
+
+
+def test_bulk_lane_is_capped(monkeypatch):
+    monkeypatch.setattr(admission.settings, "ADMISSION_BULK_SLOTS", 1)
+    controller = AdmissionController()
+    from starlette.requests import Request
+
+    def request(path):
+        return Request({"type": "http", "method": "POST", "path": path, "headers": [], "query_string": b""})
+
+    async def scenario():
+        await controller.acquire(request("/resumes/batch"))
+        with pytest.raises(admission.Rejected) as rejected:
+            await controller.acquire(request("/resumes/batch"))
+        return rejected.value
+
+    rejected = asyncio.run(scenario())
+    assert (rejected.status, rejected.reason) == (503, "bulk_slots")
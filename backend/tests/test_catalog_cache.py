@@ -0,0 +1,22 @@
+# tests/test_catalog_cache.py
+from sqlmodel import Session
+
+from app.db.session import engine
+from app.services.catalog_cache import CatalogCache, bump_catalog_version
+
+
+def test_snapshot_is_dropped_only_when_the_bump_commits(v1_app):
+    cache = CatalogCache(engine, lambda session: [{"id": 1}])
+    before = cache.get()
+
+    with Session(engine) as session:
+        bump_catalog_version(session)
+        # Not yet: a reload now would still read the old version
+        assert cache.get() is before
+        session.rollback()
+    assert cache.get() is before
+
+    with Session(engine) as session:
+        bump_catalog_version(session)
+        session.commit()
+    assert cache.get().version == before.version + 1
@@ -0,0 +1,13 @@
+# tests/test_improve.py
+from app.services.improve import build_improved_resume, generate_improved_resume
+from app.services.sections import ResumeSections, sectionize
+
+CV = "Jane Doe\nSkills\nPython, SQL\nExperience\n- Worked on billing APIs\nEducation\nBSc Computer Science\n"
+
+
+def test_stored_sections_give_the_same_resume_as_the_text():
+    stored = ResumeSections.from_dict(sectionize(CV).to_dict())
+    improved = build_improved_resume(stored, "Backend Developer", ["Django"])
+    assert improved == generate_improved_resume(CV, "Backend Developer", ["Django"])
+    assert "Optimized for Backend Developer" in improved
+    assert "  • Python, SQL" in improved and "  • Django" in improved
@@ -0,0 +1,76 @@
+# tests/test_job_import.py
+import json
+from typing import List, Optional
+
+import anyio
+import pytest
+from sqlmodel import Field, SQLModel, Session, delete, select
+
+from app.db.bulk import upsert
+from app.db.session import engine
+from app.services.job_import import ImportReport, import_stream
+from app.services.skill_index import JobSkill, job_skill_index
+
+FIRST_ID = 950_000
+
+
+class ImportedJob(SQLModel, table=True):
+    """Same columns as app.main's Job, which cannot share a process with the v1 models."""
+    __tablename__ = "imported_job_test"
+
+    id: int = Field(primary_key=True)
+    title: str
+    description: str = ""
+    skills: str = "[]"
+    requirements: str = "[]"
+    demand: Optional[str] = "unknown"
+    avg_salary: Optional[str] = None
+
+
+@pytest.fixture
+def table(v1_app):
+    ImportedJob.__table__.create(engine, checkfirst=True)
+    yield
+    with Session(engine) as session:
+        session.exec(delete(JobSkill).where(JobSkill.job_id >= FIRST_ID))
+        session.commit()
+        job_skill_index.load(session)
+    ImportedJob.__table__.drop(engine)
+
+
+async def _chunks(data: bytes):
+    for start in range(0, len(data), 64):
+        yield data[start:start + 64]
+
+
+def test_import_reports_progress_per_batch(table):
+    records = [{"id": FIRST_ID + i, "title": f"Job {i}", "skills": ["Cobol"]} for i in range(5)]
+    body = "\n".join(map(json.dumps, records)).encode() + b"\n{broken\n"
+    progress: List[ImportReport] = []
+
+    async def on_progress(report: ImportReport) -> None:
+        progress.append(report)
+
+    report = anyio.run(import_stream, engine, ImportedJob, _chunks(body), "ndjson", 2, on_progress)
+    assert [p.imported for p in progress] == [2, 4, 5]
+    assert (report.imported, report.rejected, report.batches) == (5, 1, 3)
+    assert progress[-1] is not report  # callers get snapshots
+    assert FIRST_ID + 4 in job_skill_index.postings("cobol")
+
+
+def test_upsert_fills_columns_missing_from_some_rows(table):
+    with Session(engine) as session:
+        upsert(session, ImportedJob, [{"id": FIRST_ID, "title": "Old", "demand": "high"}])
+        session.commit()
+        upsert(session, ImportedJob, [
+            {"id": FIRST_ID + 1, "title": "New", "description": "Fresh"},
+            {"id": FIRST_ID, "title": "Renamed", "avg_salary": "90k"},
+        ])
+        session.commit()
+        rows = {job.id: job for job in session.exec(select(ImportedJob))}
+    assert rows[FIRST_ID].title == "Renamed"
+    assert rows[FIRST_ID].avg_salary == "90k"  # not dropped because the first row lacks it
+    assert rows[FIRST_ID].description == ""  # set by another row only: the field default
+    assert rows[FIRST_ID].demand == "high"  # set by no row in the batch: left alone
+    assert rows[FIRST_ID + 1].description == "Fresh"
+    assert rows[FIRST_ID + 1].avg_salary is None
@@ -0,0 +1,18 @@
+# tests/test_main_app.py
+"""Runs tests/main_app in a pytest process of its own (see tests/conftest.py)."""
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+BACKEND = Path(__file__).resolve().parents[1]
+
+
+def test_main_app_suite():
+    # The child's conftest gives it a database and upload directory of its own
+    env = {**os.environ, "MAIN_APP_TESTS": "1"}
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "tests/main_app"],
+        cwd=BACKEND, env=env, capture_output=True, text=True, timeout=600,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
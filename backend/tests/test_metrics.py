@@ -0,0 +1,54 @@
+# tests/test_metrics.py
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.services import metrics
+from app.services.metrics import REQUEST_LATENCY, REQUESTS_IN_FLIGHT, RequestTimingMiddleware
+
+
+@pytest.fixture
+def timed_client():
+    app = FastAPI()
+    app.add_middleware(RequestTimingMiddleware)
+
+    @app.get("/items/{item_id}")
+    def item(item_id: int):
+        return {"id": item_id}
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([b"a\n", b"b\n"]), media_type="application/x-ndjson")
+
+    with TestClient(app) as client:
+        yield client
+
+
+def _count(route: str, status: str) -> int:
+    series = REQUEST_LATENCY._series.get(("GET", route, status))
+    return sum(series[0]) if series else 0
+
+
+def test_requests_are_timed_by_route_template(timed_client):
+    before = _count("/items/{item_id}", "200")
+    assert timed_client.get("/items/1").status_code == 200
+    assert timed_client.get("/items/2").status_code == 200
+    assert _count("/items/{item_id}", "200") == before + 2
+    assert timed_client.get("/nowhere").status_code == 404
+    assert _count("unmatched", "404") >= 1
+    assert REQUESTS_IN_FLIGHT._values[()] == 0
+
+
+def test_streamed_bodies_pass_through(timed_client):
+    response = timed_client.get("/stream")
+    assert response.text == "a\nb\n"
+    assert _count("/stream", "200") >= 1
+
+
+def test_metric_subclasses_must_render_samples():
+    class Incomplete(metrics._Metric):
+        kind = "gauge"
+
+    with pytest.raises(TypeError):
+        Incomplete("incomplete", "never registered")
@@ -0,0 +1,34 @@
+# tests/test_parse_cache.py
+import asyncio
+import threading
+from uuid import uuid4
+
+from app.services.parse_cache import ParseCache
+
+
+def test_aget_or_parse_keeps_database_work_off_the_event_loop(v1_app, monkeypatch):
+    cache = ParseCache(maxsize=4)
+    threads = []
+    for name in ("get", "put"):
+        original = getattr(cache, name)
+
+        def record(*args, _original=original, **kwargs):
+            threads.append(threading.get_ident())
+            return _original(*args, **kwargs)
+
+        monkeypatch.setattr(cache, name, record)
+
+    async def parse():
+        return "Python and SQL"
+
+    async def run():
+        loop_thread = threading.get_ident()
+        key = f"{uuid4().hex}:test"
+        first = await cache.aget_or_parse(key, parse)
+        second = await cache.aget_or_parse(key, parse)  # served from memory
+        return loop_thread, first, second
+
+    loop_thread, first, second = asyncio.run(run())
+    assert first == second == "Python and SQL"
+    assert len(threads) == 2  # one lookup, one store; the second call never left memory
+    assert loop_thread not in threads
@@ -0,0 +1,78 @@
+# tests/test_pdf_extract.py
+from contextlib import contextmanager
+import time
+
+import pytest
+
+from app.services import pdf_extract
+from app.services.parse_cache import ParseCache
+from app.services.pdf_extract import PdfBackend, PdfDocument, PdfText, extract_pdf
+
+
+class _SlowDocument(PdfDocument):
+    page_count = 5
+
+    def page_text(self, index: int) -> str:
+        time.sleep(0.05)
+        return f"page {index}"
+
+
+class _BrokenBackend(PdfBackend):
+    name = "broken"
+    module = "json"
+
+    @contextmanager
+    def open(self, path):
+        raise RuntimeError("cannot open")
+        yield
+
+
+class _SlowBackend(PdfBackend):
+    name = "slow"
+    module = "json"  # always importable
+
+    @contextmanager
+    def open(self, path):
+        yield _SlowDocument()
+
+
+@pytest.fixture
+def slow_backend(monkeypatch):
+    monkeypatch.setitem(pdf_extract.BACKENDS, "slow", _SlowBackend())
+    monkeypatch.setattr(pdf_extract.settings, "PDF_PAGE_WORKERS", 1)
+
+
+def test_backends_must_implement_the_interface():
+    with pytest.raises(TypeError):
+        PdfBackend()
+    with pytest.raises(TypeError):
+        PdfDocument()
+
+
+def test_complete_extraction_is_not_truncated(slow_backend, tmp_path):
+    assert extract_pdf(tmp_path / "cv.pdf", backends="slow", deadline=5) == PdfText(
+        "page 0\npage 1\npage 2\npage 3\npage 4", truncated=False
+    )
+
+
+def test_page_cap_is_not_truncation(slow_backend, tmp_path):
+    assert extract_pdf(tmp_path / "cv.pdf", backends="slow", max_pages=2, deadline=5) == PdfText("page 0\npage 1")
+
+
+def test_deadline_marks_text_truncated(slow_backend, tmp_path):
+    result = extract_pdf(tmp_path / "cv.pdf", backends="slow", deadline=0.08)
+    assert result.truncated
+    assert result.text.startswith("page 0") and "page 4" not in result.text
+
+
+def test_failed_backends_mark_empty_text_truncated(monkeypatch, tmp_path):
+    monkeypatch.setitem(pdf_extract.BACKENDS, "broken", _BrokenBackend())
+    assert extract_pdf(tmp_path / "cv.pdf", backends="broken", deadline=5) == PdfText("", truncated=True)
+
+
+def test_truncated_text_is_not_cached(v1_app):
+    cache = ParseCache(maxsize=4)
+    assert cache.get_or_parse("partial:test", lambda: PdfText("page 0", truncated=True)) == "page 0"
+    assert cache.get("partial:test") is None
+    assert cache.get_or_parse("partial:test", lambda: PdfText("page 0\npage 1")) == "page 0\npage 1"
+    assert cache.get("partial:test").text == "page 0\npage 1"
@@ -0,0 +1,64 @@
+# tests/test_profiling.py
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.services import profiling
+from app.services.profiling import ID_HEADER, TOKEN_HEADER, ProfilingMiddleware
+
+TOKEN = {TOKEN_HEADER: "secret"}
+
+
+@pytest.fixture
+def profiled_app(monkeypatch, tmp_path):
+    monkeypatch.setattr(profiling.settings, "PROFILE_TOKEN", "secret")
+    monkeypatch.setattr(profiling.settings, "PROFILE_DIR", str(tmp_path))
+    monkeypatch.setattr(profiling.settings, "PROFILE_SLOW_SECONDS", 0.0)
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware)
+    app.state.started, app.state.release = asyncio.Event(), asyncio.Event()
+
+    @app.get("/hold")
+    async def hold():
+        app.state.started.set()
+        await app.state.release.wait()
+        return {"ok": True}
+
+    @app.get("/quick")
+    async def quick():
+        return {"ok": True}
+
+    return app
+
+
+def test_one_deep_profile_at_a_time(profiled_app):
+    async def scenario():
+        transport = httpx.ASGITransport(app=profiled_app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = asyncio.create_task(client.get("/hold", headers=TOKEN))
+            await profiled_app.state.started.wait()
+
+            busy = await client.get("/quick", headers=TOKEN)
+            unprofiled = await client.get("/quick")
+            profiled_app.state.release.set()
+            return await first, busy, unprofiled, await client.get("/quick", headers=TOKEN)
+
+    first, busy, unprofiled, after = asyncio.run(scenario())
+    assert first.status_code == 200 and first.headers[ID_HEADER]
+    assert busy.status_code == 409
+    assert unprofiled.status_code == 200 and ID_HEADER not in unprofiled.headers
+    assert after.status_code == 200 and after.headers[ID_HEADER] != first.headers[ID_HEADER]
+
+
+def test_sampler_stays_idle_unless_slow_profiling_is_enabled(profiled_app):
+    async def scenario():
+        transport = httpx.ASGITransport(app=profiled_app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get("/quick")
+
+    profiling.sampler._samples.clear()
+    assert asyncio.run(scenario()).status_code == 200
+    assert profiling.sampler._active == 0
+    assert not profiling.sampler._wake.is_set()
@@ -0,0 +1,41 @@
+# tests/test_relevance.py
+import asyncio
+import threading
+
+import numpy as np
+
+from app.db.models import Job
+from app.services import relevance
+from app.services.relevance import BM25Engine, TermIndex
+
+
+def test_bm25_prefers_the_matching_job():
+    index = TermIndex()
+    index.update(1, "Backend developer building Python APIs on PostgreSQL")
+    index.update(2, "Graphic designer for print and brand identity")
+    engine = BM25Engine(index)
+    assert [job_id for job_id, _ in engine.top("Python APIs and PostgreSQL", top_k=2)] == [1, 2]
+    assert engine.relative_scores("python", np.array([1, 2])).round(6).tolist() == [100.0, 0.0]
+
+
+def test_async_relevance_builds_off_the_event_loop(v1_app, monkeypatch):
+    built_on = []
+    build = relevance.get_relevance_engine
+
+    def recording_build(session, job_model):
+        built_on.append(threading.current_thread())
+        return build(session, job_model)
+
+    monkeypatch.setattr(relevance, "get_relevance_engine", recording_build)
+    monkeypatch.setattr(relevance, "_engine", None)  # as after a catalog change
+
+    async def score():
+        return threading.current_thread(), await relevance.arelevance_for(Job, "python sql fastapi", 2)
+
+    loop_thread, score = asyncio.run(score())
+    assert built_on and built_on[0] is not loop_thread
+    assert 0 <= score <= 100
+
+    # Once built, the engine is served straight from the event loop
+    asyncio.run(relevance.arelevance_for(Job, "python", 2))
+    assert len(built_on) == 1
@@ -0,0 +1,40 @@
+# tests/test_scoring.py
+import numpy as np
+
+from app.services.scoring import ScoringEngine
+from app.services.skill_index import SkillIndex
+
+
+def _index() -> SkillIndex:
+    index = SkillIndex()
+    index.add(1, ["Python", "SQL"])
+    index.add(2, ["Java", "SQL"])
+    index.add(3, ["Python", "Django", "SQL", "Docker"])
+    return index
+
+
+def test_weights_change_the_ranking():
+    plain = ScoringEngine(_index()).rank(["Python"], top_k=None)
+    assert [r.job_id for r in plain] == [1, 3, 2]
+
+    weighted = ScoringEngine(_index(), weights={"sql": 3}).rank(["Java"], top_k=None)
+    assert weighted[0].job_id == 2
+    assert weighted[0].score == 25.0  # java (1) of java (1) + sql (3)
+
+
+def test_jobs_without_skills_score_zero_and_stay_ranked():
+    scoring = ScoringEngine(_index(), job_ids=np.array([1, 2, 3, 4]))
+    ranked = scoring.rank(["Python"], top_k=None)
+    assert [r.job_id for r in ranked] == [1, 3, 2, 4]
+    assert ranked[-1].score == 0.0 and ranked[-1].total == 0
+
+    relevance = np.array([0.0, 0.0, 0.0, 100.0])
+    assert scoring.rank([], top_k=1, relevance=relevance)[0].job_id == 4
+
+
+def test_rank_batch_matches_rank():
+    scoring = ScoringEngine(_index(), job_ids=np.array([1, 2, 3, 4]))
+    skill_sets = [["Python"], ["Java", "SQL"], [], ["Docker", "Django"]]
+    relevance = [np.linspace(0, 100, 4), np.zeros(4), np.full(4, 50.0), np.array([100.0, 0, 0, 0])]
+    batch = scoring.rank_batch(skill_sets, top_k=3, relevance=relevance, chunk_size=3)
+    assert batch == [scoring.rank(s, top_k=3, relevance=r) for s, r in zip(skill_sets, relevance)]
@@ -0,0 +1,41 @@
+# tests/test_skill_index.py
+from sqlmodel import Session
+
+from app.db.session import engine
+from app.services.skill_index import SkillIndex, index_job, job_skill_index, unindex_job
+
+JOB_ID = 900_001
+
+
+def test_add_bumps_the_version_once():
+    index = SkillIndex()
+    index.add(1, ["Python"])
+    before = index.version
+    index.add(1, ["Python", "SQL"])
+    assert index.version == before + 1
+    assert index.postings("sql") == [1]
+
+
+def test_index_follows_the_commit_not_the_write(v1_app):
+    with Session(engine) as session:
+        index_job(session, JOB_ID, ["Cobol"])
+        assert JOB_ID not in job_skill_index.postings("cobol")
+        session.rollback()
+    assert JOB_ID not in job_skill_index.postings("cobol")
+
+    with Session(engine) as session:
+        index_job(session, JOB_ID, ["Cobol"])
+        session.flush()
+        assert JOB_ID not in job_skill_index.postings("cobol")
+        session.commit()
+    assert JOB_ID in job_skill_index.postings("cobol")
+
+    with Session(engine) as session:
+        unindex_job(session, JOB_ID)
+        # Closed without committing: the delete never happened
+    assert JOB_ID in job_skill_index.postings("cobol")
+
+    with Session(engine) as session:
+        unindex_job(session, JOB_ID)
+        session.commit()
+    assert JOB_ID not in job_skill_index.postings("cobol")
@@ -0,0 +1,114 @@
+# tests/test_storage.py
+import os
+import time
+
+import pytest
+
+from app.services import storage, uploads
+from app.services.storage import LocalStore, Store, content_key
+
+
+def _put(store: Store, key: str, data: bytes):
+    tmp = store.tmp_path()
+    tmp.write_bytes(data)
+    return store.put(tmp, key)
+
+
+def test_store_interface_is_abstract():
+    with pytest.raises(TypeError):
+        Store()
+
+
+def test_local_put_is_idempotent_and_refreshes_mtime(tmp_path):
+    store = LocalStore(tmp_path)
+    key = content_key("ab" * 32, ".txt")
+    path = _put(store, key, b"resume")
+    os.utime(path, (0, 0))
+    assert _put(store, key, b"resume") == path
+    assert path.stat().st_mtime > 0
+    assert list(store.iter_keys())[0][0] == key
+    assert not any(p.name.endswith(".part") for p in tmp_path.iterdir())
+
+
+def test_local_delete_respects_older_than(tmp_path):
+    store = LocalStore(tmp_path)
+    key = content_key("cd" * 32, ".txt")
+    _put(store, key, b"resume")
+    store.delete(key, older_than=time.time() - 60)
+    assert store.exists(key)
+    store.delete(key, older_than=time.time() + 60)
+    assert not store.exists(key)
+
+
+def test_garbage_collection_keeps_referenced_files(client, job_id, tmp_path, monkeypatch):
+    store = LocalStore(tmp_path)
+    monkeypatch.setattr(uploads, "get_store", lambda: store)
+    orphan = content_key("ef" * 32, ".txt")
+    _put(store, orphan, b"nobody uses me")
+    response = client.post(
+        "/resumes/upload",
+        data={"job_id": job_id},
+        files={"file": ("kept.txt", b"Skills\nPython\n", "text/plain")},
+    )
+    assert response.status_code == 200, response.text
+    kept = [key for key, _ in store.iter_keys() if key != orphan]
+    assert kept
+
+    stats = storage.collect_garbage(store, grace=0)
+    assert stats["deleted"] == 1
+    assert not store.exists(orphan)
+    assert all(store.exists(key) for key in kept)
+
+
+# -------------------------
+# S3, against moto's in-process stand-in
+# -------------------------
+@pytest.fixture
+def s3_store(monkeypatch, tmp_path):
+    moto = pytest.importorskip("moto")
+    import boto3
+
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setattr(storage.settings, "S3_BUCKET", "resumes")
+    monkeypatch.setattr(storage.settings, "S3_ENDPOINT_URL", "")
+    monkeypatch.setattr(storage.settings, "UPLOAD_DIR", str(tmp_path))
+    with moto.mock_aws():
+        boto3.client("s3").create_bucket(Bucket="resumes")
+        yield storage.S3Store()
+
+
+def _last_modified(store, key: str) -> float:
+    return store.client.head_object(Bucket=store.bucket, Key=store._object(key))["LastModified"].timestamp()
+
+
+def test_s3_put_uploads_once_and_touches_existing(s3_store):
+    key = content_key("01" * 32, ".txt")
+    path = _put(s3_store, key, b"resume")
+    assert path.read_bytes() == b"resume"
+    assert s3_store.exists(key)
+    first = _last_modified(s3_store, key)
+
+    time.sleep(1.1)  # S3 timestamps have one-second resolution
+    _put(s3_store, key, b"resume")
+    assert _last_modified(s3_store, key) > first
+    assert [k for k, _ in s3_store.iter_keys()] == [key]
+
+
+def test_s3_delete_respects_older_than(s3_store):
+    key = content_key("02" * 32, ".txt")
+    _put(s3_store, key, b"resume")
+    s3_store.delete(key, older_than=time.time() - 60)
+    assert s3_store.exists(key)
+    s3_store.delete(key, older_than=time.time() + 60)
+    assert not s3_store.exists(key)
+    assert not s3_store.cache.exists(key)
+    s3_store.delete(key, older_than=time.time() + 60)  # already gone
+
+
+def test_s3_local_path_downloads_into_the_cache(s3_store):
+    key = content_key("03" * 32, ".txt")
+    _put(s3_store, key, b"resume")
+    s3_store.cache.delete(key)
+    assert s3_store.local_path(key).read_bytes() == b"resume"
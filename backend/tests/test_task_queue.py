@@ -0,0 +1,67 @@
+# tests/test_task_queue.py
+import json
+
+import pytest
+from sqlmodel import Session, delete
+
+from app.db.session import engine
+from app.services import task_queue
+from app.services.task_queue import DONE, QUEUED, RUNNING, AnalysisTask, claim, complete, enqueue, fail, get_task, run_one
+
+
+@pytest.fixture(autouse=True)
+def empty_queue(v1_app):
+    with Session(engine) as session:
+        session.exec(delete(AnalysisTask))
+        session.commit()
+
+
+def test_complete_requires_the_current_claim():
+    task = enqueue("noop", {})
+    first = claim("worker-a", visibility_timeout=0.0001)
+    assert first.locked_by == "worker-a"
+    # worker-a's visibility timeout runs out and worker-b picks the task up
+    second = claim("worker-b")
+    assert second.id == task.id and second.attempts == 2
+
+    assert not complete(first, {"from": "a"})
+    assert get_task(task.id).status == RUNNING
+    assert complete(second, {"from": "b"})
+    finished = get_task(task.id)
+    assert finished.status == DONE and json.loads(finished.result) == {"from": "b"}
+
+
+def test_fail_from_a_stale_claim_is_ignored():
+    task = enqueue("noop", {})
+    first = claim("worker-a", visibility_timeout=0.0001)
+    second = claim("worker-b")
+    assert not fail(first, "too late")
+    assert get_task(task.id).error is None
+    assert fail(second, "boom")
+    assert get_task(task.id).status == QUEUED
+
+
+def test_upload_task_runs_the_analysis(client, job_id):
+    response = client.post(
+        "/resumes/upload",
+        params={"background": True},
+        data={"job_id": job_id, "uploaded_by": "tests"},
+        files={"file": ("queued.txt", b"Skills\nPython, Django, SQL\n", "text/plain")},
+    )
+    assert response.status_code == 202, response.text
+    task_id = response.json()["task_id"]
+
+    assert run_one("tests")
+    status = client.get(f"/resumes/tasks/{task_id}").json()
+    assert status["status"] == DONE, status
+    assert status["result"]["resume_id"]
+    assert set(status["result"]["recommendations"][0]["matched_skills"]) >= {"python", "django", "sql"}
+
+
+def test_unknown_kind_is_retried_then_failed(monkeypatch):
+    monkeypatch.setattr(task_queue.settings, "TASK_RETRY_BACKOFF", 0)
+    task = enqueue("no-such-kind", {})
+    while run_one("tests"):
+        pass
+    failed = get_task(task.id)
+    assert failed.status == task_queue.FAILED and "No handler" in failed.error
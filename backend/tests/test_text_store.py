@@ -0,0 +1,39 @@
+# tests/test_text_store.py
+from sqlmodel import Session, func, select
+
+from app.db.session import engine
+from app.services import text_store
+from app.services.parse_cache import ParseCache, ParsedEntry, ParsedResume
+from app.services.text_store import TextBlob, get_text, put_text
+
+
+def test_put_text_stores_each_text_once(v1_app, monkeypatch):
+    compressed = []
+    codec = text_store.write_codec()
+    monkeypatch.setattr(text_store, "write_codec", lambda: codec._replace(
+        compress=lambda data: compressed.append(data) or codec.compress(data)))
+
+    with Session(engine) as session:
+        first = put_text(session, "same text " * 100)
+        session.commit()
+        second = put_text(session, "same text " * 100)
+        session.commit()
+        assert first == second
+        assert len(compressed) == 1  # the repeat is found before compressing
+        assert session.exec(select(func.count()).select_from(TextBlob).where(TextBlob.digest == first)).one() == 1
+        assert get_text(session, first) == "same text " * 100
+
+
+def test_parse_cache_persists_a_digest_not_the_text(v1_app):
+    writer = ParseCache(maxsize=4)
+    writer.put("abc:test", ParsedEntry("parsed resume text", ["python"], "fp"))
+
+    with Session(engine) as session:
+        row = session.get(ParsedResume, "abc:test")
+        assert get_text(session, row.text_digest) == "parsed resume text"
+
+    # A fresh process (empty LRU) reads it back through the blob table
+    reader = ParseCache(maxsize=4)
+    assert reader.get("abc:test") == ParsedEntry("parsed resume text", ["python"], "fp")
+    assert reader.get("missing:test") is None
+    assert reader.stats()["misses"] == 1
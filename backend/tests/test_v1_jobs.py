@@ -0,0 +1,24 @@
+# tests/test_v1_jobs.py
+
+
+def test_list_jobs(client):
+    response = client.get("/jobs/")
+    assert response.status_code == 200
+    jobs = response.json()
+    assert [job["title"] for job in jobs][:2] == ["Frontend Developer", "Backend Developer"]
+    backend = jobs[1]
+    assert backend["skills"] == ["python", "sql", "api", "django", "fastapi"]
+    # Seeded jobs have no requirements, demand or salary
+    assert backend["requirements"] == []
+    assert backend["demand"] is None and backend["avg_salary"] is None
+
+
+def test_filter_jobs_by_skill(client):
+    response = client.get("/jobs/", params={"skill": ["python", "sql"]})
+    assert response.status_code == 200
+    assert {job["title"] for job in response.json()} == {"Backend Developer", "Data Analyst"}
+
+
+def test_etag_revalidation(client):
+    etag = client.get("/jobs/").headers["etag"]
+    assert client.get("/jobs/", headers={"If-None-Match": etag}).status_code == 304
@@ -0,0 +1,92 @@
+# tests/test_v1_resumes.py
+import json
+
+from sqlmodel import Session, select
+
+from app.db.models import Resume
+from app.db.session import engine
+from app.services.candidates import ResumeSkill
+from app.services.text_store import get_text
+
+BACKEND_CV = b"Jane Doe\nSkills\nPython, SQL, FastAPI\nExperience\n- Built REST APIs in Python\n"
+ANALYST_CV = b"John Roe\nSkills\nExcel, Pandas\nEducation\nBSc Statistics\n"
+
+
+def _lines(response):
+    return [json.loads(line) for line in response.text.splitlines() if line]
+
+
+def test_upload_and_analyze(client, job_id):
+    response = client.post(
+        "/resumes/upload",
+        data={"job_id": job_id, "uploaded_by": "tests"},
+        files={"file": ("jane.txt", BACKEND_CV, "text/plain")},
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    recommendation = body["recommendations"][0]
+    assert set(recommendation["matched_skills"]) >= {"python", "sql", "fastapi"}
+    assert "django" in recommendation["missing_skills"]
+
+    with Session(engine) as session:
+        resume = session.get(Resume, body["resume_id"])
+        assert get_text(session, resume.text_digest) == BACKEND_CV.decode()
+
+
+def test_batch_upload_streams_one_line_per_file(client, job_id):
+    response = client.post(
+        "/resumes/batch",
+        data={"job_id": job_id, "uploaded_by": "tests"},
+        files=[
+            ("files", ("jane.txt", BACKEND_CV, "text/plain")),
+            ("files", ("john.txt", ANALYST_CV, "text/plain")),
+        ],
+    )
+    assert response.status_code == 200, response.text
+    lines = _lines(response)
+    assert [line["status"] for line in lines] == ["ok", "ok"], lines
+    assert {line["filename"] for line in lines} == {"jane.txt", "john.txt"}
+    assert all(line["resume_id"] for line in lines)
+
+
+def test_batch_upload_reports_bad_files_inline(client, job_id):
+    response = client.post(
+        "/resumes/batch",
+        data={"job_id": job_id},
+        files=[
+            ("files", ("jane.txt", BACKEND_CV, "text/plain")),
+            ("files", ("fake.pdf", b"not a pdf", "application/pdf")),
+        ],
+    )
+    assert response.status_code == 200
+    statuses = {line["filename"]: line["status"] for line in _lines(response)}
+    assert statuses == {"jane.txt": "ok", "fake.pdf": "error"}
+
+
+def test_batch_upload_unknown_job(client):
+    response = client.post(
+        "/resumes/batch",
+        data={"job_id": 999_999},
+        files=[("files", ("jane.txt", BACKEND_CV, "text/plain"))],
+    )
+    assert response.status_code == 404
+
+
+def test_analyze_resumes_ranks_each_file(client, tmp_path):
+    from bench.corpus import write_pdf
+
+    backend = write_pdf("Backend developer: Python, Django, FastAPI, SQL and REST API design.", tmp_path / "a.pdf")
+    frontend = write_pdf("Frontend developer: React, JavaScript, HTML and CSS.", tmp_path / "b.pdf")
+    files = [("files", (p.name, p.read_bytes(), "application/pdf")) for p in (backend, frontend)]
+    r = client.post("/resume/analyze_resumes/", files=files, params={"top_k": 3})
+    assert r.status_code == 200, r.text
+    results = r.json()["results"]
+    assert [item["filename"] for item in results] == ["a.pdf", "b.pdf"]
+    assert results[0]["results"][0]["job_title"] == "Backend Developer"
+    assert all(len(item["results"]) == 3 for item in results)
+
+    # Saved with their resume_skill rows, so /jobs/{id}/candidates can find them
+    with Session(engine) as session:
+        resume_id = session.exec(select(Resume.id).where(Resume.filename == "a.pdf").order_by(Resume.id.desc())).first()
+        skills = set(session.exec(select(ResumeSkill.skill).where(ResumeSkill.resume_id == resume_id)).all())
+    assert {"python", "django", "fastapi", "sql"} <= skills